@@ -1,6 +1,5 @@
-import hashlib
 from datetime import datetime
-from typing import List, TypeVar
+from typing import List, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -16,12 +15,13 @@ from avalanchepy.models.p_models import (
     IssueTxRequest,
     IssueTxResponse,
 )
+from avalanchepy.types.avax.lazy_utxo import UtxoLike, decode_lazy_utxos
 from avalanchepy.types.avax.signed_tx import SignedTx
-from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxo import decode_utxos
 from avalanchepy.types.codecs import PVM_CODEC
 from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.utils import pack_codec_direct
+from avalanchepy.types.seder import InternPool
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -30,18 +30,31 @@ class PClient(BaseClient):
     def __init__(self, url: str):
         super().__init__(url, RpcPath.P_CHAIN)
 
-    def get_utxos(self, request: GetUTXOsRequest) -> List[Utxo]:
-        Ox_OFFSET = 2
-        CODEC_OFFSET = 2
+    def get_utxos(
+        self, request: GetUTXOsRequest, lazy: bool = False, intern_pool: Optional[InternPool] = None
+    ) -> List[UtxoLike]:
+        """
+        Fetches the UTXOs of the requested addresses.
 
+        Args:
+            request (GetUTXOsRequest): The request.
+            lazy (bool): If True, returns `LazyUtxo` views that only decode their outputs on first access.
+            intern_pool (Optional[InternPool]): If set, the decoded values of its types are shared through it, e.g.
+                `address_id_pool()` kept across pages.
+
+        Returns:
+            List[UtxoLike]: The decoded UTXOs.
+        """
         # exported utxos also shall be imported.
         # To get exported but not yet imported utxos, uncomment below.
         # Tho those can't be used for staking
         # request.source_chain = "C"
         result = self._wrapped_call(GetUTXOsResponse, "platform.getUTXOs", request)
+        codec = PVM_CODEC if intern_pool is None else PVM_CODEC.with_intern_pool(intern_pool)
         try:
-            prepared_utxos: List[bytes] = [bytes.fromhex(el[Ox_OFFSET:])[CODEC_OFFSET:] for el in result.utxos]
-            return [Utxo.deserialize(data, PVM_CODEC)[0] for data in prepared_utxos]
+            if lazy:
+                return decode_lazy_utxos(result.utxos, codec)
+            return decode_utxos(result.utxos, codec)
         except DeserializationError as e:
             raise FormatError(e) from e
         except Exception as e:
@@ -55,11 +68,7 @@ class PClient(BaseClient):
             raise FormatError(e) from e
 
     def issue_tx(self, signed_transaction: SignedTx) -> str:
-        data = pack_codec_direct(PVM_CODEC, signed_transaction)
-        checksum = hashlib.sha256(data).digest()[-4:]
-        data += checksum
-
-        data_hex = "0x" + data.hex()
+        data_hex = signed_transaction.encoded(PVM_CODEC).hex
         response = self._wrapped_call(IssueTxResponse, "platform.issueTx", IssueTxRequest(tx=data_hex))
         return response.tx_id
 
@@ -1,7 +1,8 @@
-from typing import Annotated, List, Literal, Optional
+from typing import Annotated, Iterable, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
 
+from avalanchepy.types.primitives.address import Address, AddressCodec
 from avalanchepy.types.primitives.id import Id
 
 
@@ -17,6 +18,23 @@ class GetUTXOsRequest(BaseModel):
     source_chain: Optional[str] = Field(default=None, alias="sourceChain")
     encoding: Optional[str] = None
 
+    @staticmethod
+    def of(
+        addresses: Iterable[Address],
+        address_codec: AddressCodec,
+        limit: Optional[int] = None,
+        start_index: Optional[PaginationIndex] = None,
+    ) -> "GetUTXOsRequest":
+        """
+        Creates the request for the UTXOs of `addresses`, encoded at once with `address_codec`, e.g. the owners of a
+        wallet on `AddressCodec.of("P", "avax")`.
+        """
+        return GetUTXOsRequest(
+            addresses=address_codec.encode_many(addresses),
+            limit=limit,
+            startIndex=start_index,
+        )
+
 
 class GetUTXOsResponse(BaseModel):
     num_fetched: int = Field(alias="numFetched")
@@ -1,13 +1,22 @@
-from functools import cmp_to_key, reduce
-from typing import Dict, List, Tuple
+from functools import reduce
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
 
-from avalanchepy.transaction_builder.errors import FailedAction, InsufficientFundsError
+from avalanchepy.transaction_builder.coin_selection import select_utxos
+from avalanchepy.transaction_builder.errors import (
+    FailedAction,
+    InsufficientFundsError,
+    TxTooLargeError,
+)
 from avalanchepy.transaction_builder.types import (
+    DelegatorTxBatch,
+    DelegatorTxRequest,
     SpendOptions,
     UtxoCalculationFn,
     UtxoCalculationParams,
     UtxoCalculationResult,
     UtxoCalculationState,
+    UtxoSet,
+    as_utxo_set,
 )
 from avalanchepy.transaction_builder.use_consolidate_output import (
     use_consolidate_output,
@@ -16,55 +25,64 @@ from avalanchepy.transaction_builder.use_spendable_locked_utxo import (
     use_spendable_locked_utxo,
 )
 from avalanchepy.transaction_builder.use_unlocked_utxo import use_unlocked_utxo
+from avalanchepy.transaction_builder.utils import (
+    output_sort_key,
+    signed_tx_size,
+    sort_canonically,
+)
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
 from avalanchepy.types.avax.add_permissionless_delegator_tx import (
     AddPermissionlessDelegatorTx,
 )
 from avalanchepy.types.avax.base_tx import BaseTx
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
-from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
 from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.signed_tx import SignedTx
 from avalanchepy.types.avax.subnet_validator import SubnetValidator
 from avalanchepy.types.avax.utxo import Utxo
-from avalanchepy.types.codecs import AVM_CODEC, PVM_CODEC
+from avalanchepy.types.avax.utxoid import UtxoId
 from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.id import Id
 from avalanchepy.types.primitives.list_struct import ListStruct
-from avalanchepy.types.seder import Int
+from avalanchepy.types.seder import Int, Seder
+
+# the largest encoding the P-chain codec accepts, see codec.defaultMaxSize in avalanchego
+MAX_TX_SIZE = 256 * 1024
+
+ADD_PRIMARY_NETWORK_DELEGATOR_FEE = 10000
 
 
 class Context:
     avax_asset_id: Id
     network_id: Int
     p_blockchain_id: Id
+    add_primary_network_delegator_fee: int
+    tx_fee_per_byte: int
+    max_tx_size: int
 
-    def __init__(self, avax_asset_id: Id, network_id: Int, p_blockchain_id: Id):
+    def __init__(
+        self,
+        avax_asset_id: Id,
+        network_id: Int,
+        p_blockchain_id: Id,
+        add_primary_network_delegator_fee: int = ADD_PRIMARY_NETWORK_DELEGATOR_FEE,
+        tx_fee_per_byte: int = 0,
+        max_tx_size: int = MAX_TX_SIZE,
+    ):
         self.avax_asset_id = avax_asset_id
         self.network_id = network_id
         self.p_blockchain_id = p_blockchain_id
+        self.add_primary_network_delegator_fee = add_primary_network_delegator_fee
+        self.tx_fee_per_byte = tx_fee_per_byte
+        self.max_tx_size = max_tx_size
 
 
 def compare_transferable_outputs(output1: TransferableOutput, output2: TransferableOutput) -> int:
-    if output1.asset_id < output2.asset_id:
-        return -1
-    if output1.asset_id > output2.asset_id:
-        return 1
-
-    pvm_output_types = StakeableLockOut  # Tuple for type checking
-
-    codec1 = PVM_CODEC if isinstance(output1.output, pvm_output_types) else AVM_CODEC
-    codec2 = PVM_CODEC if isinstance(output2.output, pvm_output_types) else AVM_CODEC
-
-    # Use native comparison of serialized bytes
-    serialized_output1 = output1.serialize(codec1)
-    serialized_output2 = output2.serialize(codec2)
-
-    if serialized_output1 < serialized_output2:
-        return -1
-    if serialized_output1 > serialized_output2:
-        return 1
-
-    return 0
+    key1 = output_sort_key(output1)
+    key2 = output_sort_key(output2)
+    return (key1 > key2) - (key1 < key2)
 
 
 class TransactionBuilder:
@@ -77,12 +95,26 @@ class TransactionBuilder:
     # https://github.com/ava-labs/avalanchego/blob/51d2ee6a55ac9c910198a0c9a8568ef26af67baa/wallet/chain/p/builder/builder.go#L1562
     @staticmethod
     def spend(
-        utxos: List[Utxo],
+        utxos: Union[UtxoSet, Iterable[UtxoLike]],
         from_addresses: List[Address],
         amounts_to_burn: Dict[Id, int],
         amounts_to_stake: Dict[Id, int],
         options: SpendOptions,
     ) -> UtxoCalculationResult:
+        if options.coin_selection is not None:
+            pool = utxos if isinstance(utxos, UtxoPool) else UtxoPool(utxos)
+            utxos = select_utxos(
+                pool,
+                options.coin_selection,
+                from_addresses,
+                amounts_to_burn,
+                amounts_to_stake,
+                options.min_issuance_time,
+            )
+        else:
+            # any other iterable is consumed lazily, only up to the last UTXO spent
+            utxos = as_utxo_set(utxos)
+
         # read-only state
         params = UtxoCalculationParams(utxos=utxos, from_addresses=from_addresses, options=options)
         # evolving state
@@ -109,9 +141,7 @@ class TransactionBuilder:
         def post_processing(
             _: UtxoCalculationParams, state: UtxoCalculationState, current_results: UtxoCalculationResult
         ) -> Tuple[UtxoCalculationState, UtxoCalculationResult]:
-            current_results.inputs.sort(key=lambda tx_input: tx_input.utxo_id)
-            current_results.stake_outputs.sort(key=cmp_to_key(compare_transferable_outputs))
-            current_results.change_outputs.sort(key=cmp_to_key(compare_transferable_outputs))
+            sort_canonically(current_results.inputs, current_results.stake_outputs, current_results.change_outputs)
             return state, current_results
 
         # calculators
@@ -131,18 +161,115 @@ class TransactionBuilder:
     def build_add_permissionless_delegator_tx(
         self,
         delegator: Address,
-        utxos: List[Utxo],
+        utxos: Union[UtxoSet, Iterable[UtxoLike]],
         subnet_validator: SubnetValidator,
         rewards_owner: Secp256k1OutputOwners,
         options: SpendOptions,
     ) -> AddPermissionlessDelegatorTx:
-        # TODO: constant?
-        to_burn = {
-            self.context.avax_asset_id: 10000,
-        }
-        to_stake = {self.context.avax_asset_id: subnet_validator.validator.weight.value}
+        # the spend is retried with higher fees, each retry walks the UTXOs already pulled again, or the pool the coin
+        # selection needs, indexed once here rather than by every spend
+        if options.coin_selection is not None and not isinstance(utxos, UtxoPool):
+            utxos = UtxoPool(utxos, from_addresses=[delegator])
+        else:
+            utxos = as_utxo_set(utxos)
+        base_fee = self.context.add_primary_network_delegator_fee
+        fee = base_fee
+        while True:
+            to_burn = {self.context.avax_asset_id: fee}
+            to_stake = {self.context.avax_asset_id: subnet_validator.validator.weight.value}
+
+            result = TransactionBuilder.spend(utxos, [delegator], to_burn, to_stake, options)
+            tx = self._add_permissionless_delegator_tx(result, subnet_validator, rewards_owner, options)
+
+            # a higher fee can take more inputs, so the size is checked again until the burned fee covers it
+            size = self.check_tx_size(tx, result.inputs)
+            required_fee = self.tx_fee(base_fee, size)
+            if required_fee <= fee:
+                return tx
+            fee = required_fee
+
+    def build_many_add_permissionless_delegator_txs(
+        self,
+        delegator: Address,
+        requests: Sequence[DelegatorTxRequest],
+        utxos: Union[UtxoSet, Iterable[UtxoLike]],
+        options: SpendOptions,
+        sign: Callable[[AddPermissionlessDelegatorTx], SignedTx],
+    ) -> DelegatorTxBatch:
+        """
+        Builds and signs a delegation tx per request, in order, from a single UTXO set.
 
-        result = TransactionBuilder.spend(utxos, [delegator], to_burn, to_stake, options)
+        The set is indexed once into a UtxoPool. The inputs of every tx are removed from it, so no two txs spend the
+        same UTXO, and the change of every tx is added to it, so later txs can spend it. The id of a P-chain tx is the
+        hash of its signed bytes, so each tx is signed before the next one is built.
+
+        A UtxoPool passed as `utxos` is updated only once every tx is built, a failing batch leaves it as it was.
+
+        Args:
+            delegator (Address): The address delegating and spending, the owner of the change.
+            requests (Sequence[DelegatorTxRequest]): The delegations.
+            utxos (Union[UtxoSet, Iterable[UtxoLike]]): The UTXOs of the delegator, a UtxoPool is updated in place.
+            options (SpendOptions): The spend options of every tx.
+            sign (Callable[[AddPermissionlessDelegatorTx], SignedTx]): Signs a tx, e.g. with the key of `delegator`.
+
+        Returns:
+            DelegatorTxBatch: The signed txs and the UTXOs they consume and produce.
+
+        Raises:
+            InsufficientFundsError: If the UTXOs left can't pay for a delegation, the txs built before it are dropped.
+        """
+        # built against a copy, so a failing request leaves the UtxoPool of the caller untouched
+        pool = utxos.copy() if isinstance(utxos, UtxoPool) else UtxoPool(utxos, from_addresses=[delegator])
+        batch = DelegatorTxBatch([], [], [])
+        for request in requests:
+            tx = self.build_add_permissionless_delegator_tx(
+                delegator, pool, request.subnet_validator, request.rewards_owner, options
+            )
+            signed_tx = sign(tx)
+            tx_id = signed_tx.id()
+            produced = [
+                Utxo(utxo_id=UtxoId(id=tx_id, output_idx=Int(value=i)), asset_id=output.asset_id, output=output.output)
+                for (i, output) in enumerate(tx.base_tx.outputs.list)
+            ]
+
+            batch.signed_txs.append(signed_tx)
+            batch.consumed.append(pool.remove(input.utxo_id for input in tx.base_tx.inputs.list))
+            batch.produced.append(produced)
+            pool.add(produced)
+
+        if isinstance(utxos, UtxoPool):
+            for consumed, produced in zip(batch.consumed, batch.produced):
+                utxos.remove(utxo.utxo_id for utxo in consumed)
+                utxos.add(produced)
+
+        return batch
+
+    def check_tx_size(self, tx: Seder, inputs: List[TransferableInput]) -> int:
+        """
+        Returns the size of the transaction once signed, without encoding or signing it.
+
+        Raises:
+            TxTooLargeError: If the signed transaction would exceed `max_tx_size` of the context.
+        """
+        size = signed_tx_size(tx, inputs)
+        if size > self.context.max_tx_size:
+            raise TxTooLargeError(size, self.context.max_tx_size)
+
+        return size
+
+    def tx_fee(self, base_fee: int, size: int) -> int:
+        """
+        Returns the fee of a transaction of `size` signed bytes: the base fee plus the per-byte fee of the context.
+        """
+        return base_fee + self.context.tx_fee_per_byte * size
+
+    def _add_permissionless_delegator_tx(
+        self,
+        result: UtxoCalculationResult,
+        subnet_validator: SubnetValidator,
+        rewards_owner: Secp256k1OutputOwners,
+        options: SpendOptions,
+    ) -> AddPermissionlessDelegatorTx:
         return AddPermissionlessDelegatorTx(
             base_tx=BaseTx(
                 network_id=self.context.network_id,
@@ -0,0 +1,202 @@
+from typing import Callable, Collection, Dict, List, Optional
+
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+
+# the default search budget of `BranchAndBound`
+BRANCH_AND_BOUND_TRIES = 100_000
+
+
+def take_until_covered(order: List[int], amounts: List[int], target: int) -> List[int]:
+    """
+    Returns the shortest prefix of `order` whose amounts cover `target`, all of it if none does.
+    """
+    total = 0
+    for count, i in enumerate(order, start=1):
+        total += amounts[i]
+        if total >= target:
+            return order[:count]
+
+    return order
+
+
+class CoinSelection:
+    """
+    Chooses the UTXOs of an asset to spend, and their order, for `TransactionBuilder.spend`.
+
+    Set as `SpendOptions.coin_selection`, it runs before the calculators: once per asset to stake for the still locked
+    UTXOs, which can only be staked, then once per asset for the other UTXOs and what remains to burn and stake. The
+    calculators then spend the chosen UTXOs in the chosen order, and no others.
+    """
+
+    def select(self, utxos: List[UtxoLike], amounts: List[int], target: int) -> List[int]:
+        """
+        Returns the positions in `utxos` of the UTXOs to spend, in spend order.
+
+        Args:
+            utxos (List[UtxoLike]): The candidate UTXOs of an asset, in set order.
+            amounts (List[int]): The amount of each candidate.
+            target (int): The amount to cover, greater than 0.
+
+        Returns:
+            List[int]: Positions of UTXOs covering `target`, or of all of them if they can't.
+        """
+        raise NotImplementedError("CoinSelection.select() is not implemented")
+
+
+class LargestFirst(CoinSelection):
+    """
+    Spends the largest UTXOs first, for the fewest inputs.
+    """
+
+    def select(self, utxos: List[UtxoLike], amounts: List[int], target: int) -> List[int]:
+        order = sorted(range(len(amounts)), key=amounts.__getitem__, reverse=True)
+        return take_until_covered(order, amounts, target)
+
+
+class SmallestSufficient(CoinSelection):
+    """
+    Spends the smallest UTXO covering the target on its own, the largest first if there is none. Keeps the large
+    UTXOs for large spends.
+    """
+
+    def select(self, utxos: List[UtxoLike], amounts: List[int], target: int) -> List[int]:
+        sufficient = [i for (i, amount) in enumerate(amounts) if amount >= target]
+        if sufficient:
+            return [min(sufficient, key=amounts.__getitem__)]
+
+        return LargestFirst().select(utxos, amounts, target)
+
+
+class BranchAndBound(CoinSelection):
+    """
+    Searches for UTXOs adding up to exactly the target, so the tx needs no change output, and falls back to another
+    strategy if there are none.
+
+    The search is a depth-first walk over the UTXOs from the largest, including each one before excluding it, and
+    prunes the branches that exceed the target or can't reach it anymore. It gives up after `max_tries` steps.
+
+    Attributes:
+        max_tries (int): The maximum number of search steps.
+        fallback (CoinSelection): The strategy used when no exact match is found.
+    """
+
+    max_tries: int
+    fallback: CoinSelection
+
+    def __init__(self, max_tries: int = BRANCH_AND_BOUND_TRIES, fallback: CoinSelection = LargestFirst()):
+        self.max_tries = max_tries
+        self.fallback = fallback
+
+    def select(self, utxos: List[UtxoLike], amounts: List[int], target: int) -> List[int]:
+        match = self.exact_match(amounts, target)
+        if match is not None:
+            return match
+
+        return self.fallback.select(utxos, amounts, target)
+
+    def exact_match(self, amounts: List[int], target: int) -> Optional[List[int]]:
+        """
+        Returns the positions of amounts adding up to exactly `target`, None if none were found within `max_tries`.
+        """
+        order = sorted(range(len(amounts)), key=amounts.__getitem__, reverse=True)
+        values = [amounts[i] for i in order]
+        # remaining[i] is the sum of the values from i on
+        remaining = [0] * (len(values) + 1)
+        for i in range(len(values) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + values[i]
+
+        # the positions in `values` of the included amounts
+        included: List[int] = []
+        total = 0
+        i = 0
+        for _ in range(self.max_tries):
+            if total == target:
+                return [order[j] for j in included]
+
+            if total > target or total + remaining[i] < target:
+                if not included:
+                    return None
+
+                # excludes the last included value, skipping the equal ones whose branches are the same
+                j = included.pop()
+                total -= values[j]
+                i = j + 1
+                while i < len(values) and values[i] == values[j]:
+                    i += 1
+                continue
+
+            included.append(i)
+            total += values[i]
+            i += 1
+
+        return None
+
+
+class OldestFirst(CoinSelection):
+    """
+    Spends the oldest UTXOs first, e.g. to consolidate dust. UTXOs don't record when they were created, so the age
+    comes from the caller, e.g. the height or the timestamp of the block that accepted the creating tx.
+
+    Attributes:
+        age (Callable[[UtxoLike], int]): Returns when a UTXO was created, lower is older.
+    """
+
+    age: Callable[[UtxoLike], int]
+
+    def __init__(self, age: Callable[[UtxoLike], int]):
+        self.age = age
+
+    def select(self, utxos: List[UtxoLike], amounts: List[int], target: int) -> List[int]:
+        ages = [self.age(utxo) for utxo in utxos]
+        order = sorted(range(len(utxos)), key=ages.__getitem__)
+        return take_until_covered(order, amounts, target)
+
+
+def select_utxos(
+    pool: UtxoPool,
+    coin_selection: CoinSelection,
+    from_addresses: Collection[Address],
+    amounts_to_burn: Dict[Id, int],
+    amounts_to_stake: Dict[Id, int],
+    min_issuance_time: int,
+) -> List[UtxoLike]:
+    """
+    Returns the UTXOs `coin_selection` chooses to burn and stake the amounts: the still locked UTXOs chosen for
+    staking, then the others chosen for what remains, each in the chosen order.
+    """
+    selected: List[UtxoLike] = []
+    staked: Dict[Id, int] = {}
+    for asset_id, target in amounts_to_stake.items():
+        chosen = _select(pool, coin_selection, asset_id, from_addresses, min_issuance_time, target, locked=True)
+        staked[asset_id] = min(target, sum(pool.amounts[row] for row in chosen))
+        selected += [pool.utxos[row] for row in chosen]
+
+    targets = {asset_id: amount - staked.get(asset_id, 0) for (asset_id, amount) in amounts_to_stake.items()}
+    for asset_id, amount in amounts_to_burn.items():
+        targets[asset_id] = targets.get(asset_id, 0) + amount
+
+    for asset_id, target in targets.items():
+        chosen = _select(pool, coin_selection, asset_id, from_addresses, min_issuance_time, target, locked=False)
+        selected += [pool.utxos[row] for row in chosen]
+
+    return selected
+
+
+def _select(
+    pool: UtxoPool,
+    coin_selection: CoinSelection,
+    asset_id: Id,
+    from_addresses: Collection[Address],
+    min_issuance_time: int,
+    target: int,
+    locked: bool,
+) -> List[int]:
+    if target <= 0:
+        return []
+
+    rows = list(pool.candidates(asset_id, from_addresses, min_issuance_time, locked))
+    chosen = coin_selection.select([pool.utxos[row] for row in rows], [pool.amounts[row] for row in rows], target)
+    return [rows[i] for i in chosen]
@@ -32,3 +32,24 @@ class InsufficientFundsError(Exception):
     def __str__(self):
         """Return a string representation of the error."""
         return self.message
+
+
+class TxTooLargeError(Exception):
+    """A custom exception to represent transactions exceeding the size limit."""
+
+    def __init__(self, size: int, max_size: int):
+        """
+        Initialize the TxTooLargeError.
+
+        Args:
+            size (int): The size of the signed transaction in bytes.
+            max_size (int): The largest size accepted.
+        """
+        self.size = size
+        self.max_size = max_size
+        self.message = f"Transaction too large: {self.size} bytes signed, the limit is {self.max_size} bytes."
+        super().__init__(self.message)
+
+    def __str__(self):
+        """Return a string representation of the error."""
+        return self.message
@@ -1,14 +1,35 @@
 from datetime import datetime, timezone
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from avalanchepy.transaction_builder.coin_selection import CoinSelection
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.transaction_builder.utxo_stream import UtxoStream
+from avalanchepy.transaction_builder.utxo_table import UtxoTable
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.signed_tx import SignedTx
+from avalanchepy.types.avax.subnet_validator import SubnetValidator
 from avalanchepy.types.avax.utxo import Utxo
 from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.byte import Byte
 from avalanchepy.types.primitives.id import Id
 from avalanchepy.types.primitives.list_struct import ListStruct
 
+# the UTXO sets the spend calculators accept
+UtxoSet = Union[List[UtxoLike], UtxoTable, UtxoPool, UtxoStream]
+
+
+def as_utxo_set(utxos: Union[UtxoSet, Iterable[UtxoLike]]) -> UtxoSet:
+    """
+    Returns `utxos` if the calculators accept it as is, otherwise a UtxoStream over it, e.g. over a generator.
+    """
+    if isinstance(utxos, (list, UtxoTable, UtxoPool, UtxoStream)):
+        return utxos
+
+    return UtxoStream(utxos)
+
 
 class SpendOptions:
     min_issuance_time: int
@@ -16,6 +37,8 @@ class SpendOptions:
     threshold: int
     memo: ListStruct[Byte]
     locktime: int
+    # chooses the UTXOs to spend, if None they are spent in the order they are given in
+    coin_selection: Optional[CoinSelection]
 
     def __init__(
         self,
@@ -24,12 +47,14 @@ class SpendOptions:
         threshold: int,
         memo: ListStruct[Byte],
         locktime: int,
+        coin_selection: Optional[CoinSelection] = None,
     ):
         self.min_issuance_time = min_issuance_time
         self.change_addresses = change_addresses
         self.threshold = threshold
         self.memo = memo
         self.locktime = locktime
+        self.coin_selection = coin_selection
 
     @staticmethod
     def default(adresses: List[Address]) -> "SpendOptions":
@@ -43,11 +68,11 @@ class SpendOptions:
 
 
 class UtxoCalculationParams:
-    utxos: List[Utxo]
+    utxos: UtxoSet
     from_addresses: List[Address]
     options: SpendOptions
 
-    def __init__(self, utxos: List[Utxo], from_addresses: List[Address], options: SpendOptions):
+    def __init__(self, utxos: UtxoSet, from_addresses: List[Address], options: SpendOptions):
         self.utxos = utxos
         self.from_addresses = from_addresses
         self.options = options
@@ -77,6 +102,15 @@ class UtxoCalculationState:
         self.amounts_to_burn = amounts_to_burn
         self.amounts_to_stake = amounts_to_stake
 
+    def all_staked(self) -> bool:
+        return not any(self.amounts_to_stake.values())
+
+    def all_spent(self) -> bool:
+        """
+        True once every amount to burn and to stake is covered, the calculators then stop consuming UTXOs.
+        """
+        return not any(self.amounts_to_burn.values()) and not any(self.amounts_to_stake.values())
+
     # returns excess
     def consume_locked_asset(self, asset_id: Id, amount: int) -> int:
         to_stake = min(self.amounts_to_stake.get(asset_id, 0), amount)
@@ -89,3 +123,47 @@ UtxoCalculationFn = Callable[
     [UtxoCalculationParams, UtxoCalculationState, UtxoCalculationResult],
     Tuple[UtxoCalculationState, UtxoCalculationResult],
 ]
+
+
+class DelegatorTxRequest:
+    """
+    One delegation of a batch, see `TransactionBuilder.build_many_add_permissionless_delegator_txs`.
+
+    Attributes:
+        subnet_validator (SubnetValidator): The validator to delegate to, with the stake as its weight.
+        rewards_owner (Secp256k1OutputOwners): The owners of the delegation rewards.
+    """
+
+    subnet_validator: SubnetValidator
+    rewards_owner: Secp256k1OutputOwners
+
+    def __init__(self, subnet_validator: SubnetValidator, rewards_owner: Secp256k1OutputOwners):
+        self.subnet_validator = subnet_validator
+        self.rewards_owner = rewards_owner
+
+
+class DelegatorTxBatch:
+    """
+    The signed txs of a batch of delegations and the UTXOs each one consumes and produces, in request order.
+
+    Attributes:
+        signed_txs (List[SignedTx]): The signed `AddPermissionlessDelegatorTx` of every request.
+        consumed (List[List[UtxoLike]]): The UTXOs the inputs of each tx spend, some of them produced by earlier txs.
+        produced (List[List[Utxo]]): The change UTXOs each tx creates, whether later txs spend them or not.
+    """
+
+    signed_txs: List[SignedTx]
+    consumed: List[List[UtxoLike]]
+    produced: List[List[Utxo]]
+
+    def __init__(self, signed_txs: List[SignedTx], consumed: List[List[UtxoLike]], produced: List[List[Utxo]]):
+        self.signed_txs = signed_txs
+        self.consumed = consumed
+        self.produced = produced
+
+    def unspent(self) -> List[Utxo]:
+        """
+        Returns the change UTXOs no tx of the batch spends, those left to the wallet once the batch is accepted.
+        """
+        spent = {id(utxo) for utxos in self.consumed for utxo in utxos}
+        return [utxo for utxos in self.produced for utxo in utxos if id(utxo) not in spent]
@@ -1,4 +1,4 @@
-from typing import Callable, List, Tuple, TypeVar
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
 
 from avalanchepy.transaction_builder.types import (
     UtxoCalculationParams,
@@ -9,7 +9,11 @@ from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
-from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.outputs.transferable_output import (
+    FrozenTransferableOutput,
+    TransferableOutput,
+)
+from avalanchepy.types.primitives.long import Long
 
 
 def can_combine(a: TransferableOutput, b: TransferableOutput) -> bool:
@@ -27,7 +31,7 @@ def can_combine(a: TransferableOutput, b: TransferableOutput) -> bool:
 
 def combine(a: TransferableOutput, b: TransferableOutput) -> TransferableOutput:
     if isinstance(a.output, StakeableLockOut) and isinstance(b.output, StakeableLockOut):
-        return TransferableOutput(
+        return FrozenTransferableOutput(
             asset_id=a.asset_id,
             output=StakeableLockOut(
                 locktime=a.output.locktime,
@@ -39,7 +43,7 @@ def combine(a: TransferableOutput, b: TransferableOutput) -> TransferableOutput:
         )
 
     if isinstance(a.output, Secp256k1TransferOutput) and isinstance(b.output, Secp256k1TransferOutput):
-        return TransferableOutput(
+        return FrozenTransferableOutput(
             asset_id=a.asset_id,
             output=Secp256k1TransferOutput(
                 amount=a.output.amount + b.output.amount,
@@ -81,11 +85,84 @@ def consolidate(arr: List[T], can_combine_fn: CanCombineFn, combine_fn: CombineF
     return consolidated
 
 
+def combine_key(output: TransferableOutput) -> Optional[Hashable]:
+    """
+    Returns the key outputs combine by: outputs with equal keys are those `can_combine` accepts, None if the output
+    can't be combined at all.
+    """
+    output_owners = output.output_owners()
+    owners = (
+        output_owners.locktime.value,
+        output_owners.threshold.value,
+        tuple(address.value for address in output_owners.addresses.list),
+    )
+
+    if isinstance(output.output, StakeableLockOut):
+        return (output.asset_id.value, StakeableLockOut, output.output.locktime.value, owners)
+    if isinstance(output.output, Secp256k1TransferOutput):
+        return (output.asset_id.value, Secp256k1TransferOutput, owners)
+
+    return None
+
+
+def combine_all(outputs: List[TransferableOutput]) -> TransferableOutput:
+    """
+    Combines outputs with the same `combine_key` into a single output, the first one if there is only one.
+    """
+    first = outputs[0]
+    if len(outputs) == 1:
+        return first
+
+    amount = Long(value=sum(output.amount().value for output in outputs))
+    if isinstance(first.output, StakeableLockOut):
+        return FrozenTransferableOutput(
+            asset_id=first.asset_id,
+            output=StakeableLockOut(
+                locktime=first.output.locktime,
+                transferable_output=Secp256k1TransferOutput(amount=amount, output_owners=first.output_owners()),
+            ),
+        )
+
+    return FrozenTransferableOutput(
+        asset_id=first.asset_id,
+        output=Secp256k1TransferOutput(amount=amount, output_owners=first.output.output_owners),
+    )
+
+
+def consolidate_outputs(outputs: List[TransferableOutput]) -> List[TransferableOutput]:
+    """
+    Consolidates outputs like `consolidate(outputs, can_combine, combine)`, in a single pass.
+
+    Outputs are grouped by `combine_key` and every group is combined at once, so each output is hashed once instead
+    of compared with every consolidated output, and only one output is created per group of several outputs.
+
+    Args:
+        outputs (List[TransferableOutput]): The outputs to consolidate.
+
+    Returns:
+        List[TransferableOutput]: The consolidated outputs, in the order of the first output of each group.
+    """
+    groups: Dict[Hashable, List[TransferableOutput]] = {}
+    ordered_groups: List[List[TransferableOutput]] = []
+    for output in outputs:
+        key = combine_key(output)
+        group = groups.get(key) if key is not None else None
+        if group is None:
+            group = [output]
+            ordered_groups.append(group)
+            if key is not None:
+                groups[key] = group
+        else:
+            group.append(output)
+
+    return [combine_all(group) for group in ordered_groups]
+
+
 def use_consolidate_output(
     _: UtxoCalculationParams, state: UtxoCalculationState, current_results: UtxoCalculationResult
 ) -> Tuple[UtxoCalculationState, UtxoCalculationResult]:
-    consolidated_change_outputs = consolidate(current_results.change_outputs, can_combine, combine)
-    consolidated_stake_outputs = consolidate(current_results.stake_outputs, can_combine, combine)
+    consolidated_change_outputs = consolidate_outputs(current_results.change_outputs)
+    consolidated_stake_outputs = consolidate_outputs(current_results.stake_outputs)
 
     return state, UtxoCalculationResult(
         inputs=current_results.inputs,
@@ -6,16 +6,19 @@ from avalanchepy.transaction_builder.types import (
     UtxoCalculationState,
 )
 from avalanchepy.transaction_builder.utils import try_cast_output_type
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.transaction_builder.utxo_stream import until_satisfied
+from avalanchepy.transaction_builder.utxo_table import UtxoTable
 from avalanchepy.types.avax.inputs.secp256k1_transfer_input import (
     Secp256k1TransferInput,
 )
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
-from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
-from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.outputs.transferable_output import FrozenTransferableOutput
 from avalanchepy.types.primitives.list_struct import ListStruct
 from avalanchepy.types.primitives.long import Long
 from avalanchepy.types.seder import Int
@@ -26,35 +29,43 @@ def use_spendable_locked_utxo(
     params: UtxoCalculationParams, state: UtxoCalculationState, current_results: UtxoCalculationResult
 ) -> Tuple[UtxoCalculationState, UtxoCalculationResult]:
     class UsableUtxo:
-        utxo: Utxo
+        utxo: UtxoLike
         locked_output: StakeableLockOut
 
-        def __init__(self, utxo: Utxo, locked_output: StakeableLockOut):
+        def __init__(self, utxo: UtxoLike, locked_output: StakeableLockOut):
             self.utxo = utxo
             self.locked_output = locked_output
 
-    def filter_map_utxos(utxo: Utxo) -> Optional[UsableUtxo]:
-        stakeable_output = try_cast_output_type(utxo.output, StakeableLockOut)
-        if stakeable_output is None:
+    def filter_map_utxos(utxo: UtxoLike) -> Optional[UsableUtxo]:
+        # checked before touching the output, so lazily decoded UTXOs that can't be used are never decoded, and
+        # against the current state, as the UTXOs are mapped one at a time while they are consumed
+        if utxo.asset_id not in state.amounts_to_stake or state.amounts_to_stake[utxo.asset_id] == 0:
             return None
-        if params.options.min_issuance_time >= stakeable_output.locktime.value:
+        if not issubclass(utxo.output_type(), StakeableLockOut):
             return None
-        if utxo.asset_id not in state.amounts_to_stake or state.amounts_to_stake[utxo.asset_id] == 0:
+
+        stakeable_output = try_cast_output_type(utxo.output, StakeableLockOut)
+        if params.options.min_issuance_time >= stakeable_output.locktime.value:
             return None
 
         return UsableUtxo(utxo=utxo, locked_output=stakeable_output)
 
-    stakeable_utxos = [utxo for utxo in map(filter_map_utxos, params.utxos) if utxo is not None]
+    # built once rather than by every match_owners call
+    from_addresses = set(params.from_addresses)
+    utxos = params.utxos
+    if isinstance(utxos, (UtxoTable, UtxoPool)):
+        utxos = utxos.select_spendable_locked(
+            state.amounts_to_stake, params.from_addresses, params.options.min_issuance_time
+        )
+
+    # a lazy stage, the UTXOs stop being pulled once every amount is staked
+    stakeable_utxos = filter(None, map(filter_map_utxos, until_satisfied(utxos, state.all_staked)))
     for stakeable_utxo in stakeable_utxos:
         stakeable_output = stakeable_utxo.locked_output
         transferable_output = stakeable_output.transferable_output
-
-        # skip if necessary amount has been staked
         asset_id = stakeable_utxo.utxo.asset_id
-        if state.amounts_to_stake[asset_id] == 0:
-            continue
 
-        sigs = transferable_output.match_owners(params.from_addresses, params.options.min_issuance_time)
+        sigs = transferable_output.match_owners(from_addresses, params.options.min_issuance_time)
         if sigs is None:
             continue
 
@@ -73,7 +84,7 @@ def use_spendable_locked_utxo(
         # excess is basically a change that we return
         excess = state.consume_locked_asset(stakeable_utxo.utxo.asset_id, transferable_output.amount.value)
         current_results.stake_outputs.append(
-            TransferableOutput(
+            FrozenTransferableOutput(
                 asset_id=asset_id,
                 output=StakeableLockOut(
                     locktime=stakeable_output.locktime,
@@ -91,7 +102,7 @@ def use_spendable_locked_utxo(
 
         # returns change if amount was larger than toStake. (excess)
         current_results.change_outputs.append(
-            TransferableOutput(
+            FrozenTransferableOutput(
                 asset_id=asset_id,
                 output=StakeableLockOut(
                     locktime=stakeable_output.locktime,
@@ -6,17 +6,20 @@ from avalanchepy.transaction_builder.types import (
     UtxoCalculationState,
 )
 from avalanchepy.transaction_builder.utils import try_cast_output_type
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.transaction_builder.utxo_stream import until_satisfied
+from avalanchepy.transaction_builder.utxo_table import UtxoTable
 from avalanchepy.types.avax.inputs.secp256k1_transfer_input import (
     Secp256k1TransferInput,
 )
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
-from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
-from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.outputs.transferable_output import FrozenTransferableOutput
 from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.list_struct import ListStruct
 from avalanchepy.types.primitives.long import Long
@@ -28,14 +31,21 @@ def use_unlocked_utxo(
     params: UtxoCalculationParams, state: UtxoCalculationState, current_result: UtxoCalculationResult
 ) -> Tuple[UtxoCalculationState, UtxoCalculationResult]:
     class UsableUtxo:
-        utxo: Utxo
+        utxo: UtxoLike
         transferable_output: Secp256k1TransferOutput
 
-        def __init__(self, utxo: Utxo, transferable_output: Secp256k1TransferOutput):
+        def __init__(self, utxo: UtxoLike, transferable_output: Secp256k1TransferOutput):
             self.utxo = utxo
             self.transferable_output = transferable_output
 
-    def filter_map_utxos(utxo: Utxo) -> Optional[UsableUtxo]:
+    def filter_map_utxos(utxo: UtxoLike) -> Optional[UsableUtxo]:
+        # checked before touching the output, so lazily decoded UTXOs that can't be used are never decoded, and
+        # against the current state, as the UTXOs are mapped one at a time while they are consumed
+        if state.amounts_to_burn.get(utxo.asset_id, 0) == 0 and state.amounts_to_stake.get(utxo.asset_id, 0) == 0:
+            return None
+        if not issubclass(utxo.output_type(), (Secp256k1TransferOutput, StakeableLockOut)):
+            return None
+
         transferable_output = try_cast_output_type(utxo.output, Secp256k1TransferOutput)
         if transferable_output is not None:
             return UsableUtxo(utxo, transferable_output)
@@ -44,7 +54,7 @@ def use_unlocked_utxo(
         if output is None:
             return None
 
-        if params.options.minIssuanceTime < output.locktime.value:
+        if params.options.min_issuance_time < output.locktime.value:
             return None
 
         transferable_output = output.transferable_output
@@ -54,18 +64,23 @@ def use_unlocked_utxo(
         locktime=Long(value=0), threshold=Int(value=1), addresses=ListStruct[Address](list=[params.from_addresses[0]])
     )
 
-    usable_utxos = [utxo for utxo in map(filter_map_utxos, params.utxos) if utxo is not None]
+    # built once rather than by every match_owners call
+    from_addresses = set(params.from_addresses)
+    utxos = params.utxos
+    if isinstance(utxos, (UtxoTable, UtxoPool)):
+        utxos = utxos.select_unlocked(
+            state.amounts_to_burn, state.amounts_to_stake, params.from_addresses, params.options.min_issuance_time
+        )
+
+    # a lazy stage, the UTXOs stop being pulled once every amount is burned and staked
+    usable_utxos = filter(None, map(filter_map_utxos, until_satisfied(utxos, state.all_spent)))
     for usable_utxo in usable_utxos:
         utxo = usable_utxo.utxo
         transferable_output = usable_utxo.transferable_output
         asset_id = utxo.asset_id
-
         remaining_amount_to_burn = state.amounts_to_burn.get(asset_id, 0)
-        remaining_amount_to_stake = state.amounts_to_stake.get(asset_id, 0)
-        if remaining_amount_to_stake == 0 and remaining_amount_to_burn == 0:
-            continue
 
-        sigs = transferable_output.match_owners(params.from_addresses, params.options.min_issuance_time)
+        sigs = transferable_output.match_owners(from_addresses, params.options.min_issuance_time)
         if sigs is None:
             continue
 
@@ -92,7 +107,7 @@ def use_unlocked_utxo(
         amount_to_stake = Long(value=available_amount_to_stake) - Long(value=excess)
         if amount_to_stake.value > 0:
             current_result.stake_outputs.append(
-                TransferableOutput(
+                FrozenTransferableOutput(
                     asset_id=asset_id,
                     output=Secp256k1TransferOutput(
                         amount=amount_to_stake,
@@ -103,7 +118,7 @@ def use_unlocked_utxo(
 
         if excess > 0:
             current_result.change_outputs.append(
-                TransferableOutput(
+                FrozenTransferableOutput(
                     asset_id=asset_id,
                     output=Secp256k1TransferOutput(
                         amount=Long(value=excess),
@@ -1,10 +1,16 @@
-from typing import Optional, Type, TypeVar, Union
+from typing import List, Optional, Tuple, Type, TypeVar, Union
 
+from avalanchepy.types.avax.inputs.secp256k1_signature import SECP256K1_SIGNATURE_LEN
+from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.codecs import AVM_CODEC, PVM_CODEC
+from avalanchepy.types.primitives.short import SHORT_LEN
+from avalanchepy.types.seder import INT_LEN, Codec, Seder
 
 T = TypeVar("T")
 
@@ -13,3 +19,42 @@ def try_cast_output_type(
     value: Union[Secp256k1OutputOwners, Secp256k1TransferOutput, StakeableLockOut], sample: Type[T]
 ) -> Optional[T]:
     return value if isinstance(value, sample) else None
+
+
+def output_sort_key(output: TransferableOutput) -> Tuple[bytes, bytes]:
+    """
+    The canonical order key of an output: its asset id, then its encoding.
+
+    Stakeable outputs only exist on the P-chain, so they are encoded with the PVM codec, others with the AVM codec.
+    """
+    codec = PVM_CODEC if isinstance(output.output, StakeableLockOut) else AVM_CODEC
+    return (output.asset_id.value, output.serialize(codec))
+
+
+def input_sort_key(input: TransferableInput) -> Tuple[bytes, int]:
+    """
+    The canonical order key of an input: the id of the spent tx, then the index of the spent output.
+    """
+    return (input.utxo_id.id.value, input.utxo_id.output_idx.value)
+
+
+def sort_canonically(inputs: List[TransferableInput], *outputs: List[TransferableOutput]):
+    """
+    Sorts inputs and outputs in place into the order the chain expects. Each key is computed once per element.
+
+    Args:
+        inputs (List[TransferableInput]): The inputs of a tx.
+        *outputs (List[TransferableOutput]): The output lists of a tx, e.g. change and stake outputs.
+    """
+    inputs.sort(key=input_sort_key)
+    for output_list in outputs:
+        output_list.sort(key=output_sort_key)
+
+
+def signed_tx_size(unsigned_tx: Seder, inputs: List[TransferableInput], codec: Codec = PVM_CODEC) -> int:
+    """
+    The size of a transaction as issued: the codec version, the transaction and one credential per input with a
+    signature per address index. Computed from the fields, so it's known before anything is encoded or signed.
+    """
+    credentials_size = sum(2 * INT_LEN + len(input.input.address_indices) * SECP256K1_SIGNATURE_LEN for input in inputs)
+    return SHORT_LEN + codec.prefixed_size(unsigned_tx) + INT_LEN + credentials_size
@@ -0,0 +1,277 @@
+import heapq
+from bisect import bisect_left
+from typing import (
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from avalanchepy.transaction_builder.utxo_table import (
+    OUTPUT_TYPE_STAKEABLE,
+    OUTPUT_TYPE_TRANSFER,
+)
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.avax.utxo import OutputFields
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+
+# the owners of a group of UTXOs: the threshold, the locktime and the addresses
+OwnerSet = Tuple[int, int, Tuple[Address, ...]]
+# the key of a group of UTXOs of an asset: the output type code and the owners
+GroupKey = Tuple[int, OwnerSet]
+# a UTXO id as a hashable key: the tx id bytes and the output index
+UtxoKey = Tuple[bytes, int]
+
+
+def utxo_key(utxo_id: UtxoId) -> UtxoKey:
+    return (utxo_id.id.value, utxo_id.output_idx.value)
+
+
+class UtxoPool:
+    """
+    A UTXO set indexed by asset, output kind and owners, for the spend calculators.
+
+    The set is indexed once, e.g. a wallet's, and spending only walks the groups of the requested assets the from
+    addresses can sign for, in set order and only until the amounts are covered, so the time taken grows with the
+    UTXOs spent rather than with the size of the set. The signer indices of every owner set are computed once per
+    set of from addresses rather than once per UTXO.
+
+    `TransactionBuilder.spend` accepts a UtxoPool wherever it accepts a list of UTXOs, and gives the same result.
+    UTXOs can be added and removed between spends, e.g. to spend the change of a tx and not its inputs again.
+
+    Attributes:
+        utxos (List[UtxoLike]): The UTXOs, in the order a list of them would be spent in.
+        amounts (List[int]): The amount of each UTXO, of the nested output for stakeable outputs.
+        locktimes (List[int]): The stake lock of each stakeable UTXO, 0 for the others.
+        groups (Dict[Id, Dict[GroupKey, List[int]]]): The positions of the spendable UTXOs in `utxos`, by asset then
+            by output type code and owners.
+        removed (Set[int]): The positions of the removed UTXOs, which stay in `utxos` so the others keep theirs.
+    """
+
+    __slots__ = ("utxos", "amounts", "locktimes", "groups", "removed", "_signers", "_rows")
+
+    utxos: List[UtxoLike]
+    amounts: List[int]
+    locktimes: List[int]
+    groups: Dict[Id, Dict[GroupKey, List[int]]]
+    removed: Set[int]
+    _signers: Dict[FrozenSet[Address], Dict[OwnerSet, Optional[List[int]]]]
+    # the position of every UTXO by id, built on the first removal
+    _rows: Optional[Dict[UtxoKey, int]]
+
+    def __init__(self, utxos: Iterable[UtxoLike] = (), from_addresses: Optional[Collection[Address]] = None):
+        """
+        Indexes a UTXO set.
+
+        Args:
+            utxos (Iterable[UtxoLike]): The UTXOs, in the order a list of them would be spent in.
+            from_addresses (Optional[Collection[Address]]): The addresses to compute the signer indices of upfront,
+                those of other addresses are computed on their first spend.
+        """
+        self.utxos = []
+        self.amounts = []
+        self.locktimes = []
+        self.groups = {}
+        self.removed = set()
+        self._signers = {}
+        self._rows = None
+        self.add(utxos)
+        if from_addresses is not None:
+            self.signers(from_addresses)
+
+    def add(self, utxos: Iterable[UtxoLike]):
+        """
+        Appends UTXOs to the set, after those already in it. `LazyUtxo`s are indexed from their buffers, their
+        outputs stay undecoded.
+        """
+        for utxo in utxos:
+            row = len(self.utxos)
+            fields = utxo.output_fields()
+            (stake_locktime, amount, *_) = fields
+
+            self.utxos.append(utxo)
+            self.locktimes.append(stake_locktime or 0)
+            if self._rows is not None:
+                self._rows[utxo_key(utxo.utxo_id)] = row
+            if amount is None:
+                # plain owners can't be spent
+                self.amounts.append(0)
+                continue
+
+            self.amounts.append(amount)
+            self.groups.setdefault(utxo.asset_id, {}).setdefault(group_key(fields), []).append(row)
+
+        # owner sets may have been added
+        self._signers.clear()
+
+    def copy(self) -> "UtxoPool":
+        """
+        Returns a pool of the same UTXOs that can be added to and removed from independently, without indexing them
+        again.
+        """
+        pool = UtxoPool()
+        pool.utxos = list(self.utxos)
+        pool.amounts = list(self.amounts)
+        pool.locktimes = list(self.locktimes)
+        pool.groups = {
+            asset_id: {key: list(rows) for (key, rows) in groups.items()} for (asset_id, groups) in self.groups.items()
+        }
+        pool.removed = set(self.removed)
+        # the owner sets are the same, so are their signers
+        pool._signers = dict(self._signers)
+        pool._rows = None if self._rows is None else dict(self._rows)
+        return pool
+
+    def remove(self, utxo_ids: Iterable[UtxoId]) -> List[UtxoLike]:
+        """
+        Removes UTXOs from the set, e.g. those a tx spends, so later spends don't pick them again.
+
+        Returns:
+            List[UtxoLike]: The removed UTXOs, in the order of `utxo_ids`, without those not in the set.
+        """
+        rows = self._rows
+        if rows is None:
+            rows = {utxo_key(utxo.utxo_id): row for (row, utxo) in enumerate(self.utxos) if row not in self.removed}
+            self._rows = rows
+
+        removed = []
+        for utxo_id in utxo_ids:
+            row = rows.pop(utxo_key(utxo_id), None)
+            if row is None:
+                continue
+
+            utxo = self.utxos[row]
+            removed.append(utxo)
+            self.removed.add(row)
+            key = group_key(utxo.output_fields())
+            if key is not None:
+                group = self.groups[utxo.asset_id][key]
+                # the groups are in set order
+                del group[bisect_left(group, row)]
+
+        return removed
+
+    def __len__(self) -> int:
+        return len(self.utxos) - len(self.removed)
+
+    def __iter__(self) -> Iterator[UtxoLike]:
+        removed = self.removed
+        return (utxo for (row, utxo) in enumerate(self.utxos) if row not in removed)
+
+    def signers(self, addresses: Collection[Address]) -> Dict[OwnerSet, Optional[List[int]]]:
+        """
+        Returns the signer indices of `addresses` for every owner set, None for those they can't sign for.
+
+        Mirrors `Secp256k1OutputOwners.match_owners`, except for the locktime which is checked when spending.
+        """
+        key = frozenset(addresses)
+        signers = self._signers.get(key)
+        if signers is not None:
+            return signers
+
+        signers = {}
+        for groups in self.groups.values():
+            for _, owner_set in groups:
+                if owner_set in signers:
+                    continue
+
+                (threshold, _, owner_addresses) = owner_set
+                sigs = [i for (i, address) in enumerate(owner_addresses) if address in key]
+                signers[owner_set] = sigs if len(sigs) == threshold else None
+
+        self._signers[key] = signers
+        return signers
+
+    def candidates(
+        self, asset_id: Id, addresses: Collection[Address], min_issuance_time: int, locked: bool
+    ) -> Iterator[int]:
+        """
+        Returns the positions of the UTXOs of an asset the addresses can spend at `min_issuance_time`, in set order.
+
+        Args:
+            asset_id (Id): The asset.
+            addresses (Collection[Address]): The addresses spending.
+            min_issuance_time (int): The time the spending tx is issued at the earliest.
+            locked (bool): If True the candidates are the still locked stakeable UTXOs, which can only be staked,
+                otherwise the transfer and unlocked stakeable UTXOs.
+        """
+        groups = self.groups.get(asset_id)
+        if groups is None:
+            return iter(())
+
+        signers = self.signers(addresses)
+        output_types = (OUTPUT_TYPE_STAKEABLE,) if locked else (OUTPUT_TYPE_TRANSFER, OUTPUT_TYPE_STAKEABLE)
+        rows = [
+            rows
+            for ((output_type, owner_set), rows) in groups.items()
+            if output_type in output_types and owner_set[1] <= min_issuance_time and signers[owner_set] is not None
+        ]
+
+        # the groups are each in set order, merged they are the asset's candidates in set order
+        locktimes = self.locktimes
+        return (row for row in heapq.merge(*rows) if (locktimes[row] > min_issuance_time) == locked)
+
+    def select_spendable_locked(
+        self, amounts_to_stake: Dict[Id, int], addresses: Collection[Address], min_issuance_time: int
+    ) -> List[UtxoLike]:
+        """
+        Returns the UTXOs `use_spendable_locked_utxo` consumes, in set order: the stakeable, still locked UTXOs the
+        addresses can sign for, per asset up to the first one that covers the amount to stake.
+        """
+        return self._take(amounts_to_stake, addresses, min_issuance_time, locked=True)
+
+    def select_unlocked(
+        self,
+        amounts_to_burn: Dict[Id, int],
+        amounts_to_stake: Dict[Id, int],
+        addresses: Collection[Address],
+        min_issuance_time: int,
+    ) -> List[UtxoLike]:
+        """
+        Returns the UTXOs `use_unlocked_utxo` consumes, in set order: the transfer and unlocked stakeable UTXOs the
+        addresses can sign for, per asset up to the first one that covers the amounts to burn and to stake.
+        """
+        targets = dict(amounts_to_stake)
+        for asset_id, amount in amounts_to_burn.items():
+            targets[asset_id] = targets.get(asset_id, 0) + amount
+
+        return self._take(targets, addresses, min_issuance_time, locked=False)
+
+    def _take(
+        self, targets: Dict[Id, int], addresses: Collection[Address], min_issuance_time: int, locked: bool
+    ) -> List[UtxoLike]:
+        amounts = self.amounts
+        selected = []
+        for asset_id, target in targets.items():
+            if target <= 0:
+                continue
+
+            total = 0
+            for row in self.candidates(asset_id, addresses, min_issuance_time, locked):
+                selected.append(row)
+                total += amounts[row]
+                if total >= target:
+                    break
+
+        selected.sort()
+        return [self.utxos[row] for row in selected]
+
+
+def group_key(fields: OutputFields) -> Optional[GroupKey]:
+    """
+    Returns the output type code and the owners of a UTXO with a `Secp256k1TransferOutput`, nested or not, from its
+    `output_fields()`. None for the other UTXOs, which are in no group.
+    """
+    (stake_locktime, amount, owners_locktime, threshold, addresses) = fields
+    if amount is None:
+        return None
+
+    output_type = OUTPUT_TYPE_TRANSFER if stake_locktime is None else OUTPUT_TYPE_STAKEABLE
+    return (output_type, (threshold, owners_locktime, addresses))
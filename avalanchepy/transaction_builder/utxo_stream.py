@@ -0,0 +1,54 @@
+from typing import Callable, Iterable, Iterator, List
+
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+
+
+class UtxoStream:
+    """
+    A UTXO set produced lazily, e.g. by a generator decoding pages of `platform.getUTXOs` as they are needed.
+
+    The spend calculators each walk the set from its start, and stop as soon as their amounts are covered. A UtxoStream
+    pulls a UTXO from its source only when a walk gets past those pulled so far and keeps the pulled ones for the next
+    walks, so a spend touches the source only up to the last UTXO it needed.
+
+    `TransactionBuilder.spend` wraps the UTXO sets that aren't lists, UtxoTables or UtxoPools into a UtxoStream.
+
+    Attributes:
+        pulled (List[UtxoLike]): The UTXOs pulled from the source so far, in order.
+    """
+
+    __slots__ = ("pulled", "_source")
+
+    pulled: List[UtxoLike]
+    _source: Iterator[UtxoLike]
+
+    def __init__(self, utxos: Iterable[UtxoLike]):
+        self.pulled = []
+        self._source = iter(utxos)
+
+    def __iter__(self) -> Iterator[UtxoLike]:
+        pulled = self.pulled
+        i = 0
+        while True:
+            if i == len(pulled):
+                utxo = next(self._source, None)
+                if utxo is None:
+                    return
+                pulled.append(utxo)
+
+            yield pulled[i]
+            i += 1
+
+
+def until_satisfied(utxos: Iterable[UtxoLike], satisfied: Callable[[], bool]) -> Iterator[UtxoLike]:
+    """
+    Yields the UTXOs until `satisfied()` is True. It's checked before each UTXO is pulled, so none is pulled once the
+    amounts are covered.
+    """
+    iterator = iter(utxos)
+    while not satisfied():
+        utxo = next(iterator, None)
+        if utxo is None:
+            return
+
+        yield utxo
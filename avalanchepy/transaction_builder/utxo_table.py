@@ -0,0 +1,169 @@
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, only needed by UtxoTable
+    np = None
+
+# output type codes of the `output_type` column
+OUTPUT_TYPE_OWNERS = 0
+OUTPUT_TYPE_TRANSFER = 1
+OUTPUT_TYPE_STAKEABLE = 2
+
+UINT64_MAX = 2**64 - 1
+
+
+class UtxoTable:
+    """
+    A columnar view of a UTXO set for the spend calculators.
+
+    The fields the calculators filter on are stored as NumPy columns, one row per UTXO, so choosing the UTXOs to
+    spend is a handful of vectorized masks and cumulative sums instead of a walk over the UTXO objects. Only the
+    chosen rows are touched as objects afterwards. Requires numpy.
+
+    `TransactionBuilder.spend` accepts a UtxoTable wherever it accepts a list of UTXOs, and gives the same result.
+
+    Attributes:
+        utxos (List[UtxoLike]): The UTXOs of the rows, e.g. `LazyUtxo` views over the raw UTXO bytes.
+        assets (List[Id]): The distinct assets, indexed by the `asset` column.
+        owner_sets (List[Tuple[Address, ...]]): The distinct owner address lists, indexed by the `owner_set` column.
+        amount (np.ndarray): uint64, the amount, of the nested output for stakeable outputs. 0 for owners outputs.
+        locktime (np.ndarray): uint64, the stake lock of stakeable outputs, 0 otherwise.
+        owners_locktime (np.ndarray): uint64, the locktime of the output owners.
+        output_type (np.ndarray): uint8, one of the `OUTPUT_TYPE_*` codes.
+        asset (np.ndarray): int32, the index of the asset in `assets`.
+        threshold (np.ndarray): uint32, the signature threshold of the output owners.
+        owner_set (np.ndarray): int32, the index of the owner addresses in `owner_sets`.
+    """
+
+    utxos: List[UtxoLike]
+    assets: List[Id]
+    owner_sets: List[Tuple[Address, ...]]
+
+    def __init__(self, utxos: Sequence[UtxoLike]):
+        """
+        Builds the columns of a UTXO set. The columns of `LazyUtxo` rows are read from their buffers, their outputs
+        stay undecoded.
+
+        Args:
+            utxos (Sequence[UtxoLike]): The UTXOs, in the order a list of them would be spent in.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        if np is None:
+            raise ImportError("UtxoTable requires numpy, install avalanchepy[numpy]")
+
+        count = len(utxos)
+        self.utxos = list(utxos)
+        self.assets = []
+        self.owner_sets = []
+        self.amount = np.zeros(count, dtype=np.uint64)
+        self.locktime = np.zeros(count, dtype=np.uint64)
+        self.owners_locktime = np.zeros(count, dtype=np.uint64)
+        self.output_type = np.zeros(count, dtype=np.uint8)
+        self.asset = np.zeros(count, dtype=np.int32)
+        self.threshold = np.zeros(count, dtype=np.uint32)
+        self.owner_set = np.zeros(count, dtype=np.int32)
+
+        self._asset_index: Dict[Id, int] = {}
+        owner_set_index: Dict[Tuple[Address, ...], int] = {}
+        for i, utxo in enumerate(self.utxos):
+            (stake_locktime, amount, owners_locktime, threshold, addresses) = utxo.output_fields()
+            if stake_locktime is not None:
+                self.output_type[i] = OUTPUT_TYPE_STAKEABLE
+                self.locktime[i] = stake_locktime
+            elif amount is not None:
+                self.output_type[i] = OUTPUT_TYPE_TRANSFER
+
+            if amount is not None:
+                self.amount[i] = amount
+            self.owners_locktime[i] = owners_locktime
+            self.threshold[i] = threshold
+            self.asset[i] = self._asset_index.setdefault(utxo.asset_id, len(self._asset_index))
+            self.owner_set[i] = owner_set_index.setdefault(addresses, len(owner_set_index))
+
+        self.assets = list(self._asset_index)
+        self.owner_sets = list(owner_set_index)
+
+    def __len__(self) -> int:
+        return len(self.utxos)
+
+    def __iter__(self) -> Iterator[UtxoLike]:
+        return iter(self.utxos)
+
+    def __getitem__(self, i: int) -> UtxoLike:
+        return self.utxos[i]
+
+    def signable(self, addresses: List[Address], min_issuance_time: int) -> "np.ndarray":
+        """
+        Returns the mask of the rows the addresses can sign for at `min_issuance_time`.
+
+        Mirrors `Secp256k1OutputOwners.match_owners`: the owners must be unlocked and the number of owner addresses
+        among `addresses` must equal the threshold.
+        """
+        addresses_set = set(addresses)
+        matches = np.array(
+            [sum(address in addresses_set for address in owner_set) for owner_set in self.owner_sets], dtype=np.uint32
+        )
+
+        return (matches[self.owner_set] == self.threshold) & (self.owners_locktime <= min_issuance_time)
+
+    def select_spendable_locked(
+        self, amounts_to_stake: Dict[Id, int], addresses: List[Address], min_issuance_time: int
+    ) -> List[UtxoLike]:
+        """
+        Returns the UTXOs `use_spendable_locked_utxo` consumes, in table order: the stakeable, still locked UTXOs the
+        addresses can sign for, per asset up to the first one that covers the amount to stake.
+        """
+        mask = (
+            (self.output_type == OUTPUT_TYPE_STAKEABLE)
+            & (self.locktime > min_issuance_time)
+            & self.signable(addresses, min_issuance_time)
+        )
+        return self._take(mask, amounts_to_stake)
+
+    def select_unlocked(
+        self,
+        amounts_to_burn: Dict[Id, int],
+        amounts_to_stake: Dict[Id, int],
+        addresses: List[Address],
+        min_issuance_time: int,
+    ) -> List[UtxoLike]:
+        """
+        Returns the UTXOs `use_unlocked_utxo` consumes, in table order: the transfer and unlocked stakeable UTXOs the
+        addresses can sign for, per asset up to the first one that covers the amounts to burn and to stake.
+        """
+        mask = (
+            (self.output_type == OUTPUT_TYPE_TRANSFER)
+            | ((self.output_type == OUTPUT_TYPE_STAKEABLE) & (self.locktime <= min_issuance_time))
+        ) & self.signable(addresses, min_issuance_time)
+
+        targets = dict(amounts_to_stake)
+        for asset_id, amount in amounts_to_burn.items():
+            targets[asset_id] = targets.get(asset_id, 0) + amount
+
+        return self._take(mask, targets)
+
+    def _take(self, mask: "np.ndarray", targets: Dict[Id, int]) -> List[UtxoLike]:
+        selected = []
+        for asset_id, target in targets.items():
+            asset = self._asset_index.get(asset_id)
+            if target <= 0 or asset is None:
+                continue
+
+            rows = np.flatnonzero(mask & (self.asset == asset))
+            amounts = self.amount[rows]
+            totals = np.cumsum(amounts, dtype=np.uint64)
+            # a total below its own amount has wrapped around, by then any target is covered
+            covered = np.flatnonzero((totals >= min(target, UINT64_MAX)) | (totals < amounts))
+            selected.append(rows[: covered[0] + 1] if len(covered) > 0 else rows)
+
+        if not selected:
+            return []
+
+        return [self.utxos[i] for i in np.sort(np.concatenate(selected))]
@@ -1,16 +1,17 @@
-from typing import ClassVar, List, Tuple
+from typing import ClassVar, List, Union
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.base_tx import BaseTx
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
 from avalanchepy.types.avax.subnet_validator import SubnetValidator
-from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxo_index import UtxoIndex
 from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.list_struct import ListStruct, read_list
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 from avalanchepy.types.signable import Signable
 
 
@@ -24,29 +25,35 @@ class AddPermissionlessDelegatorTx(BaseModel, Seder, Signable):
     delegator_rewards_owner: Secp256k1OutputOwners
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["BaseTx", bytes]:
-        (base_tx, data) = BaseTx.deserialize(data, codec)
-        (subnet_validator, data) = SubnetValidator.deserialize(data, codec)
-        (stake_outputs, data) = deserialize_list(TransferableOutput, data, codec)
+    def read(reader: Reader, codec: Codec) -> "AddPermissionlessDelegatorTx":
+        base_tx = BaseTx.read(reader, codec)
+        subnet_validator = SubnetValidator.read(reader, codec)
+        stake_outputs = read_list(TransferableOutput, reader, codec)
 
-        (delegator_rewards_owner, data) = codec.unpack_prefix(data)
-        assert isinstance(delegator_rewards_owner, Secp256k1OutputOwners)
+        delegator_rewards_owner = codec.read_prefix(reader)
+        assert codec.trusted or isinstance(delegator_rewards_owner, Secp256k1OutputOwners)
 
-        tx = AddPermissionlessDelegatorTx(
+        return codec.build(
+            AddPermissionlessDelegatorTx,
             base_tx=base_tx,
             subnet_validator=subnet_validator,
             stake_outputs=stake_outputs,
             delegator_rewards_owner=delegator_rewards_owner,
         )
-        return tx, data
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.base_tx.serialize(codec)
-        data += self.subnet_validator.serialize(codec)
-        data += self.stake_outputs.serialize(codec)
-        data += codec.pack_prefix(self.delegator_rewards_owner)
-
-        return data
+    def serialize_into(self, writer: Writer, codec: Codec):
+        self.base_tx.serialize_into(writer, codec)
+        self.subnet_validator.serialize_into(writer, codec)
+        self.stake_outputs.serialize_into(writer, codec)
+        codec.pack_prefix_into(writer, self.delegator_rewards_owner)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return (
+            self.base_tx.serialized_size(codec)
+            + self.subnet_validator.serialized_size(codec)
+            + self.stake_outputs.serialized_size(codec)
+            + codec.prefixed_size(self.delegator_rewards_owner)
+        )
 
-    def get_signers(self, input_utxos: List[Utxo]) -> List[List[Address]]:
+    def get_signers(self, input_utxos: Union[List[UtxoLike], UtxoIndex]) -> List[List[Address]]:
         return Signable.extract_signers(input_utxos, self.base_tx.inputs.list)
@@ -1,19 +1,22 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
 from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.layout import U32, Layout, fixed_bytes
 from avalanchepy.types.primitives.byte import Byte
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
-from avalanchepy.types.seder import Codec, Int, Seder
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.list_struct import ListStruct, read_list
+from avalanchepy.types.seder import Codec, Int, Reader, Seder, Writer
 
 
 class BaseTx(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.BaseTx
 
+    _layout: ClassVar[Layout] = Layout(("network_id", U32), ("blockchain_id", fixed_bytes(ID_LEN)))
+
     network_id: Int
     blockchain_id: Id
     outputs: ListStruct[TransferableOutput]
@@ -21,21 +24,31 @@ class BaseTx(BaseModel, Seder):
     memo: ListStruct[Byte]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["BaseTx", bytes]:
-        (network_id, data) = Int.deserialize(data, codec)
-        (blockchain_id, data) = Id.deserialize(data, codec)
-        (outputs, data) = deserialize_list(TransferableOutput, data, codec)
-        (inputs, data) = deserialize_list(TransferableInput, data, codec)
-        (memo, data) = deserialize_list(Byte, data, codec)
-
-        base_tx = BaseTx(network_id=network_id, blockchain_id=blockchain_id, outputs=outputs, inputs=inputs, memo=memo)
-        return base_tx, data
-
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.network_id.serialize(codec)
-        data += self.blockchain_id.serialize(codec)
-        data += self.outputs.serialize(codec)
-        data += self.inputs.serialize(codec)
-        data += self.memo.serialize(codec)
-
-        return data
+    def read(reader: Reader, codec: Codec) -> "BaseTx":
+        (network_id, blockchain_id) = BaseTx._layout.unpack(reader)
+        outputs = read_list(TransferableOutput, reader, codec)
+        inputs = read_list(TransferableInput, reader, codec)
+        memo = read_list(Byte, reader, codec)
+
+        return codec.build(
+            BaseTx,
+            network_id=Int.of(network_id),
+            blockchain_id=codec.build(Id, value=blockchain_id),
+            outputs=outputs,
+            inputs=inputs,
+            memo=memo,
+        )
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        BaseTx._layout.pack_into(writer, self.network_id.value, self.blockchain_id.value)
+        self.outputs.serialize_into(writer, codec)
+        self.inputs.serialize_into(writer, codec)
+        self.memo.serialize_into(writer, codec)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return (
+            BaseTx._layout.size
+            + self.outputs.serialized_size(codec)
+            + self.inputs.serialized_size(codec)
+            + self.memo.serialized_size(codec)
+        )
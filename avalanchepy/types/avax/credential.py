@@ -1,11 +1,11 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.inputs.secp256k1_signature import Secp256k1Signature
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.list_struct import ListStruct, read_list
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 
 class Credential(BaseModel, Seder):
@@ -13,12 +13,15 @@ class Credential(BaseModel, Seder):
     signatures: ListStruct[Secp256k1Signature]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Credential", bytes]:
-        signatures, data = deserialize_list(Secp256k1Signature, data, codec)
-        return Credential(signatures=signatures), data
+    def read(reader: Reader, codec: Codec) -> "Credential":
+        signatures = read_list(Secp256k1Signature, reader, codec)
+        return codec.build(Credential, signatures=signatures)
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.signatures.serialize(codec)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        self.signatures.serialize_into(writer, codec)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return self.signatures.serialized_size(codec)
 
     @staticmethod
     def empty() -> "Credential":
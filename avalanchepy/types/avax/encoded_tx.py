@@ -0,0 +1,114 @@
+import hashlib
+
+from avalanchepy.types.avax.credential import Credential
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.short import DEFAULT_CODEC_VERSION
+from avalanchepy.types.seder import Codec, Seder, Writer
+
+CHECKSUM_LEN = 4
+
+
+class EncodedUnsignedTx:
+    """
+    The encoding of an unsigned transaction, the part of a transaction its credentials sign.
+
+    Attributes:
+        codec (Codec): The codec the transaction is encoded with.
+        unsigned_bytes (bytes): The codec version followed by the type-prefixed unsigned transaction.
+        signing_hash (bytes): The sha256 of `unsigned_bytes`, the message every signature is computed over.
+    """
+
+    __slots__ = ("codec", "unsigned_bytes", "signing_hash")
+
+    codec: Codec
+    unsigned_bytes: bytes
+    signing_hash: bytes
+
+    def __init__(self, codec: Codec, unsigned_bytes: bytes, signing_hash: bytes):
+        self.codec = codec
+        self.unsigned_bytes = unsigned_bytes
+        self.signing_hash = signing_hash
+
+    @staticmethod
+    def encode(unsigned_tx: Seder, codec: Codec) -> "EncodedUnsignedTx":
+        writer = Writer()
+        DEFAULT_CODEC_VERSION.serialize_into(writer, codec)
+        codec.pack_prefix_into(writer, unsigned_tx)
+
+        unsigned_bytes = writer.getvalue()
+        return EncodedUnsignedTx(codec, unsigned_bytes, hashlib.sha256(unsigned_bytes).digest())
+
+
+class EncodedTx:
+    """
+    The wire encoding of a signed transaction and everything derived from it.
+
+    The transaction is encoded in a single pass and the signed bytes are hashed once: the hash is the transaction id,
+    and its last bytes are the checksum `platform.issueTx` expects after the transaction.
+
+    Attributes:
+        codec (Codec): The codec the transaction is encoded with.
+        unsigned_bytes (bytes): The codec version followed by the type-prefixed unsigned transaction.
+        signing_hash (bytes): The sha256 of `unsigned_bytes`, the message every signature is computed over.
+        signed_bytes (bytes): `unsigned_bytes` followed by the credentials.
+        tx_id (Id): The sha256 of `signed_bytes`, the id of the transaction on chain.
+        checksum (bytes): The last 4 bytes of the sha256 of `signed_bytes`.
+    """
+
+    __slots__ = ("codec", "unsigned_bytes", "signing_hash", "signed_bytes", "tx_id", "checksum")
+
+    codec: Codec
+    unsigned_bytes: bytes
+    signing_hash: bytes
+    signed_bytes: bytes
+    tx_id: Id
+    checksum: bytes
+
+    def __init__(self, unsigned: EncodedUnsignedTx, signed_bytes: bytes):
+        digest = hashlib.sha256(signed_bytes).digest()
+        self.codec = unsigned.codec
+        self.unsigned_bytes = unsigned.unsigned_bytes
+        self.signing_hash = unsigned.signing_hash
+        self.signed_bytes = signed_bytes
+        self.tx_id = Id(value=digest)
+        self.checksum = digest[-CHECKSUM_LEN:]
+
+    @staticmethod
+    def with_credentials(unsigned: EncodedUnsignedTx, credentials: ListStruct[Credential]) -> "EncodedTx":
+        """
+        Completes the encoding of an unsigned transaction with its credentials, without encoding the transaction again.
+        """
+        writer = Writer()
+        writer.write(unsigned.unsigned_bytes)
+        credentials.pack_list_into(writer, unsigned.codec)
+
+        return EncodedTx(unsigned, writer.getvalue())
+
+    @staticmethod
+    def encode(unsigned_tx: Seder, credentials: ListStruct[Credential], codec: Codec) -> "EncodedTx":
+        """
+        Encodes a transaction and its credentials in one pass.
+        """
+        writer = Writer()
+        DEFAULT_CODEC_VERSION.serialize_into(writer, codec)
+        codec.pack_prefix_into(writer, unsigned_tx)
+        unsigned_bytes = bytes(writer.buffer)
+        credentials.pack_list_into(writer, codec)
+
+        unsigned = EncodedUnsignedTx(codec, unsigned_bytes, hashlib.sha256(unsigned_bytes).digest())
+        return EncodedTx(unsigned, writer.getvalue())
+
+    @property
+    def wire_bytes(self) -> bytes:
+        """
+        The signed bytes followed by the checksum.
+        """
+        return self.signed_bytes + self.checksum
+
+    @property
+    def hex(self) -> str:
+        """
+        The wire form `platform.issueTx` takes: the hex of `wire_bytes` with a 0x prefix.
+        """
+        return "0x" + self.wire_bytes.hex()
@@ -1,11 +1,10 @@
-from typing import Annotated, ClassVar, Tuple
+from typing import Annotated, ClassVar
 
 from pydantic import AfterValidator, BaseModel
 
-from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.utils import validate_bytes_length
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 SECP256K1_SIGNATURE_LEN = 65
 
@@ -16,11 +15,11 @@ class Secp256k1Signature(BaseModel, Seder):
     value: Annotated[bytes, AfterValidator(lambda x: validate_bytes_length(x, SECP256K1_SIGNATURE_LEN))]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Secp256k1Signature", bytes]:
-        if len(data) < SECP256K1_SIGNATURE_LEN:
-            raise DeserializationError.invalid_size(len(data), SECP256K1_SIGNATURE_LEN)
+    def read(reader: Reader, codec: Codec) -> "Secp256k1Signature":
+        return codec.build(Secp256k1Signature, value=reader.read_bytes(SECP256K1_SIGNATURE_LEN))
 
-        return Secp256k1Signature(value=data[:SECP256K1_SIGNATURE_LEN]), data[SECP256K1_SIGNATURE_LEN:]
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write(self.value)
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value
+    def serialized_size(self, codec: Codec) -> int:
+        return SECP256K1_SIGNATURE_LEN
@@ -1,28 +1,37 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
+from avalanchepy.types.layout import U32, U64, Layout, pack_array, unpack_array
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
+from avalanchepy.types.primitives.list_struct import ListStruct
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Int, Seder
+from avalanchepy.types.seder import INT_LEN, Codec, Int, Reader, Seder, Writer
 
 
 class Secp256k1TransferInput(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.TransferInput
 
+    # address_indices entry is the length prefix of the index list
+    _layout: ClassVar[Layout] = Layout(("amount", U64), ("address_indices", U32))
+
     amount: Long
     address_indices: ListStruct[Int]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Secp256k1TransferInput", bytes]:
-        (amount, data) = Long.deserialize(data, codec)
-        (address_indices, data) = deserialize_list(Int, data, codec)
-
-        return Secp256k1TransferInput(amount=amount, address_indices=address_indices), data
-
-    def serialize(self, codec: Codec):
-        data = self.amount.serialize(codec)
-        data += self.address_indices.serialize(codec)
-
-        return data
+    def read(reader: Reader, codec: Codec) -> "Secp256k1TransferInput":
+        (amount, address_indices_len) = Secp256k1TransferInput._layout.unpack(reader)
+        address_indices = [Int.of(index) for index in unpack_array(reader, U32, address_indices_len)]
+
+        return codec.build(
+            Secp256k1TransferInput,
+            amount=Long.of(amount),
+            address_indices=ListStruct[Int].model_construct(list=address_indices),
+        )
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Secp256k1TransferInput._layout.pack_into(writer, self.amount.value, len(self.address_indices))
+        pack_array(writer, U32, [index.value for index in self.address_indices])
+
+    def serialized_size(self, codec: Codec) -> int:
+        return Secp256k1TransferInput._layout.size + len(self.address_indices) * INT_LEN
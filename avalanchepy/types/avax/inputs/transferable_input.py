@@ -1,4 +1,4 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
@@ -6,35 +6,45 @@ from avalanchepy.types.avax.inputs.secp256k1_transfer_input import (
     Secp256k1TransferInput,
 )
 from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.layout import U32, Layout, fixed_bytes
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.id import ID_LEN, Id
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Int, Reader, Seder, Writer
 
 
 class TransferableInput(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.TransferInput
 
+    # input entry is the type id of the input
+    _layout: ClassVar[Layout] = Layout(*UtxoId._layout.fields, ("asset_id", fixed_bytes(ID_LEN)), ("input", U32))
+
     utxo_id: UtxoId
     asset_id: Id
     # can be StakeableLockIn
     input: Secp256k1TransferInput
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["TransferableInput", bytes]:
-        (utxo_id, data) = UtxoId.deserialize(data, codec)
-        (asset_id, data) = Id.deserialize(data, codec)
-        (input, data) = codec.unpack_prefix(data)
-
-        assert isinstance(input, Secp256k1TransferInput)
-        return TransferableInput(utxo_id=utxo_id, asset_id=asset_id, input=input), data
-
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.utxo_id.serialize(codec)
-        data += self.asset_id.serialize(codec)
-        data += codec.pack_prefix(self.input)
-
-        return data
+    def read(reader: Reader, codec: Codec) -> "TransferableInput":
+        (tx_id, output_idx, asset_id, type_id) = TransferableInput._layout.unpack(reader)
+        input = codec.read_type(type_id, reader)
+
+        assert codec.trusted or isinstance(input, Secp256k1TransferInput)
+        utxo_id = codec.build(UtxoId, id=codec.build(Id, value=tx_id), output_idx=Int.of(output_idx))
+        return codec.build(TransferableInput, utxo_id=utxo_id, asset_id=codec.build(Id, value=asset_id), input=input)
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        TransferableInput._layout.pack_into(
+            writer,
+            self.utxo_id.id.value,
+            self.utxo_id.output_idx.value,
+            self.asset_id.value,
+            codec.type_id_of(self.input),
+        )
+        self.input.serialize_into(writer, codec)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return TransferableInput._layout.size + self.input.serialized_size(codec)
 
     def amount(self) -> Long:
         return self.input.amount
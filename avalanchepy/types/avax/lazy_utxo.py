@@ -0,0 +1,190 @@
+from typing import ClassVar, Iterable, Iterator, List, Sequence, Type, Union
+
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.utxo import (
+    OutputFields,
+    Utxo,
+    UtxoOutput,
+    get_output_fields,
+    get_output_owners,
+    unhexlify_utxo,
+)
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.constants import TypeSymbols
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.short import SHORT_LEN
+from avalanchepy.types.seder import Codec, Int, Reader, Serializable, Writer
+
+UTXO_OUTPUT_TYPE_SYMBOLS = frozenset(
+    output_type._type for output_type in UtxoOutput.__args__  # type: ignore[attr-defined]
+)
+
+
+class LazyUtxo(Serializable):
+    """
+    A view over an encoded UTXO that decodes its output on first access.
+
+    `utxo_id`, `asset_id` and the output type id are decoded eagerly, the output body (amounts, locktimes and
+    owner addresses) stays in the underlying buffer until `output` is read. A LazyUtxo exposes the same
+    attributes and helpers as `Utxo`, so it can be passed anywhere a `Utxo` is expected.
+
+    Errors in the output body are raised as `DeserializationError` on first access of `output`.
+
+    Attributes:
+        utxo_id (UtxoId): The id of the UTXO.
+        asset_id (Id): The asset of the UTXO.
+        output_type_id (int): The codec type id of the output.
+        codec (Codec): The codec the UTXO is encoded with.
+    """
+
+    _type: ClassVar[TypeSymbols] = TypeSymbols.UTXO
+
+    __slots__ = ("utxo_id", "asset_id", "output_type_id", "codec", "_view", "_output_offset", "_output")
+
+    utxo_id: UtxoId
+    asset_id: Id
+    output_type_id: int
+    codec: Codec
+
+    def __init__(self, data: Union[bytes, memoryview], codec: Codec, offset: int = 0):
+        """
+        Decodes the head of a UTXO.
+
+        Args:
+            data (bytes | memoryview): The buffer holding the encoded UTXO, without the codec version.
+            codec (Codec): The codec the UTXO is encoded with.
+            offset (int): The position of the UTXO in `data`.
+
+        Raises:
+            DeserializationError: If the head is truncated or the output type is not a UTXO output.
+        """
+        reader = Reader(data, offset)
+        (tx_id, output_idx, asset_id, type_id) = Utxo._layout.unpack(reader)
+
+        output_type = codec.type_id_to_type[type_id] if 0 <= type_id < len(codec.type_id_to_type) else None
+        if output_type is None or output_type._type not in UTXO_OUTPUT_TYPE_SYMBOLS:
+            raise DeserializationError(f"Invalid typeId: {type_id}")
+
+        self.utxo_id = codec.build(UtxoId, id=codec.build(Id, value=tx_id), output_idx=Int.of(output_idx))
+        self.asset_id = codec.build(Id, value=asset_id)
+        self.output_type_id = type_id
+        self.codec = codec
+        self._view = reader.view
+        self._output_offset = reader.offset
+        self._output = None
+
+    @property
+    def output(self) -> UtxoOutput:
+        if self._output is None:
+            reader = Reader(self._view, self._output_offset)
+            self._output = self.codec.read_type(self.output_type_id, reader)
+
+        return self._output
+
+    def is_decoded(self) -> bool:
+        return self._output is not None
+
+    def output_type(self) -> Type[UtxoOutput]:
+        return self.codec.type_id_to_type[self.output_type_id]
+
+    def get_output_owners(self) -> Secp256k1OutputOwners:
+        return get_output_owners(self.output)
+
+    def output_fields(self) -> OutputFields:
+        """
+        Returns the fields of the output the spend calculators index UTXOs by. They are read from the buffer, the
+        output is not decoded unless it already is.
+
+        Raises:
+            DeserializationError: If the fields are truncated or a nested output is not a `Secp256k1TransferOutput`.
+        """
+        if self._output is not None:
+            return get_output_fields(self._output)
+
+        codec = self.codec
+        reader = Reader(self._view, self._output_offset)
+        output_type = self.output_type()
+        stake_locktime = None
+        if output_type is StakeableLockOut:
+            (stake_locktime, type_id) = StakeableLockOut._layout.unpack(reader)
+            output_type = codec.type_id_to_type[type_id] if 0 <= type_id < len(codec.type_id_to_type) else None
+            if output_type is not Secp256k1TransferOutput:
+                raise DeserializationError(f"Invalid typeId: {type_id}")
+
+        amount = None
+        if output_type is Secp256k1TransferOutput:
+            (amount, locktime, threshold, addresses_len) = Secp256k1TransferOutput._layout.unpack(reader)
+        else:
+            (locktime, threshold, addresses_len) = Secp256k1OutputOwners._layout.unpack(reader)
+
+        addresses = tuple(Address.read(reader, codec) for _ in range(addresses_len))
+        return (stake_locktime, amount, locktime, threshold, addresses)
+
+    def to_utxo(self) -> Utxo:
+        return self.codec.build(Utxo, utxo_id=self.utxo_id, asset_id=self.asset_id, output=self.output)
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        self.to_utxo().serialize_into(writer, codec)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return Utxo._layout.size + self.output.serialized_size(codec)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with another LazyUtxo or Utxo by value. Decodes the outputs of both sides.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if the other object is a UTXO with the same id, asset and output, False otherwise.
+        """
+        if not isinstance(other, (LazyUtxo, Utxo)):
+            return NotImplemented
+        return self.utxo_id == other.utxo_id and self.asset_id == other.asset_id and self.output == other.output
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyUtxo(utxo_id={self.utxo_id!r}, asset_id={self.asset_id!r}, output={self._output!r})"
+
+
+# anything the spend calculators and signers accept as a UTXO
+UtxoLike = Union[Utxo, LazyUtxo]
+
+
+def decode_lazy_utxos(hex_strings: Sequence[str], codec: Codec) -> List[LazyUtxo]:
+    """
+    Decodes the heads of a page of UTXOs, the lazy counterpart of `decode_utxos`.
+
+    Args:
+        hex_strings (Sequence[str]): The encoded UTXOs, as returned by `platform.getUTXOs`.
+        codec (Codec): The codec of the UTXOs.
+
+    Returns:
+        List[LazyUtxo]: The UTXO views, in order.
+
+    Raises:
+        DeserializationError: If a string is not a `0x` prefixed hex UTXO or a head is malformed.
+    """
+    return list(iter_lazy_utxos(hex_strings, codec))
+
+
+def iter_lazy_utxos(hex_strings: Iterable[str], codec: Codec) -> Iterator[LazyUtxo]:
+    """
+    Decodes the heads of a page of UTXOs as they are iterated, so a spend that stops early never decodes the rest.
+
+    Args:
+        hex_strings (Iterable[str]): The encoded UTXOs, as returned by `platform.getUTXOs`.
+        codec (Codec): The codec of the UTXOs.
+
+    Returns:
+        Iterator[LazyUtxo]: The UTXO views, in order. Malformed strings raise a DeserializationError when reached.
+    """
+    return (LazyUtxo(unhexlify_utxo(hex_string), codec, SHORT_LEN) for hex_string in hex_strings)
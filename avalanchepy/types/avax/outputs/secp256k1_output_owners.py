@@ -1,50 +1,66 @@
-from typing import ClassVar, List, Optional, Tuple
+from typing import AbstractSet, ClassVar, List, Optional, Union
 
 from pydantic import BaseModel
 
-from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.layout import U32, U64, Layout
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
+from avalanchepy.types.primitives.list_struct import ListStruct
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Int, Seder
+from avalanchepy.types.seder import Codec, Int, Reader, Seder, Writer
 
 
 # analog: OutputOwners
 class Secp256k1OutputOwners(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.OutputOwners
 
+    # the addresses entry is the length prefix of the address list
+    _layout: ClassVar[Layout] = Layout(("locktime", U64), ("threshold", U32), ("addresses", U32))
+
     locktime: Long
     threshold: Int
     addresses: ListStruct[Address]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Secp256k1OutputOwners", bytes]:
-        (locktime, data) = Long.deserialize(data, codec)
-        (threshold, data) = Int.deserialize(data, codec)
-        (addresses, data) = deserialize_list(Address, data, codec)
-
-        return (
-            Secp256k1OutputOwners(
-                locktime=locktime,
-                threshold=threshold,
-                addresses=addresses,
-            ),
-            data,
+    def read(reader: Reader, codec: Codec) -> "Secp256k1OutputOwners":
+        return Secp256k1OutputOwners.read_addresses(reader, codec, *Secp256k1OutputOwners._layout.unpack(reader))
+
+    @staticmethod
+    def read_addresses(
+        reader: Reader, codec: Codec, locktime: int, threshold: int, addresses_len: int
+    ) -> "Secp256k1OutputOwners":
+        addresses = [Address.read(reader, codec) for _ in range(addresses_len)]
+
+        return codec.build(
+            Secp256k1OutputOwners,
+            locktime=Long.of(locktime),
+            threshold=Int.of(threshold),
+            addresses=ListStruct[Address].model_construct(list=addresses),
         )
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.locktime.serialize(codec)
-        data += self.threshold.serialize(codec)
-        data += self.addresses.serialize(codec)
+    def layout_values(self) -> tuple:
+        return (self.locktime.value, self.threshold.value, len(self.addresses))
+
+    def serialize_addresses_into(self, writer: Writer, codec: Codec):
+        for address in self.addresses:
+            address.serialize_into(writer, codec)
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Secp256k1OutputOwners._layout.pack_into(writer, *self.layout_values())
+        self.serialize_addresses_into(writer, codec)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return Secp256k1OutputOwners._layout.size + len(self.addresses) * ADDRESS_LEN
 
-    def match_owners(self, addresses: List[Address], min_issuance_time: int) -> Optional[List[int]]:
+    def match_owners(
+        self, addresses: Union[List[Address], AbstractSet[Address]], min_issuance_time: int
+    ) -> Optional[List[int]]:
         if self.locktime.value > min_issuance_time:
             return None
 
         sigs = []
-        addresses_set = set(addresses)
+        # callers matching many owners pass a set, built once
+        addresses_set = addresses if isinstance(addresses, (set, frozenset)) else set(addresses)
         for i, owner_addr in enumerate(self.addresses.list):
             if owner_addr not in addresses_set:
                 continue
@@ -1,36 +1,40 @@
-from typing import ClassVar, List, Optional, Tuple
+from typing import AbstractSet, ClassVar, List, Optional, Union
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
-from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.layout import U64, Layout
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 
 # analog: TransferOutput.ts
 class Secp256k1TransferOutput(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.TransferOutput
 
+    # amount is followed by the fixed-width head of the output owners
+    _layout: ClassVar[Layout] = Layout(("amount", U64), *Secp256k1OutputOwners._layout.fields)
+
     amount: Long
     output_owners: Secp256k1OutputOwners
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Secp256k1TransferOutput", bytes]:
-        (amount, data) = Long.deserialize(data, codec)
-        (output_owners, data) = Secp256k1OutputOwners.deserialize(data, codec)
+    def read(reader: Reader, codec: Codec) -> "Secp256k1TransferOutput":
+        (amount, *owners) = Secp256k1TransferOutput._layout.unpack(reader)
+        output_owners = Secp256k1OutputOwners.read_addresses(reader, codec, *owners)
 
-        return (
-            Secp256k1TransferOutput(amount=amount, output_owners=output_owners),
-            data,
-        )
+        return codec.build(Secp256k1TransferOutput, amount=Long.of(amount), output_owners=output_owners)
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.amount.serialize(codec)
-        data += self.output_owners.serialize(codec)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Secp256k1TransferOutput._layout.pack_into(writer, self.amount.value, *self.output_owners.layout_values())
+        self.output_owners.serialize_addresses_into(writer, codec)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return Secp256k1TransferOutput._layout.size + len(self.output_owners.addresses) * ADDRESS_LEN
 
-    def match_owners(self, addresses: List[Address], min_issuance_time: int) -> Optional[List[int]]:
+    def match_owners(
+        self, addresses: Union[List[Address], AbstractSet[Address]], min_issuance_time: int
+    ) -> Optional[List[int]]:
         return self.output_owners.match_owners(addresses, min_issuance_time)
@@ -1,32 +1,38 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
+from avalanchepy.types.layout import U32, U64, Layout
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 
 # TODO: rename to StakeableLockedOutput. skipped
 class StakeableLockOut(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.StakeableLockOut
 
+    # transferable_output entry is the type id of the nested output
+    _layout: ClassVar[Layout] = Layout(("locktime", U64), ("transferable_output", U32))
+
     locktime: Long
     transferable_output: Secp256k1TransferOutput
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["StakeableLockOut", bytes]:
-        (locktime, data) = Long.deserialize(data, codec)
-        (transferable_output, data) = codec.unpack_prefix(data)
-        assert isinstance(transferable_output, Secp256k1TransferOutput)
+    def read(reader: Reader, codec: Codec) -> "StakeableLockOut":
+        (locktime, type_id) = StakeableLockOut._layout.unpack(reader)
+        transferable_output = codec.read_type(type_id, reader)
+        assert codec.trusted or isinstance(transferable_output, Secp256k1TransferOutput)
 
-        return StakeableLockOut(locktime=locktime, transferable_output=transferable_output), data
+        return codec.build(StakeableLockOut, locktime=Long.of(locktime), transferable_output=transferable_output)
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.locktime.serialize(codec)
-        data += codec.pack_prefix(self.transferable_output)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        type_id = codec.type_id_of(self.transferable_output)
+        StakeableLockOut._layout.pack_into(writer, self.locktime.value, type_id)
+        self.transferable_output.serialize_into(writer, codec)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return StakeableLockOut._layout.size + self.transferable_output.serialized_size(codec)
@@ -1,4 +1,4 @@
-from typing import ClassVar, Tuple, Union
+from typing import ClassVar, Union
 
 from pydantic import BaseModel
 
@@ -7,31 +7,36 @@ from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.layout import U32, Layout, fixed_bytes
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.id import ID_LEN, Id
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import FROZEN_SLOTS, Codec, Frozen, Reader, Seder, Writer
 
 
 class TransferableOutput(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.TransferOutput
 
+    # output entry is the type id of the output
+    _layout: ClassVar[Layout] = Layout(("asset_id", fixed_bytes(ID_LEN)), ("output", U32))
+
     asset_id: Id
     output: Union[Secp256k1TransferOutput, StakeableLockOut]
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["TransferableOutput", bytes]:
-        (asset_id, data) = Id.deserialize(data, codec)
-        (output, data) = codec.unpack_prefix(data)
-        assert isinstance(output, Union[Secp256k1TransferOutput, StakeableLockOut])
+    def read(reader: Reader, codec: Codec) -> "TransferableOutput":
+        (asset_id, type_id) = TransferableOutput._layout.unpack(reader)
+        output = codec.read_type(type_id, reader)
+        assert codec.trusted or isinstance(output, Union[Secp256k1TransferOutput, StakeableLockOut])
 
-        return TransferableOutput(asset_id=asset_id, output=output), data
+        return codec.build(TransferableOutput, asset_id=codec.build(Id, value=asset_id), output=output)
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.asset_id.serialize(codec)
-        data += codec.pack_prefix(self.output)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        TransferableOutput._layout.pack_into(writer, self.asset_id.value, codec.type_id_of(self.output))
+        self.output.serialize_into(writer, codec)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return TransferableOutput._layout.size + self.output.serialized_size(codec)
 
     def amount(self) -> Long:
         if isinstance(self.output, Secp256k1TransferOutput):
@@ -44,3 +49,11 @@ class TransferableOutput(BaseModel, Seder):
             return self.output.output_owners
         else:
             return self.output.transferable_output.output_owners
+
+
+class FrozenTransferableOutput(Frozen, TransferableOutput):
+    """
+    An immutable TransferableOutput that encodes once per codec, e.g. for outputs that are sorted by their encoding.
+    """
+
+    __slots__ = FROZEN_SLOTS
@@ -1,39 +1,72 @@
-import hashlib
-from typing import ClassVar, Tuple
+from typing import ClassVar, Optional
 
 from avalanchepy.types.avax.credential import Credential
+from avalanchepy.types.avax.encoded_tx import EncodedTx, EncodedUnsignedTx
 from avalanchepy.types.codecs import PVM_CODEC
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.primitives.list_struct import ListStruct, deserialize_list
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.list_struct import ListStruct, read_list
+from avalanchepy.types.primitives.short import SHORT_LEN
+from avalanchepy.types.seder import FROZEN_SLOTS, Codec, Frozen, Reader, Seder, Writer
 
 
-class SignedTx(Seder):
+class SignedTx(Frozen, Seder):
+    """
+    A transaction with its credentials.
+
+    Signed transactions are immutable, so the encoding is computed once per codec, as an `EncodedTx`, and shared by
+    `id()`, `serialize()` and issuing. Passing the `EncodedUnsignedTx` the credentials were signed over reuses its
+    bytes, so the unsigned transaction is only encoded once from signing to issuing.
+    """
+
+    __slots__ = ("unsigned_transaction", "credentials", "_encoded_unsigned", "_encoded") + FROZEN_SLOTS
+
     _type: ClassVar[TypeSymbols] = TypeSymbols.AvmSignedTx
 
     unsigned_transaction: Seder
     credentials: ListStruct[Credential]
 
-    def __init__(self, unsigned_transaction: Seder, credentials: ListStruct[Credential]):
-        self.unsigned_transaction = unsigned_transaction
-        self.credentials = credentials
+    def __init__(
+        self,
+        unsigned_transaction: Seder,
+        credentials: ListStruct[Credential],
+        encoded_unsigned: Optional[EncodedUnsignedTx] = None,
+    ):
+        object.__setattr__(self, "unsigned_transaction", unsigned_transaction)
+        object.__setattr__(self, "credentials", credentials)
+        object.__setattr__(self, "_encoded_unsigned", encoded_unsigned)
+        object.__setattr__(self, "_encoded", {})
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["SignedTx", bytes]:
-        unsigned_transaction, data = codec.unpack_prefix(data)
-        credentials, data = deserialize_list(Codec, data, codec)
-        for credential in credentials:
-            assert isinstance(credential, Credential), f"Expected Credential, got {type(credential)}"
+    def read(reader: Reader, codec: Codec) -> "SignedTx":
+        unsigned_transaction = codec.read_prefix(reader)
+        credentials = read_list(Codec, reader, codec)
+        if not codec.trusted:
+            for credential in credentials:
+                assert isinstance(credential, Credential), f"Expected Credential, got {type(credential)}"
+
+        return SignedTx(unsigned_transaction=unsigned_transaction, credentials=credentials)
+
+    def encoded(self, codec: Codec = PVM_CODEC) -> EncodedTx:
+        """
+        Returns the wire encoding of the transaction, encoding it on first use.
+        """
+        encoded = self._encoded.get(codec)
+        if encoded is None:
+            if self._encoded_unsigned is not None and self._encoded_unsigned.codec is codec:
+                encoded = EncodedTx.with_credentials(self._encoded_unsigned, self.credentials)
+            else:
+                encoded = EncodedTx.encode(self.unsigned_transaction, self.credentials, codec)
+            self._encoded[codec] = encoded
 
-        return SignedTx(unsigned_transaction=unsigned_transaction, credentials=credentials), data
+        return encoded
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = codec.pack_prefix(self.unsigned_transaction)
-        data += self.credentials.pack_list(codec)
+    def encode_into(self, writer: Writer, codec: Codec):
+        # the encoding without the codec version
+        writer.write(memoryview(self.encoded(codec).signed_bytes)[SHORT_LEN:])
 
-        return data
+    def encoded_size(self, codec: Codec) -> int:
+        return codec.prefixed_size(self.unsigned_transaction) + self.credentials.pack_list_size(codec)
 
     def id(self) -> Id:
-        data = self.serialize(PVM_CODEC)
-        return Id(value=hashlib.sha256(data).digest())
+        return self.encoded(PVM_CODEC).tx_id
@@ -1,28 +1,33 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
 from avalanchepy.types.avax.validator import Validator
+from avalanchepy.types.layout import Layout, fixed_bytes
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 
 class SubnetValidator(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.SubnetValidator
 
+    _layout: ClassVar[Layout] = Layout(*Validator._layout.fields, ("subnet_id", fixed_bytes(ID_LEN)))
+
     validator: Validator
     subnet_id: Id
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["SubnetValidator", bytes]:
-        (validator, data) = Validator.deserialize(data, codec)
-        (subnet_id, data) = Id.deserialize(data, codec)
-
-        return SubnetValidator(subnet_id=subnet_id, validator=validator), data
-
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.validator.serialize(codec)
-        data += self.subnet_id.serialize(codec)
-
-        return data
+    def read(reader: Reader, codec: Codec) -> "SubnetValidator":
+        (*validator, subnet_id) = SubnetValidator._layout.unpack(reader)
+        return codec.build(
+            SubnetValidator,
+            subnet_id=codec.build(Id, value=subnet_id),
+            validator=Validator.from_layout(codec, *validator),
+        )
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        SubnetValidator._layout.pack_into(writer, *self.validator.layout_values(), self.subnet_id.value)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return SubnetValidator._layout.size
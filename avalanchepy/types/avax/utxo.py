@@ -1,4 +1,4 @@
-from typing import ClassVar, Tuple, Union
+from typing import ClassVar, List, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -9,40 +9,134 @@ from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
 from avalanchepy.types.avax.utxoid import UtxoId
 from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.layout import U32, Layout, fixed_bytes
+from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.short import DEFAULT_CODEC_VERSION, SHORT_LEN
+from avalanchepy.types.seder import Codec, Int, Reader, Seder, Writer
+
+HEX_PREFIX = "0x"
+
+UtxoOutput = Union[Secp256k1OutputOwners, Secp256k1TransferOutput, StakeableLockOut]
+
+# the fields of an output the spend calculators index UTXOs by: the stake lock (None unless stakeable), the amount
+# (None for plain owners), then the locktime, the threshold and the addresses of the owners
+OutputFields = Tuple[Optional[int], Optional[int], int, int, Tuple[Address, ...]]
+
+
+def get_output_owners(output: UtxoOutput) -> Secp256k1OutputOwners:
+    if isinstance(output, Secp256k1TransferOutput):
+        return output.output_owners
+    elif isinstance(output, StakeableLockOut):
+        return output.transferable_output.output_owners
+    else:
+        return output
+
+
+def get_output_fields(output: UtxoOutput) -> OutputFields:
+    stake_locktime = None
+    if isinstance(output, StakeableLockOut):
+        stake_locktime = output.locktime.value
+        output = output.transferable_output
+
+    amount = None
+    if isinstance(output, Secp256k1TransferOutput):
+        amount = output.amount.value
+        output = output.output_owners
+
+    return (stake_locktime, amount, output.locktime.value, output.threshold.value, tuple(output.addresses.list))
 
 
 class Utxo(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.UTXO
 
+    # output entry is the type id of the output
+    _layout: ClassVar[Layout] = Layout(*UtxoId._layout.fields, ("asset_id", fixed_bytes(ID_LEN)), ("output", U32))
+
     utxo_id: UtxoId
     asset_id: Id
-    output: Union[Secp256k1OutputOwners, Secp256k1TransferOutput, StakeableLockOut]
+    output: UtxoOutput
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Utxo", bytes]:
-        (utxo_id, data) = UtxoId.deserialize(data, codec)
-        (asset_id, data) = Id.deserialize(data, codec)
-        (output, data) = codec.unpack_prefix(data)
+    def read(reader: Reader, codec: Codec) -> "Utxo":
+        (tx_id, output_idx, asset_id, type_id) = Utxo._layout.unpack(reader)
+        output = codec.read_type(type_id, reader)
 
-        if isinstance(output, Union[Secp256k1OutputOwners, Secp256k1TransferOutput, StakeableLockOut]) is False:
+        if not codec.trusted and isinstance(output, UtxoOutput) is False:
             raise DeserializationError(f"Invalid output type: {output._type}")
 
-        return Utxo(utxo_id=utxo_id, asset_id=asset_id, output=output), data
+        utxo_id = codec.build(UtxoId, id=codec.build(Id, value=tx_id), output_idx=Int.of(output_idx))
+        return codec.build(Utxo, utxo_id=utxo_id, asset_id=codec.build(Id, value=asset_id), output=output)
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.utxo_id.serialize(codec)
-        data += self.asset_id.serialize(codec)
-        data += codec.pack_prefix(self.output)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Utxo._layout.pack_into(
+            writer,
+            self.utxo_id.id.value,
+            self.utxo_id.output_idx.value,
+            self.asset_id.value,
+            codec.type_id_of(self.output),
+        )
+        self.output.serialize_into(writer, codec)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return Utxo._layout.size + self.output.serialized_size(codec)
+
+    def output_type(self) -> Type[UtxoOutput]:
+        return type(self.output)
 
     def get_output_owners(self) -> Secp256k1OutputOwners:
-        if isinstance(self.output, Secp256k1TransferOutput):
-            return self.output.output_owners
-        elif isinstance(self.output, StakeableLockOut):
-            return self.transferable_output.output_owners
-        else:
-            return self.output
+        return get_output_owners(self.output)
+
+    def output_fields(self) -> OutputFields:
+        return get_output_fields(self.output)
+
+
+def unhexlify_utxo(hex_string: str) -> bytes:
+    """
+    Hex-decodes a `0x` prefixed, codec versioned UTXO, as `platform.getUTXOs` lists them, and validates its codec
+    version.
+
+    Args:
+        hex_string (str): The encoded UTXO.
+
+    Returns:
+        bytes: The record, starting with its codec version.
+
+    Raises:
+        DeserializationError: If the string has no `0x` prefix, is not valid hex or has an unsupported codec version.
+    """
+    if not hex_string.startswith(HEX_PREFIX):
+        raise DeserializationError(f"Missing {HEX_PREFIX} prefix: {hex_string[:16]}")
+
+    try:
+        data = bytes.fromhex(hex_string[len(HEX_PREFIX) :])
+    except ValueError as e:
+        raise DeserializationError(e) from e
+
+    version = int.from_bytes(data[:SHORT_LEN], byteorder="big")
+    if len(data) < SHORT_LEN or version != DEFAULT_CODEC_VERSION.value:
+        raise DeserializationError(f"Unsupported codec version: {version}")
+
+    return data
+
+
+def decode_utxo(hex_string: str, codec: Codec) -> Utxo:
+    """
+    Decodes a UTXO as `platform.getUTXOs` lists it. Bytes following the UTXO (e.g. the checksum appended by the
+    node) are ignored.
+
+    Raises:
+        DeserializationError: If the UTXO is malformed.
+    """
+    return Utxo.read(Reader(unhexlify_utxo(hex_string), SHORT_LEN), codec)
+
+
+def decode_utxos(hex_strings: Sequence[str], codec: Codec) -> List[Utxo]:
+    """
+    Decodes a page of UTXOs, see `decode_utxo`.
+
+    Raises:
+        DeserializationError: If any of the UTXOs is malformed.
+    """
+    return [decode_utxo(hex_string, codec) for hex_string in hex_strings]
@@ -0,0 +1,46 @@
+from typing import Dict, Iterable, Iterator, Optional
+
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.avax.utxoid import input_ids
+from avalanchepy.types.primitives.id import Id
+
+
+class UtxoIndex:
+    """
+    UTXOs by the id of the input spending them, e.g. a wallet's, built once and reused to find the UTXO of every input
+    of the transactions spending them.
+    """
+
+    __slots__ = ("_utxos",)
+
+    _utxos: Dict[Id, UtxoLike]
+
+    def __init__(self, utxos: Iterable[UtxoLike] = ()):
+        self._utxos = {}
+        self.add(utxos)
+
+    def add(self, utxos: Iterable[UtxoLike]):
+        utxos = list(utxos)
+        self._utxos.update(zip(input_ids([utxo.utxo_id for utxo in utxos]), utxos))
+
+    def discard(self, utxos: Iterable[UtxoLike]):
+        """
+        Removes spent UTXOs, ignoring those not in the index.
+        """
+        for input_id in input_ids([utxo.utxo_id for utxo in utxos]):
+            self._utxos.pop(input_id, None)
+
+    def get(self, input_id: Id) -> Optional[UtxoLike]:
+        return self._utxos.get(input_id)
+
+    def __getitem__(self, input_id: Id) -> UtxoLike:
+        return self._utxos[input_id]
+
+    def __contains__(self, input_id: Id) -> bool:
+        return input_id in self._utxos
+
+    def __len__(self) -> int:
+        return len(self._utxos)
+
+    def __iter__(self) -> Iterator[UtxoLike]:
+        return iter(self._utxos.values())
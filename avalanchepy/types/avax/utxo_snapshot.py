@@ -0,0 +1,279 @@
+"""
+A binary snapshot of a UTXO set that is opened through `mmap`.
+
+Layout of a snapshot file, all integers big-endian:
+
+    header          `SNAPSHOT_HEADER`
+    records         the UTXOs, each encoded as `Utxo.serialize(codec)`
+    offset table    count + 1 U64 positions, record i spans offsets[i]:offsets[i + 1]
+    asset index     key index over the asset ids
+    owner index     key index over the owner addresses
+    locktime index  count U64 locktimes in ascending order, followed by the count U32 matching record indices
+
+A key index is a U32 key count, the sorted (key, U32 start, U32 length) entries and the U32 record indices the
+entries point into, i.e. the records of a key are postings[start:start + length].
+"""
+
+import bisect
+import mmap
+import struct
+from collections import defaultdict
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from avalanchepy.types.avax.lazy_utxo import LazyUtxo, UtxoLike
+from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.codecs import DEFAULT_CODEC_VERSION, PVM_CODEC
+from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.layout import U16, U32, U64, Layout, fixed_bytes, pack_array, unpack_array
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.seder import INT_LEN, Codec, Reader, Writer
+
+SNAPSHOT_MAGIC = b"AVUS"
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_HEADER = Layout(
+    ("magic", fixed_bytes(len(SNAPSHOT_MAGIC))),
+    ("version", U16),
+    ("codec_version", U16),
+    ("count", U32),
+    ("offset_table", U64),
+    ("asset_index", U64),
+    ("owner_index", U64),
+    ("locktime_index", U64),
+)
+
+_U32 = struct.Struct(">" + U32)
+_U64 = struct.Struct(">" + U64)
+_RECORD_SPAN = struct.Struct(">" + 2 * U64)
+
+
+def utxo_locktime(utxo: UtxoLike) -> int:
+    """
+    The time until which a UTXO can't be spent: the stake lock of stakeable outputs, the owners' locktime otherwise.
+    """
+    output = utxo.output
+    if isinstance(output, StakeableLockOut):
+        return output.locktime.value
+
+    return utxo.get_output_owners().locktime.value
+
+
+def _pack_key_index(writer: Writer, key_len: int, postings_by_key: Dict[bytes, List[int]]):
+    entry = Layout(("key", fixed_bytes(key_len)), ("start", U32), ("length", U32))
+
+    writer.write_uint(len(postings_by_key), INT_LEN)
+    postings: List[int] = []
+    for key in sorted(postings_by_key):
+        entry.pack_into(writer, key, len(postings), len(postings_by_key[key]))
+        postings.extend(postings_by_key[key])
+
+    pack_array(writer, U32, postings)
+
+
+def write_utxo_snapshot(stream: BinaryIO, utxos: Iterable[UtxoLike], codec: Codec = PVM_CODEC):
+    """
+    Writes a snapshot of a UTXO set.
+
+    Args:
+        stream (BinaryIO): The binary stream to write to, e.g. a file opened with "wb".
+        utxos (Iterable[UtxoLike]): The UTXOs, in the order they are indexed by in the snapshot.
+        codec (Codec): The codec to encode the UTXOs with.
+    """
+    records = Writer()
+    offsets: List[int] = []
+    by_asset: Dict[bytes, List[int]] = defaultdict(list)
+    by_owner: Dict[bytes, List[int]] = defaultdict(list)
+    locktimes: List[Tuple[int, int]] = []
+    for i, utxo in enumerate(utxos):
+        offsets.append(SNAPSHOT_HEADER.size + len(records))
+        utxo.serialize_into(records, codec)
+
+        by_asset[utxo.asset_id.value].append(i)
+        # the same address may be listed more than once
+        for address in dict.fromkeys(address.value for address in utxo.get_output_owners().addresses):
+            by_owner[address].append(i)
+        locktimes.append((utxo_locktime(utxo), i))
+
+    count = len(offsets)
+    offsets.append(SNAPSHOT_HEADER.size + len(records))
+    locktimes.sort()
+
+    indexes = Writer()
+    offset_table = offsets[-1]
+    pack_array(indexes, U64, offsets)
+    asset_index = offset_table + len(indexes)
+    _pack_key_index(indexes, ID_LEN, by_asset)
+    owner_index = offset_table + len(indexes)
+    _pack_key_index(indexes, ADDRESS_LEN, by_owner)
+    locktime_index = offset_table + len(indexes)
+    pack_array(indexes, U64, [locktime for (locktime, _) in locktimes])
+    pack_array(indexes, U32, [i for (_, i) in locktimes])
+
+    header = Writer()
+    SNAPSHOT_HEADER.pack_into(
+        header,
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        DEFAULT_CODEC_VERSION.value,
+        count,
+        offset_table,
+        asset_index,
+        owner_index,
+        locktime_index,
+    )
+    stream.write(header.buffer)
+    stream.write(records.buffer)
+    stream.write(indexes.buffer)
+
+
+class UtxoSnapshot:
+    """
+    A read-only UTXO snapshot, memory-mapped from a file written with `write_utxo_snapshot`.
+
+    Opening only reads the header and the key tables of the indexes. Looking up a record is O(1) and the records
+    are decoded from the mapping without copying the file, `get_lazy` even leaves the output in place.
+
+    Lazy UTXOs keep the mapping alive, they have to be dropped before the snapshot is closed.
+
+    Attributes:
+        codec (Codec): The codec of the records.
+    """
+
+    codec: Codec
+
+    def __init__(self, path: str, codec: Codec = PVM_CODEC):
+        """
+        Opens a snapshot.
+
+        Args:
+            path (str): The path of the snapshot file.
+            codec (Codec): The codec the snapshot was written with.
+
+        Raises:
+            DeserializationError: If the file is not a snapshot or was written with an unsupported version.
+        """
+        self.codec = codec
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        try:
+            (magic, version, codec_version, count, *sections) = SNAPSHOT_HEADER.unpack(Reader(self._view))
+            if magic != SNAPSHOT_MAGIC:
+                raise DeserializationError("Not a UTXO snapshot")
+            if version != SNAPSHOT_VERSION or codec_version != DEFAULT_CODEC_VERSION.value:
+                raise DeserializationError(f"Unsupported snapshot version: {version}, codec version: {codec_version}")
+
+            self._count = count
+            (self._offset_table, asset_index, owner_index, self._locktime_index) = sections
+            (self._assets, self._asset_postings) = self._read_key_index(asset_index, ID_LEN)
+            (self._owners, self._owner_postings) = self._read_key_index(owner_index, ADDRESS_LEN)
+        except Exception:
+            self.close()
+            raise
+
+    def _read_key_index(self, position: int, key_len: int) -> Tuple[Dict[bytes, Tuple[int, int]], int]:
+        entry = Layout(("key", fixed_bytes(key_len)), ("start", U32), ("length", U32))
+
+        reader = Reader(self._view, position)
+        key_count = reader.read_uint(INT_LEN)
+        entries = {}
+        for _ in range(key_count):
+            (key, start, length) = entry.unpack(reader)
+            entries[key] = (start, length)
+
+        return (entries, reader.offset)
+
+    def _postings(self, postings: int, entry: Tuple[int, int]) -> List[int]:
+        (start, length) = entry
+        return list(unpack_array(Reader(self._view, postings + start * _U32.size), U32, length))
+
+    def _record(self, i: int) -> memoryview:
+        if not 0 <= i < self._count:
+            raise IndexError(f"UTXO index out of range: {i}")
+
+        (start, end) = _RECORD_SPAN.unpack_from(self._view, self._offset_table + i * _U64.size)
+        return self._view[start:end]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> Utxo:
+        return self.get(i)
+
+    def __iter__(self) -> Iterator[Utxo]:
+        return (self.get(i) for i in range(self._count))
+
+    def get(self, i: int) -> Utxo:
+        return Utxo.read(Reader(self._record(i)), self.codec)
+
+    def get_lazy(self, i: int) -> LazyUtxo:
+        return LazyUtxo(self._record(i), self.codec)
+
+    def select(self, indices: Iterable[int], lazy: bool = False) -> List[UtxoLike]:
+        """
+        Decodes a subset of the records, e.g. the result of an index lookup.
+
+        Args:
+            indices (Iterable[int]): The record indices.
+            lazy (bool): If True, returns `LazyUtxo` views over the mapping.
+
+        Returns:
+            List[UtxoLike]: The UTXOs, in the order of `indices`.
+        """
+        get = self.get_lazy if lazy else self.get
+        return [get(i) for i in indices]
+
+    def by_asset(self, asset_id: Id) -> List[int]:
+        """
+        Returns the indices of the records of an asset, in ascending order.
+        """
+        entry = self._assets.get(asset_id.value)
+        return self._postings(self._asset_postings, entry) if entry is not None else []
+
+    def by_owner(self, address: Address) -> List[int]:
+        """
+        Returns the indices of the records that list an address among their owners, in ascending order.
+        """
+        entry = self._owners.get(address.value)
+        return self._postings(self._owner_postings, entry) if entry is not None else []
+
+    def by_locktime(self, min_locktime: int = 0, max_locktime: int = 2**64 - 1) -> List[int]:
+        """
+        Returns the indices of the records with a locktime (see `utxo_locktime`) within `[min_locktime, max_locktime]`,
+        ordered by locktime. E.g. `by_locktime(max_locktime=now)` selects the records that are unlocked at `now`.
+        """
+        locktimes = _LocktimeColumn(self._view, self._locktime_index, self._count)
+        start = bisect.bisect_left(locktimes, min_locktime)
+        end = bisect.bisect_right(locktimes, max_locktime, lo=start)
+
+        indices_position = self._locktime_index + self._count * _U64.size + start * _U32.size
+        return list(unpack_array(Reader(self._view, indices_position), U32, end - start))
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "UtxoSnapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _LocktimeColumn:
+    # a read-only sequence over the locktime column of the index, for bisect
+    __slots__ = ("view", "position", "count")
+
+    def __init__(self, view: memoryview, position: int, count: int):
+        self.view = view
+        self.position = position
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> int:
+        return _U64.unpack_from(self.view, self.position + i * _U64.size)[0]
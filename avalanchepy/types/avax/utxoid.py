@@ -1,38 +1,65 @@
 import hashlib
-from typing import ClassVar, Tuple
+import struct
+from typing import ClassVar, Iterable, List
 
 from pydantic import BaseModel
 
+from avalanchepy.types.layout import U32, Layout, fixed_bytes
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.primitives.id import Id
-from avalanchepy.types.seder import INT_LEN, Codec, Int, Seder, unpack
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.seder import (
+    Codec,
+    Int,
+    Reader,
+    Seder,
+    Writer,
+    construct_trusted,
+)
+
+_OUTPUT_IDX = struct.Struct(">" + U32)
 
 
 class UtxoId(BaseModel, Seder):
+    # (tx id, output index, input id) of the last `input_id()`, a slot rather than a field or private attribute,
+    # so it costs nothing until used
+    __slots__ = ("_input_id",)
+
     _type: ClassVar[TypeSymbols] = TypeSymbols.UTXOID
 
+    _layout: ClassVar[Layout] = Layout(("id", fixed_bytes(ID_LEN)), ("output_idx", U32))
+
     id: Id
     output_idx: Int
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["UtxoId", bytes]:
-        (id, data) = unpack(data, Id, codec)
-        (number, data) = unpack(data, Int, codec)
-
-        return UtxoId(id=id, output_idx=number), data
+    def read(reader: Reader, codec: Codec) -> "UtxoId":
+        (id, output_idx) = UtxoId._layout.unpack(reader)
+        return codec.build(UtxoId, id=codec.build(Id, value=id), output_idx=Int.of(output_idx))
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.id.serialize(codec)
-        data += self.output_idx.serialize(codec)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        UtxoId._layout.pack_into(writer, self.id.value, self.output_idx.value)
 
-        return data
+    def serialized_size(self, codec: Codec) -> int:
+        return UtxoId._layout.size
 
     def input_id(self) -> Id:
-        output_idx_bytes = int.to_bytes(self.output_idx.value, length=INT_LEN, byteorder="big", signed=False)
-        buf = output_idx_bytes + self.id.value
+        """
+        Returns the id of the input spending this UTXO, the sha256 of the output index followed by the tx id.
 
-        digest = hashlib.sha256(buf).digest()
-        return Id(value=digest)
+        The id is computed once and cached, it is only computed again if a field has been reassigned since.
+        """
+        tx_id = self.id.value
+        output_idx = self.output_idx.value
+        try:
+            (cached_tx_id, cached_output_idx, input_id) = self._input_id
+            if cached_output_idx == output_idx and cached_tx_id == tx_id:
+                return input_id
+        except AttributeError:
+            pass
+
+        input_id = construct_trusted(Id, {"value": hashlib.sha256(_OUTPUT_IDX.pack(output_idx) + tx_id).digest()})
+        _set_input_id(self, (tx_id, output_idx, input_id))
+        return input_id
 
     def __eq__(self, other: "UtxoId") -> bool:
         """
@@ -65,3 +92,30 @@ class UtxoId(BaseModel, Seder):
         if self.id > other.id:
             return False
         return self.output_idx.value < other.output_idx.value
+
+
+_set_input_id = UtxoId.__dict__["_input_id"].__set__
+
+
+def input_ids(utxo_ids: Iterable[UtxoId]) -> List[Id]:
+    """
+    Returns the input ids of many UTXO ids, e.g. of a whole wallet, in one loop. The ids are cached on the UTXO ids
+    like with `UtxoId.input_id`.
+    """
+    sha256 = hashlib.sha256
+    pack_output_idx = _OUTPUT_IDX.pack
+
+    result = []
+    for utxo_id in utxo_ids:
+        tx_id = utxo_id.id.value
+        output_idx = utxo_id.output_idx.value
+        cached = getattr(utxo_id, "_input_id", None)
+        if cached is not None and cached[1] == output_idx and cached[0] == tx_id:
+            result.append(cached[2])
+            continue
+
+        input_id = construct_trusted(Id, {"value": sha256(pack_output_idx(output_idx) + tx_id).digest()})
+        _set_input_id(utxo_id, (tx_id, output_idx, input_id))
+        result.append(input_id)
+
+    return result
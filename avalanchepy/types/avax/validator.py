@@ -1,34 +1,48 @@
-from typing import ClassVar, Tuple
+from typing import ClassVar
 
 from pydantic import BaseModel
 
+from avalanchepy.types.layout import U64, Layout, fixed_bytes
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.primitives.node_id import NodeId
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.primitives.node_id import NODE_ID_LEN, NodeId
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 
 class Validator(BaseModel, Seder):
     _type: ClassVar[TypeSymbols] = TypeSymbols.Validator
 
+    _layout: ClassVar[Layout] = Layout(
+        ("node_id", fixed_bytes(NODE_ID_LEN)),
+        ("start_time", U64),
+        ("end_time", U64),
+        ("weight", U64),
+    )
+
     node_id: NodeId
     start_time: Long
     end_time: Long
     weight: Long
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Validator", bytes]:
-        (node_id, data) = NodeId.deserialize(data, codec)
-        (start_time, data) = Long.deserialize(data, codec)
-        (end_time, data) = Long.deserialize(data, codec)
-        (weight, data) = Long.deserialize(data, codec)
-
-        return Validator(node_id=node_id, start_time=start_time, end_time=end_time, weight=weight), data
+    def read(reader: Reader, codec: Codec) -> "Validator":
+        return Validator.from_layout(codec, *Validator._layout.unpack(reader))
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = self.node_id.serialize(codec)
-        data += self.start_time.serialize(codec)
-        data += self.end_time.serialize(codec)
-        data += self.weight.serialize(codec)
-
-        return data
+    @staticmethod
+    def from_layout(codec: Codec, node_id: bytes, start_time: int, end_time: int, weight: int) -> "Validator":
+        return codec.build(
+            Validator,
+            node_id=codec.build(NodeId, value=node_id),
+            start_time=Long.of(start_time),
+            end_time=Long.of(end_time),
+            weight=Long.of(weight),
+        )
+
+    def layout_values(self) -> tuple:
+        return (self.node_id.value, self.start_time.value, self.end_time.value, self.weight.value)
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Validator._layout.pack_into(writer, *self.layout_values())
+
+    def serialized_size(self, codec: Codec) -> int:
+        return Validator._layout.size
@@ -11,8 +11,10 @@ from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
-from avalanchepy.types.primitives.short import Short
-from avalanchepy.types.seder import Codec
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.short import DEFAULT_CODEC_VERSION  # noqa: F401
+from avalanchepy.types.seder import INTERN_POOL_SIZE, Codec, InternPool
 
 # based on https://github.com/ava-labs/avalanchejs/blob/06c8738c726ea774b26b54ce8dbdc6588fe137f6/src/serializable/pvm/codec.ts#L30 # noqa: E501
 # now contains only relevant types
@@ -44,4 +46,9 @@ AVM_CODEC = Codec(
     + [Secp256k1OutputOwners]  # 11
 )
 
-DEFAULT_CODEC_VERSION = Short(value=0)
+
+def address_id_pool(max_size: int = INTERN_POOL_SIZE) -> InternPool:
+    """
+    Returns a pool sharing the decoded addresses and ids, e.g. for `PVM_CODEC.with_intern_pool(address_id_pool())`.
+    """
+    return InternPool((Address, Id), max_size)
@@ -34,7 +34,7 @@ class DeserializationError(SederError):
 
     @staticmethod
     def invalid_size(actual: int, expected: int) -> "DeserializationError":
-        return DeserializationError(f"Invalid data size. expected {expected}, actual: {actual}")
+        return InsufficientDataError(f"Invalid data size. expected {expected}, actual: {actual}")
 
     def __str__(self):
         """
@@ -47,6 +47,13 @@ class DeserializationError(SederError):
         return f"DeserializationError: {self.message}"
 
 
+class InsufficientDataError(DeserializationError):
+    """Raised when the data ends before the value being read, i.e. the data may be valid but incomplete."""
+
+    def __init__(self, message_or_exception):
+        super().__init__(message_or_exception)
+
+
 class SerializationError(SederError):
     def __init__(self, message_or_exception):
         super().__init__(message_or_exception)
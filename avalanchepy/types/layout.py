@@ -0,0 +1,86 @@
+import struct
+from typing import Tuple
+
+from avalanchepy.types.errors import SerializationError
+from avalanchepy.types.seder import Reader, Writer
+
+# struct format codes of the fixed-width fields, all encoded big-endian
+U16 = "H"
+U32 = "I"
+U64 = "Q"
+
+
+def fixed_bytes(length: int) -> str:
+    return f"{length}s"
+
+
+class Layout:
+    """
+    A declarative run of contiguous fixed-width fields, compiled once into a `struct.Struct`.
+
+    A Seder type describes the fixed-width prefix of its encoding as a Layout and reads or writes the whole run
+    with a single `unpack_from`/`pack` call instead of going field by field.
+
+    Attributes:
+        fields (Tuple[Tuple[str, str], ...]): The (name, struct format) pairs, in encoding order.
+        struct (struct.Struct): The compiled plan.
+        size (int): The encoded size of the run in bytes.
+    """
+
+    __slots__ = ("fields", "struct", "size", "_byte_fields")
+
+    fields: Tuple[Tuple[str, str], ...]
+    struct: struct.Struct
+    size: int
+
+    def __init__(self, *fields: Tuple[str, str]):
+        self.fields = fields
+        self.struct = struct.Struct(">" + "".join(fmt for _, fmt in fields))
+        self.size = self.struct.size
+        # (position, length) of the `fixed_bytes` fields, which struct would pad or truncate silently
+        self._byte_fields = tuple((i, struct.calcsize(fmt)) for (i, (_, fmt)) in enumerate(fields) if fmt.endswith("s"))
+
+    def unpack(self, reader: Reader) -> tuple:
+        reader.ensure(self.size)
+
+        values = self.struct.unpack_from(reader.view, reader.offset)
+        reader.offset += self.size
+        return values
+
+    def pack_into(self, writer: Writer, *values):
+        """
+        Raises:
+            SerializationError: If a `fixed_bytes` value is not of the field's length.
+        """
+        for i, length in self._byte_fields:
+            if len(values[i]) != length:
+                raise SerializationError(
+                    f"Invalid {self.fields[i][0]} size. expected {length}, actual: {len(values[i])}"
+                )
+
+        writer.write(self.struct.pack(*values))
+
+
+def unpack_array(reader: Reader, fmt: str, length: int) -> tuple:
+    """
+    Reads `length` consecutive values of the same fixed-width format in one call.
+
+    Args:
+        reader (Reader): The reader positioned at the first element.
+        fmt (str): The struct format of a single element, e.g. `U32`.
+        length (int): The number of elements.
+
+    Returns:
+        tuple: The decoded values.
+    """
+    array_fmt = f">{length}{fmt}"
+    size = struct.calcsize(array_fmt)
+    reader.ensure(size)
+
+    values = struct.unpack_from(array_fmt, reader.view, reader.offset)
+    reader.offset += size
+    return values
+
+
+def pack_array(writer: Writer, fmt: str, values: list):
+    writer.write(struct.pack(f">{len(values)}{fmt}", *values))
@@ -1,18 +1,44 @@
-from typing import Annotated, ClassVar, Tuple
-
-from pydantic import AfterValidator, BaseModel, ConfigDict, model_serializer
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Annotated, ClassVar, Iterable, List, Optional, Tuple
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    SerializationInfo,
+    model_serializer,
+)
 
 from avalanchepy.types.errors import DeserializationError, SerializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.utils import (
-    decode_bech32_to_bytes,
-    encode_bech32_to_str,
+    BECH32_CHARSET,
+    BECH32_CHECKSUM_LEN,
+    BECH32_SEP,
+    bech32_hrp_checksum,
+    bech32_polymod,
     validate_bytes_length,
 )
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer, construct_trusted
 
 ADDRESS_LEN = 20
 ADDRESS_SEP = "-"
+DEFAULT_CHAIN_ID = "P"
+DEFAULT_HRP = "fuji"
+# the key of the `AddressCodec` to serialize addresses with in a `model_dump` context
+ADDRESS_CODEC_CONTEXT = "address_codec"
+# addresses kept by each `AddressCodec`, enough for the owners of a large wallet
+ADDRESS_CACHE_SIZE = 16384
+# codecs shared by `AddressCodec.of`, the least recently used one is dropped beyond
+ADDRESS_CODEC_COUNT = 16
+
+# an address is 32 bech32 words of 5 bits, followed by the checksum
+_ADDRESS_WORDS = ADDRESS_LEN * 8 // 5
+_ADDRESS_SHIFTS = range((_ADDRESS_WORDS - 1) * 5, -1, -5)
+_CHECKSUM_SHIFTS = range((BECH32_CHECKSUM_LEN - 1) * 5, -1, -5)
+_CHECKSUM_PADDING = BECH32_CHECKSUM_LEN * [0]
+_BECH32_VALUES = {c: value for (value, c) in enumerate(BECH32_CHARSET)}
 
 
 class Address(BaseModel, Seder):
@@ -22,42 +48,47 @@ class Address(BaseModel, Seder):
     value: Annotated[bytes, AfterValidator(lambda x: validate_bytes_length(x, ADDRESS_LEN))]
 
     @model_serializer(return_type=str)
-    def model_serialize(self) -> str:
-        return self.to_json()
+    def model_serialize(self, info: SerializationInfo) -> str:
+        address_codec = info.context.get(ADDRESS_CODEC_CONTEXT) if info.context else None
+        if address_codec is None:
+            return self.to_json()
+        return address_codec.encode(self)
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Address", bytes]:
-        if len(data) < ADDRESS_LEN:
-            raise DeserializationError.invalid_size(len(data), ADDRESS_LEN)
+    def read(reader: Reader, codec: Codec) -> "Address":
+        return codec.build(Address, value=reader.read_bytes(ADDRESS_LEN))
 
-        return Address(value=data[0:ADDRESS_LEN]), data[ADDRESS_LEN:]
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write(self.value)
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value
+    def serialized_size(self, codec: Codec) -> int:
+        return ADDRESS_LEN
 
-    def to_json(self, chain_id="P", hrp="fuji") -> str:
+    def to_json(self, chain_id=DEFAULT_CHAIN_ID, hrp=DEFAULT_HRP) -> str:
         return self.to_string(chain_id, hrp)
 
     def to_string(self, chain_id: str, hrp: str) -> str:
-        try:
-            bech32_encoded_address = encode_bech32_to_str(hrp, self.value)
-        except Exception:
-            raise SerializationError("Failed to bech32 encode address")
-
-        return f"{chain_id}{ADDRESS_SEP}{bech32_encoded_address}"
+        return AddressCodec.of(chain_id, hrp).encode(self)
 
     @staticmethod
     def from_string(data: str) -> "Address":
+        """
+        Decodes an address of any chain and hrp, see `AddressCodec.decode` to only accept those of one chain.
+        """
         parts = data.split(ADDRESS_SEP, 2)
         if len(parts) != 2:
             raise DeserializationError(f"Invalid address format: {data}")
 
-        try:
-            _, addr = decode_bech32_to_bytes(parts[1])
-        except Exception:
-            raise DeserializationError(f"Failed to decode with bech32: {data}")
+        (hrp, _, _) = parts[1].lower().rpartition(BECH32_SEP)
+        address_codec = _shared_codec(parts[0], hrp)
+        if address_codec is not None:
+            return address_codec.decode(data)
 
-        return Address(value=addr)
+        # the chain id and hrp come from the input, their codec is only shared once an address of them decodes
+        address_codec = AddressCodec(parts[0], hrp)
+        address = address_codec.decode(data)
+        _share_codec(address_codec)
+        return address
 
     # Implement __hash__ to make the object hashable
     def __hash__(self):
@@ -80,9 +111,124 @@ class Address(BaseModel, Seder):
         Returns:
             bool: True if the other object is an Address with the same value, False otherwise.
         """
+        if other is self:
+            return True
         if not isinstance(other, Address):
             return False
         return self.value == other.value
 
 
 ADDRESS_EMPTY = Address(value=bytes(ADDRESS_LEN * [0]))
+
+
+class AddressCodec:
+    """
+    The string form of the addresses of a chain, e.g. "P-fuji1...".
+
+    The hrp part of the bech32 checksum is computed once per codec, and the last `cache_size` encoded and decoded
+    addresses are cached, as the same owners come up in every UTXO and RPC request of a wallet.
+
+    Attributes:
+        chain_id (str): The chain alias addresses are prefixed with, e.g. "P".
+        hrp (str): The human readable part of the bech32 encoding, e.g. "fuji" or "avax".
+    """
+
+    __slots__ = ("chain_id", "hrp", "_prefix", "_hrp_checksum", "_encode_value", "_decode_string")
+
+    chain_id: str
+    hrp: str
+
+    def __init__(self, chain_id: str, hrp: str, cache_size: int = ADDRESS_CACHE_SIZE):
+        self.chain_id = chain_id
+        self.hrp = hrp
+        self._prefix = chain_id + ADDRESS_SEP + hrp + BECH32_SEP
+        self._hrp_checksum = bech32_hrp_checksum(hrp)
+        self._encode_value = lru_cache(maxsize=cache_size)(self._encode_uncached)
+        self._decode_string = lru_cache(maxsize=cache_size)(self._decode_uncached)
+
+    @staticmethod
+    def of(chain_id: str, hrp: str) -> "AddressCodec":
+        """
+        Returns the codec shared by all the callers of a chain id and hrp, along with its caches. The last
+        `ADDRESS_CODEC_COUNT` codecs used are shared.
+        """
+        address_codec = _shared_codec(chain_id, hrp)
+        if address_codec is None:
+            address_codec = AddressCodec(chain_id, hrp)
+            _share_codec(address_codec)
+        return address_codec
+
+    def encode(self, address: Address) -> str:
+        return self._encode_value(address.value)
+
+    def decode(self, data: str) -> Address:
+        """
+        Decodes an address, raising a DeserializationError if it is not one of this chain and hrp.
+        """
+        return construct_trusted(Address, {"value": self._decode_string(data)})
+
+    def encode_many(self, addresses: Iterable[Address]) -> List[str]:
+        encode_value = self._encode_value
+        return [encode_value(address.value) for address in addresses]
+
+    def decode_many(self, data: Iterable[str]) -> List[Address]:
+        decode_string = self._decode_string
+        return [construct_trusted(Address, {"value": decode_string(string)}) for string in data]
+
+    def cache_clear(self):
+        self._encode_value.cache_clear()
+        self._decode_string.cache_clear()
+
+    def _encode_uncached(self, value: bytes) -> str:
+        if len(value) != ADDRESS_LEN:
+            raise SerializationError("Failed to bech32 encode address")
+
+        number = int.from_bytes(value, byteorder="big")
+        words = [(number >> shift) & 31 for shift in _ADDRESS_SHIFTS]
+        checksum = bech32_polymod(words + _CHECKSUM_PADDING, self._hrp_checksum) ^ 1
+        words += [(checksum >> shift) & 31 for shift in _CHECKSUM_SHIFTS]
+
+        return self._prefix + "".join([BECH32_CHARSET[word] for word in words])
+
+    def _decode_uncached(self, data: str) -> bytes:
+        parts = data.split(ADDRESS_SEP, 2)
+        if len(parts) != 2:
+            raise DeserializationError(f"Invalid address format: {data}")
+        if parts[0] != self.chain_id:
+            raise DeserializationError(f"Invalid chain id, expected {self.chain_id}: {data}")
+
+        # bech32 strings are either lower or upper case, mixed case ones fail on the upper case characters
+        encoded = parts[1].lower() if parts[1].isupper() else parts[1]
+        (hrp, _, encoded_words) = encoded.rpartition(BECH32_SEP)
+        if hrp != self.hrp:
+            raise DeserializationError(f"Invalid hrp, expected {self.hrp}: {data}")
+
+        try:
+            words = [_BECH32_VALUES[c] for c in encoded_words]
+        except KeyError:
+            raise DeserializationError(f"Failed to decode with bech32: {data}")
+        if len(words) != _ADDRESS_WORDS + BECH32_CHECKSUM_LEN or bech32_polymod(words, self._hrp_checksum) != 1:
+            raise DeserializationError(f"Failed to decode with bech32: {data}")
+
+        number = 0
+        for word in words[:_ADDRESS_WORDS]:
+            number = number << 5 | word
+        return number.to_bytes(ADDRESS_LEN, byteorder="big")
+
+
+# the shared codecs by chain id and hrp, from the least to the most recently used
+_ADDRESS_CODECS: "OrderedDict[Tuple[str, str], AddressCodec]" = OrderedDict()
+
+
+def _shared_codec(chain_id: str, hrp: str) -> Optional[AddressCodec]:
+    key = (chain_id, hrp)
+    address_codec = _ADDRESS_CODECS.get(key)
+    if address_codec is not None:
+        _ADDRESS_CODECS.move_to_end(key)
+    return address_codec
+
+
+def _share_codec(address_codec: AddressCodec):
+    _ADDRESS_CODECS[(address_codec.chain_id, address_codec.hrp)] = address_codec
+    if len(_ADDRESS_CODECS) > ADDRESS_CODEC_COUNT:
+        _ADDRESS_CODECS.popitem(last=False)
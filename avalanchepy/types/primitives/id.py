@@ -1,15 +1,14 @@
-from typing import Annotated, ClassVar, Tuple
+from typing import Annotated, ClassVar, Iterable, List
 
 from pydantic import AfterValidator, BaseModel, model_serializer
 
-from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.utils import (
     Base58Check,
     pad_left,
     validate_bytes_length,
 )
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 ID_LEN = 32
 
@@ -23,23 +22,34 @@ class Id(BaseModel, Seder):
         return self.to_json()
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Id", bytes]:
-        if len(data) < ID_LEN:
-            raise DeserializationError.invalid_size(len(data), ID_LEN)
+    def read(reader: Reader, codec: Codec) -> "Id":
+        return codec.build(Id, value=reader.read_bytes(ID_LEN))
 
-        return Id(value=data[:ID_LEN]), data[ID_LEN:]
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write(pad_left(self.value, ID_LEN))
 
-    def serialize(self, codec: Codec) -> bytes:
-        return pad_left(self.value, ID_LEN)
+    def serialized_size(self, codec: Codec) -> int:
+        return ID_LEN
 
     @staticmethod
-    def from_string(value: str) -> "Id":
-        raw = Base58Check.decode(value)
+    def from_string(value: str, verify: bool = False) -> "Id":
+        raw = Base58Check.decode(value, verify)
         return Id(value=raw)
 
     def to_string(self) -> str:
         return Base58Check.encode(self.value)
 
+    @staticmethod
+    def from_strings(values: Iterable[str], verify: bool = False) -> List["Id"]:
+        """
+        Decodes many ids, verifying their checksums at once if `verify` is set, see `Base58Check.decode_many`.
+        """
+        return [Id(value=raw) for raw in Base58Check.decode_many(values, verify)]
+
+    @staticmethod
+    def to_strings(ids: Iterable["Id"]) -> List[str]:
+        return Base58Check.encode_many(id.value for id in ids)
+
     def to_json(self) -> str:
         return self.to_string()
 
@@ -62,6 +72,8 @@ class Id(BaseModel, Seder):
         Returns:
             bool: True if the other object is an Id with the same value, False otherwise.
         """
+        if other is self:
+            return True
         if not isinstance(other, Id):
             return NotImplemented
         return self.value == other.value
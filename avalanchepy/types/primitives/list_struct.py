@@ -2,7 +2,7 @@ from typing import Generic, List, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, model_serializer
 
-from avalanchepy.types.seder import Codec, Int, Serializable
+from avalanchepy.types.seder import INT_LEN, Codec, Int, Reader, Serializable, Writer
 
 
 class Combined(Serializable, BaseModel):
@@ -26,19 +26,34 @@ class ListStruct(BaseModel, Generic[T]):
     def model_serialize(self) -> List[T]:
         return self.list
 
-    def serialize(self, codec: Codec) -> bytes:
-        data = Int(value=len(self.list)).serialize(codec)
+    def serialize_into(self, writer: Writer, codec: Codec):
+        Int(value=len(self.list)).serialize_into(writer, codec)
         for el in self.list:
-            data += el.serialize(codec)
+            el.serialize_into(writer, codec)
 
-        return data
+    def serialize(self, codec: Codec) -> bytes:
+        writer = Writer()
+        self.serialize_into(writer, codec)
+        return writer.getvalue()
 
-    def pack_list(self, codec: Codec) -> bytes:
-        data = Int(value=len(self.list)).serialize(codec)
+    def serialized_size(self, codec: Codec) -> int:
+        return INT_LEN + sum(el.serialized_size(codec) for el in self.list)
+
+    def pack_list_into(self, writer: Writer, codec: Codec):
+        Int(value=len(self.list)).serialize_into(writer, codec)
         for el in self.list:
-            data += codec.pack_prefix(el)
+            codec.pack_prefix_into(writer, el)
 
-        return data
+    def pack_list(self, codec: Codec) -> bytes:
+        writer = Writer()
+        self.pack_list_into(writer, codec)
+        return writer.getvalue()
+
+    def pack_list_size(self, codec: Codec) -> int:
+        """
+        Returns the length of `pack_list(codec)`.
+        """
+        return INT_LEN + sum(codec.prefixed_size(el) for el in self.list)
 
     def append(self, item: T):
         self.list.append(item)
@@ -84,12 +99,14 @@ class ListStruct(BaseModel, Generic[T]):
 D = TypeVar("D", bound=Combined)
 
 
-def deserialize_list(type: Type[D], data: bytes, codec: Codec) -> Tuple["ListStruct[D]", bytes]:
-    (length, data) = Int.deserialize(data, codec)
+def read_list(type: Type[D], reader: Reader, codec: Codec) -> "ListStruct[D]":
+    length = Int.read(reader, codec)
 
-    list: List[D] = []
-    for _ in range(length.value):
-        (el, data) = type.deserialize(data, codec)
-        list.append(el)
+    list: List[D] = [type.read(reader, codec) for _ in range(length.value)]
+    return ListStruct[D].model_construct(list=list)
 
-    return ListStruct[D].model_construct(list=list), data
+
+def deserialize_list(type: Type[D], data: bytes, codec: Codec) -> Tuple["ListStruct[D]", bytes]:
+    reader = Reader(data)
+    list = read_list(type, reader, codec)
+    return list, reader.rest()
@@ -1,33 +1,22 @@
-from typing import Tuple
-
-from pydantic import BaseModel, Field, model_serializer
-
-from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, FixedUInt, Reader
 
 LONG_LEN = 8
 
 
 # analog: bigintptr.ts
-class Long(BaseModel, Seder):
+class Long(FixedUInt):
+    __slots__ = ()
+
     _type = TypeSymbols.BigIntPr
-    value: int = Field(ge=0, lt=2 ** (8 * LONG_LEN))
+    _len = LONG_LEN
 
-    @model_serializer(return_type=str)
     def model_serialize(self) -> str:
         return self.to_json()
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Long", bytes]:
-        if len(data) < LONG_LEN:
-            raise DeserializationError.invalid_size(len(data), LONG_LEN)
-
-        value = int.from_bytes(data[0:LONG_LEN], byteorder="big")
-        return Long(value=value), data[LONG_LEN:]
-
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value.to_bytes(LONG_LEN, byteorder="big")
+    def read(reader: Reader, codec: Codec) -> "Long":
+        return Long.of(reader.read_uint(LONG_LEN))
 
     def to_json(self) -> str:
         return str(self.value)
@@ -46,6 +35,8 @@ class Long(BaseModel, Seder):
             return NotImplemented
         return self.value == other.value
 
+    __hash__ = FixedUInt.__hash__
+
     def __lt__(self, other: "Long") -> bool:
         """
         Define how Long instances should be compared for sorting.
@@ -84,7 +75,7 @@ class Long(BaseModel, Seder):
         Returns:
             Long: A new Long instance with the result of the subtraction.
         """
-        return Long(value=self.value - other.value)
+        return Long(self.value - other.value)
 
     def __add__(self, other: "Long") -> "Long":
         """
@@ -96,4 +87,4 @@ class Long(BaseModel, Seder):
         Returns:
             Long: A new Long instance with the result of the addition.
         """
-        return Long(value=self.value + other.value)
+        return Long(self.value + other.value)
@@ -1,12 +1,10 @@
-from typing import Annotated, ClassVar, Tuple
+from typing import Annotated, ClassVar, Iterable, List
 
-import base58
 from pydantic import AfterValidator, BaseModel, ConfigDict, model_serializer
 
-from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
 from avalanchepy.types.primitives.utils import Base58Check, validate_bytes_length
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, Reader, Seder, Writer
 
 NODE_ID_LEN = 20
 NODE_ID_SEP = "-"
@@ -24,28 +22,44 @@ class NodeId(BaseModel, Seder):
         return self.to_json()
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["NodeId", bytes]:
-        if len(data) < NODE_ID_LEN:
-            raise DeserializationError.invalid_size(len(data), NODE_ID_LEN)
+    def read(reader: Reader, codec: Codec) -> "NodeId":
+        return codec.build(NodeId, value=reader.read_bytes(NODE_ID_LEN))
 
-        return NodeId(value=data[0:NODE_ID_LEN]), data[NODE_ID_LEN:]
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write(self.value)
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value
+    def serialized_size(self, codec: Codec) -> int:
+        return NODE_ID_LEN
 
     @staticmethod
-    def from_string(data: str) -> "NodeId":
+    def from_string(data: str, verify: bool = False) -> "NodeId":
+        raw = Base58Check.decode(NodeId._strip_prefix(data), verify)
+        return NodeId(value=raw)
+
+    def to_json(self) -> str:
+        return NODE_ID_PREFIX + NODE_ID_SEP + Base58Check.encode(self.value)
+
+    @staticmethod
+    def from_strings(data: Iterable[str], verify: bool = False) -> List["NodeId"]:
+        """
+        Decodes many node ids, verifying their checksums at once if `verify` is set, see `Base58Check.decode_many`.
+        """
+        raws = Base58Check.decode_many([NodeId._strip_prefix(string) for string in data], verify)
+        return [NodeId(value=raw) for raw in raws]
+
+    @staticmethod
+    def to_strings(node_ids: Iterable["NodeId"]) -> List[str]:
+        return [NODE_ID_PREFIX + NODE_ID_SEP + string for string in Base58Check.encode_many(n.value for n in node_ids)]
+
+    @staticmethod
+    def _strip_prefix(data: str) -> str:
         parts = data.split(NODE_ID_SEP, 2)
         if len(parts) != 2:
             raise ValueError(f"Invalid node id format: {data}")
         if parts[0] != NODE_ID_PREFIX:
             raise ValueError(f"Invalid node id prefix: {NODE_ID_PREFIX}")
 
-        raw = base58.b58decode(parts[1])[:-4]
-        return NodeId(value=raw)
-
-    def to_json(self) -> str:
-        return f"{NODE_ID_PREFIX}{NODE_ID_SEP}{Base58Check.encode(self.value)}"
+        return parts[1]
 
     # Implement __hash__ to make the object hashable
     def __hash__(self):
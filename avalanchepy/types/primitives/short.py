@@ -1,25 +1,19 @@
-from typing import Tuple
-
-from pydantic import BaseModel, Field
-
-from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.constants import TypeSymbols
-from avalanchepy.types.seder import Codec, Seder
+from avalanchepy.types.seder import Codec, FixedUInt, Reader
 
 SHORT_LEN = 2
 
 
-class Short(BaseModel, Seder):
+class Short(FixedUInt):
+    __slots__ = ()
+
     _type = TypeSymbols.Short
-    value: int = Field(ge=0, lt=2 ** (8 * SHORT_LEN))
+    _len = SHORT_LEN
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> Tuple["Short", bytes]:
-        if len(data) < SHORT_LEN:
-            raise DeserializationError.invalid_size(len(data), SHORT_LEN)
+    def read(reader: Reader, codec: Codec) -> "Short":
+        return Short.of(reader.read_uint(SHORT_LEN))
 
-        value = int.from_bytes(data[0:SHORT_LEN], byteorder="big")
-        return Short(value=value), data[SHORT_LEN:]
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value.to_bytes(SHORT_LEN, byteorder="big")
+# the codec version every encoded tx and UTXO starts with
+DEFAULT_CODEC_VERSION = Short(value=0)
@@ -1,5 +1,7 @@
 import hashlib
-from typing import Tuple
+import operator
+from functools import lru_cache, reduce
+from typing import Iterable, List, Tuple
 
 import base58
 import bech32
@@ -25,6 +27,38 @@ def encode_bech32_to_str(hrp: str, bits: bytes) -> str:
     return bech32.bech32_encode(hrp, words)
 
 
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_SEP = "1"
+BECH32_CHECKSUM_LEN = 6
+# the xor of the bech32 generators selected by each value of the top 5 bits of the checksum
+_BECH32_GENERATORS = [
+    reduce(
+        operator.xor,
+        (gen for (i, gen) in enumerate((0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)) if (b >> i) & 1),
+        0,
+    )
+    for b in range(32)
+]
+
+
+def bech32_polymod(values: Iterable[int], checksum: int = 1) -> int:
+    """
+    Continues the bech32 checksum `checksum` with `values`, 5 bits each. Starting from the checksum of an expanded
+    hrp, the checksum of the hrp is computed once per hrp rather than once per string.
+    """
+    generators = _BECH32_GENERATORS
+    for value in values:
+        checksum = ((checksum & 0x1FFFFFF) << 5 ^ value) ^ generators[checksum >> 25]
+    return checksum
+
+
+def bech32_hrp_checksum(hrp: str) -> int:
+    """
+    Returns the bech32 checksum of an expanded hrp, the start of the checksum of every string with this hrp.
+    """
+    return bech32_polymod([ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp])
+
+
 def validate_bytes_length(value: bytes, expected_length: int) -> bytes:
     if len(value) != expected_length:
         raise ValueError(f"Invalid data size. expected {expected_length}, actual: {len(value)}")
@@ -32,14 +66,64 @@ def validate_bytes_length(value: bytes, expected_length: int) -> bytes:
     return value
 
 
+BASE58_CHECKSUM_LEN = 4
+# string forms kept by `Base58Check`, enough for the ids of a few large UTXO or transaction exports
+BASE58_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=BASE58_CACHE_SIZE)
+def _b58check_encode(data: bytes) -> str:
+    checksum = hashlib.sha256(data).digest()[-BASE58_CHECKSUM_LEN:]
+    return base58.b58encode(data + checksum).decode()
+
+
+@lru_cache(maxsize=BASE58_CACHE_SIZE)
+def _b58check_decode(string: str) -> Tuple[bytes, bool]:
+    decoded = base58.b58decode(string)
+    data = decoded[:-BASE58_CHECKSUM_LEN]
+    return (data, hashlib.sha256(data).digest()[-BASE58_CHECKSUM_LEN:] == decoded[-BASE58_CHECKSUM_LEN:])
+
+
 class Base58Check:
+    """
+    Base58 with a 4 bytes sha256 checksum, the string form of ids. The last `BASE58_CACHE_SIZE` encodings and
+    decodings are cached, as the same ids come up again and again, e.g. the asset and transaction ids of UTXOs.
+    """
+
     @staticmethod
     def encode(data: bytes) -> str:
-        checksum = hashlib.sha256(data).digest()[-4:]
-        return base58.b58encode(data + checksum).decode()
+        return _b58check_encode(data)
+
+    @staticmethod
+    def decode(string: str, verify: bool = False) -> bytes:
+        """
+        Returns the data encoded in `string`, raising a ValueError if `verify` is set and the checksum is invalid.
+        """
+        (data, valid) = _b58check_decode(string)
+        if verify and not valid:
+            raise ValueError(f"Invalid checksum: {string}")
+
+        return data
+
+    @staticmethod
+    def encode_many(values: Iterable[bytes]) -> List[str]:
+        return [_b58check_encode(data) for data in values]
+
+    @staticmethod
+    def decode_many(strings: Iterable[str], verify: bool = False) -> List[bytes]:
+        """
+        Decodes many strings and, if `verify` is set, checks all checksums at once, raising a ValueError listing
+        every invalid string.
+        """
+        decoded = [(string, _b58check_decode(string)) for string in strings]
+        if verify:
+            invalid = [string for (string, (_, valid)) in decoded if not valid]
+            if invalid:
+                raise ValueError(f"Invalid checksum for {len(invalid)} of {len(decoded)} strings: {', '.join(invalid)}")
+
+        return [data for (_, (data, _)) in decoded]
 
     @staticmethod
-    def decode(string: str) -> bytes:
-        # skipping verification
-        decoded = base58.b58decode(string)
-        return decoded[:-4]
+    def cache_clear():
+        _b58check_encode.cache_clear()
+        _b58check_decode.cache_clear()
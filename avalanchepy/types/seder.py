@@ -1,73 +1,549 @@
 from __future__ import annotations
 
-from typing import ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
+import json
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+from pydantic_core import core_schema
+
+from avalanchepy.types.errors import (
+    DeserializationError,
+    InsufficientDataError,
+    SerializationError,
+)
+from avalanchepy.types.primitives.constants import TypeSymbols
 
-from pydantic import BaseModel, Field, model_serializer
 
-from avalanchepy.types.errors import DeserializationError, SerializationError
-from avalanchepy.types.primitives.constants import TypeSymbols
+class Writer:
+    """
+    An append-only output buffer.
+
+    A single writer is passed down the whole object tree, so every field is appended in place and the final
+    bytes are produced with one allocation.
+
+    Attributes:
+        buffer (bytearray): The bytes written so far.
+    """
+
+    __slots__ = ("buffer",)
+
+    buffer: bytearray
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data: bytes | bytearray | memoryview):
+        self.buffer += data
+
+    def write_uint(self, value: int, length: int):
+        self.buffer += value.to_bytes(length, byteorder="big")
+
+    def getvalue(self) -> bytes:
+        return bytes(self.buffer)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
 
 
 class Serializable:
+    __slots__ = ()
+
     _type: ClassVar[TypeSymbols]
 
-    def serialize(self, codec: Codec) -> bytes:
+    def serialize_into(self, writer: Writer, codec: Codec):
         raise NotImplementedError()
 
+    def serialize(self, codec: Codec) -> bytes:
+        writer = Writer()
+        self.serialize_into(writer, codec)
+        return writer.getvalue()
+
+    def serialized_size(self, codec: Codec) -> int:
+        """
+        Returns the length of `serialize(codec)`.
+
+        The types of this package compute it from their fields without encoding anything, this fallback encodes.
+        """
+        return len(self.serialize(codec))
+
+
+class Reader:
+    """
+    A cursor over a binary buffer.
+
+    The buffer is wrapped in a `memoryview`, so reading a field only copies the bytes of that field and
+    never the unread remainder of the buffer.
+
+    Attributes:
+        view (memoryview): The underlying buffer.
+        offset (int): The position of the next unread byte.
+    """
+
+    __slots__ = ("view", "offset")
+
+    view: memoryview
+    offset: int
+
+    def __init__(self, data: bytes | bytearray | memoryview, offset: int = 0):
+        self.view = data if isinstance(data, memoryview) else memoryview(data)
+        self.offset = offset
+
+    def remaining(self) -> int:
+        return len(self.view) - self.offset
+
+    def ensure(self, length: int):
+        if self.remaining() < length:
+            raise DeserializationError.invalid_size(self.remaining(), length)
+
+    def read_bytes(self, length: int) -> bytes:
+        self.ensure(length)
+
+        start = self.offset
+        self.offset += length
+        return self.view[start : self.offset].tobytes()
+
+    def read_uint(self, length: int) -> int:
+        self.ensure(length)
+
+        start = self.offset
+        self.offset += length
+        return int.from_bytes(self.view[start : self.offset], byteorder="big")
+
+    def rest(self) -> bytes:
+        return self.view[self.offset :].tobytes()
+
 
 class Deserializable:
+    __slots__ = ()
+
     @staticmethod
-    def deserialize(data: bytes, codec: Codec):
+    def read(reader: Reader, codec: Codec):
         raise NotImplementedError()
 
+    @classmethod
+    def deserialize(cls, data: bytes, codec: Codec):
+        reader = Reader(data)
+        deserialized = cls.read(reader, codec)
+        return deserialized, reader.rest()
+
 
 class Seder(Serializable, Deserializable):
-    pass
+    __slots__ = ()
 
 
 T = TypeVar("T", bound=Serializable)
 
 
+M = TypeVar("M", bound=BaseModel)
+
+# the per-instance state of a pydantic model, the slots `construct_trusted` writes
+PYDANTIC_MODEL_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+# False if the installed pydantic keeps other state, `construct_trusted` then falls back to `model_construct`
+PYDANTIC_SLOTS_MATCH = getattr(BaseModel, "__slots__", None) == PYDANTIC_MODEL_SLOTS
+
+# setters of the per-instance pydantic state slots
+_set_model_dict = object.__setattr__
+if PYDANTIC_SLOTS_MATCH:
+    _set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+    _set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+    _set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def construct_trusted(model: Type[M], fields: dict) -> M:
+    """
+    Creates a model instance from already validated field values.
+
+    Equivalent to `model.model_construct(**fields)` for models with every field set, but writes the instance
+    state directly, which makes it cheaper than both `model_construct` and a validated constructor call. Falls back
+    to `model_construct` if the installed pydantic doesn't keep its state in `PYDANTIC_MODEL_SLOTS`.
+    """
+    if not PYDANTIC_SLOTS_MATCH or model.__private_attributes__:
+        return model.model_construct(**fields)
+
+    instance = object.__new__(model)
+    _set_model_dict(instance, "__dict__", fields)
+    _set_fields_set(instance, set(fields))
+    _set_extra(instance, None)
+    _set_private(instance, None)
+    return instance
+
+
+# distinct values kept per type by an `InternPool`
+INTERN_POOL_SIZE = 65536
+
+
+class InternPool:
+    """
+    Canonical instances of value types, e.g. `Id` and `Address`, shared by everything a codec decodes.
+
+    The same few owner addresses and asset ids repeat across all the UTXOs of a wallet. Decoded through a pool, each
+    distinct value is a single instance, so memory grows with the number of distinct values rather than with the
+    number of UTXOs, and comparing two of them is an identity check. Once `max_size` values of a type are pooled,
+    new ones are no longer added but still decoded, which bounds the pool when values rarely repeat, e.g. tx ids.
+
+    The shared instances must not be modified.
+
+    Attributes:
+        max_size (int): The maximum number of values pooled per type.
+    """
+
+    __slots__ = ("max_size", "_values")
+
+    max_size: int
+    _values: Dict[type, Dict[Any, BaseModel]]
+
+    def __init__(self, types: Iterable[Type[BaseModel]], max_size: int = INTERN_POOL_SIZE):
+        """
+        Args:
+            types (Iterable[Type[BaseModel]]): The types to intern, each with a single `value` field.
+            max_size (int): The maximum number of values pooled per type.
+        """
+        self.max_size = max_size
+        self._values = {}
+        for model in types:
+            if set(model.model_fields) != {"value"}:
+                raise ValueError(f"Only types with a single value field can be interned: {model.__name__}")
+            self._values[model] = {}
+
+    def build(self, model: Type[M], fields: dict, trusted: bool) -> M:
+        """
+        Returns the pooled instance of `fields`, creating it like `Codec.build` if it isn't pooled yet.
+        """
+        values = self._values.get(model)
+        if values is None:
+            return construct_trusted(model, fields) if trusted else model(**fields)
+
+        value = fields["value"]
+        instance = values.get(value)
+        if instance is None:
+            instance = construct_trusted(model, fields) if trusted else model(**fields)
+            if len(values) < self.max_size:
+                values[value] = instance
+        return instance
+
+    def clear(self):
+        for values in self._values.values():
+            values.clear()
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._values.values())
+
+
+# slots of the per-instance caches of a Frozen variant, to be declared by every concrete variant class
+FROZEN_SLOTS = ("_encodings", "_hash")
+
+
+class Frozen(Serializable):
+    """
+    Mixin for immutable variants of Seder values.
+
+    Listed before the mutable type, e.g. `class FrozenTransferableOutput(Frozen, TransferableOutput)`, it forbids
+    reassigning fields, encodes the value at most once per codec and caches its hash. Nested values aren't
+    copied, so they must not be mutated once they are part of a frozen value either.
+
+    Frozen variants of models compare equal to instances of the mutable model with the same fields.
+    """
+
+    __slots__ = ()
+
+    def serialize(self, codec: Codec) -> bytes:
+        try:
+            encodings = self._encodings
+        except AttributeError:
+            encodings = {}
+            _object_setattr(self, "_encodings", encodings)
+
+        data = encodings.get(codec)
+        if data is None:
+            writer = Writer()
+            self.encode_into(writer, codec)
+            data = encodings[codec] = writer.getvalue()
+
+        return data
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write(self.serialize(codec))
+
+    def encode_into(self, writer: Writer, codec: Codec):
+        """
+        Encodes the value, bypassing the cache. Defaults to `serialize_into` of the mutable type.
+        """
+        super().serialize_into(writer, codec)
+
+    def serialized_size(self, codec: Codec) -> int:
+        try:
+            data = self._encodings.get(codec)
+        except AttributeError:
+            data = None
+
+        return len(data) if data is not None else self.encoded_size(codec)
+
+    def encoded_size(self, codec: Codec) -> int:
+        """
+        Computes the size of `encode_into`. Defaults to `serialized_size` of the mutable type.
+        """
+        return super().serialized_size(codec)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(self, BaseModel) or not isinstance(other, BaseModel):
+            return NotImplemented
+        return _mutable_type(type(self)) is _mutable_type(type(other)) and self.__dict__ == other.__dict__
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        if isinstance(self, BaseModel):
+            value = hash(tuple(_hash_key(field) for field in self.__dict__.values()))
+        else:
+            # without fields based equality, equal means identical
+            value = object.__hash__(self)
+        _object_setattr(self, "_hash", value)
+        return value
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+_object_setattr = object.__setattr__
+
+
+def _mutable_type(cls: type) -> type:
+    return next(base for base in cls.__mro__ if not issubclass(base, Frozen))
+
+
+def _hash_key(value):
+    # equal values give equal keys, the types are left out as they only matter for collisions
+    if isinstance(value, BaseModel) and type(value).__hash__ is None:
+        return tuple(_hash_key(field) for field in value.__dict__.values())
+    if isinstance(value, list):
+        return tuple(_hash_key(el) for el in value)
+
+    return value
+
+
+# defaults of `Codec.iter_read`
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_MAX_RECORD_SIZE = 1024 * 1024
+
+
 class Codec(Seder):
+    """
+    Maps the type ids of polymorphic elements to their types.
+
+    The 4-byte prefix of every registered class is computed once, so encoding a polymorphic element is a dict
+    lookup by class and decoding one is a list lookup by the raw type id, neither allocates a model.
+
+    Attributes:
+        type_id_to_type (List[Optional[Seder]]): The registered types, indexed by type id.
+        type_to_type_id (Dict[TypeSymbols, int]): The type ids, keyed by the type symbols of the registered types.
+        class_to_type_id (Dict[type, int]): The type ids, keyed by class.
+        class_to_prefix (Dict[type, bytes]): The encoded type ids, keyed by class.
+        trusted (bool): Whether decoded objects skip validation, see `as_trusted`.
+        intern_pool (Optional[InternPool]): The pool decoded values are shared through, see `with_intern_pool`.
+    """
+
     _type = TypeSymbols.Codec
     type_id_to_type: List[Optional[Seder]]
     type_to_type_id: Dict[TypeSymbols, int]
-
-    def __init__(self, type_id_to_type: List[Optional[Seder]]):
+    class_to_type_id: Dict[type, int]
+    class_to_prefix: Dict[type, bytes]
+    trusted: bool
+    intern_pool: Optional[InternPool]
+
+    def __init__(
+        self,
+        type_id_to_type: List[Optional[Seder]],
+        trusted: bool = False,
+        intern_pool: Optional[InternPool] = None,
+    ):
         self.type_id_to_type = type_id_to_type
         self.type_to_type_id = {}
+        self.class_to_type_id = {}
+        self.class_to_prefix = {}
+        self.trusted = trusted
+        self.intern_pool = intern_pool
 
         for i, value in enumerate(type_id_to_type):
             if value is None:
                 continue
 
             self.type_to_type_id[value._type.value] = i
+            self.class_to_type_id[value] = i
+            self.class_to_prefix[value] = i.to_bytes(INT_LEN, byteorder="big")
+
+    def as_trusted(self) -> "Codec":
+        """
+        Returns a codec with the same types that decodes in trusted mode.
+
+        In trusted mode decoded objects are assembled with `model_construct`, skipping pydantic validation and
+        the type assertions of the decoders. Field sizes are still enforced by the `Reader`, so this is meant for
+        input that is known to be well-formed, e.g. responses of a trusted node.
+        """
+        return Codec(self.type_id_to_type, trusted=True, intern_pool=self.intern_pool)
+
+    def with_intern_pool(self, intern_pool: InternPool) -> "Codec":
+        """
+        Returns a codec with the same types that decodes the values of `intern_pool`'s types as shared instances.
+        """
+        return Codec(self.type_id_to_type, trusted=self.trusted, intern_pool=intern_pool)
+
+    def build(self, model: Type[M], **fields) -> M:
+        if self.intern_pool is not None:
+            return self.intern_pool.build(model, fields, self.trusted)
+        if self.trusted:
+            return construct_trusted(model, fields)
+
+        return model(**fields)
+
+    def type_id_of(self, ser: T) -> int:
+        try:
+            return self.class_to_type_id[type(ser)]
+        except KeyError:
+            return self._register_class(type(ser))
+
+    def prefix_of(self, ser: T) -> bytes:
+        """
+        Returns the encoded type id of an element.
+        """
+        try:
+            return self.class_to_prefix[type(ser)]
+        except KeyError:
+            self._register_class(type(ser))
+            return self.class_to_prefix[type(ser)]
+
+    def _register_class(self, cls: type) -> int:
+        # subclasses of registered types, e.g. frozen variants, are encoded as the type they share a symbol with
+        if cls._type not in self.type_to_type_id:
+            raise SerializationError(f"TypeSymbol: {cls._type} id doesn't exist.")
+
+        type_id = self.type_to_type_id[cls._type]
+        self.class_to_type_id[cls] = type_id
+        self.class_to_prefix[cls] = type_id.to_bytes(INT_LEN, byteorder="big")
+        return type_id
+
+    def pack_prefix_into(self, writer: Writer, ser: T):
+        writer.write(self.prefix_of(ser))
+        ser.serialize_into(writer, self)
+
+    def prefixed_size(self, ser: T) -> int:
+        """
+        Returns the length of `pack_prefix(ser)`.
+        """
+        return INT_LEN + ser.serialized_size(self)
 
     def pack_prefix(self, ser: T) -> bytes:
-        if ser._type not in self.type_to_type_id:
-            raise SerializationError(f"TypeSymbol: {ser._type} id doesn't exist.")
-
-        type_id = self.type_to_type_id[ser._type]
-        prefix = Int(value=type_id).serialize(self)
-        data = ser.serialize(self)
-
-        return prefix + data
-
-    def unpack_prefix(self, buf: bytes) -> (T, bytes):
-        (type_id, buf) = unpack(buf, Int, self)
-        if type_id.value >= len(self.type_id_to_type) or type_id.value < 0:
-            raise DeserializationError(f"Invalid typeId: {type_id.value}")
-
-        type = self.type_id_to_type[type_id.value]
+        writer = Writer()
+        self.pack_prefix_into(writer, ser)
+        return writer.getvalue()
+
+    def read_type(self, type_id: int, reader: Reader) -> T:
+        """
+        Reads the body of an element whose type id has already been consumed, e.g. as part of a `Layout`.
+        """
+        if type_id >= len(self.type_id_to_type) or type_id < 0:
+            raise DeserializationError(f"Invalid typeId: {type_id}")
+
+        type = self.type_id_to_type[type_id]
         if type is None:
             raise DeserializationError(f"Can't find type for typeId: {type_id}")
 
-        (object, rest) = type.deserialize(buf, self)
-        return (object, rest)
+        return type.read(reader, self)
 
-    def serialize(self, codec: Codec) -> bytes:
+    def read_prefix(self, reader: Reader) -> T:
+        return self.read_type(reader.read_uint(INT_LEN), reader)
+
+    def unpack_prefix(self, buf: bytes) -> (T, bytes):
+        if len(buf) == 0:
+            raise ValueError("Empty buffer")
+
+        reader = Reader(buf)
+        object = self.read_prefix(reader)
+        return (object, reader.rest())
+
+    def iter_read(
+        self,
+        stream: BinaryIO,
+        read: Callable[[Reader, "Codec"], T],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        max_record_size: int = STREAM_MAX_RECORD_SIZE,
+    ) -> Iterator[T]:
+        """
+        Decodes back-to-back records from a binary stream, one at a time.
+
+        The stream is read in chunks of `chunk_size` bytes and only the undecoded tail is buffered, so memory stays
+        bounded by `chunk_size + max_record_size` however long the stream is. A record that doesn't fit the buffered
+        bytes yet is decoded again once the next chunk is read.
+
+        Args:
+            stream (BinaryIO): Any readable binary stream, e.g. a file, a pipe or `socket.makefile("rb")`.
+            read (Callable[[Reader, Codec], T]): Reads a single record, e.g. `Utxo.read`. The records must not keep
+                references to the reader's buffer, which is reused.
+            chunk_size (int): The number of bytes to read from the stream at once.
+            max_record_size (int): The size above which an incomplete record is considered malformed.
+
+        Yields:
+            T: The decoded records, in order.
+
+        Raises:
+            DeserializationError: If a record is malformed, larger than `max_record_size` or cut off by the end of
+                the stream.
+        """
+        buffer = bytearray()
+        start = 0
+        eof = False
+        while True:
+            if start < len(buffer):
+                try:
+                    # the view is released before the buffer is resized
+                    with memoryview(buffer) as view:
+                        reader = Reader(view, start)
+                        record = read(reader, self)
+                        start = reader.offset
+                except InsufficientDataError as e:
+                    if eof:
+                        raise DeserializationError(f"Stream ends within a record: {e.message}") from e
+                    if len(buffer) - start >= max_record_size:
+                        raise DeserializationError(f"Record exceeds {max_record_size} bytes") from e
+                else:
+                    yield record
+                    continue
+            elif eof:
+                return
+
+            del buffer[:start]
+            start = 0
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buffer += chunk
+            else:
+                eof = True
+
+    def serialize_into(self, writer: Writer, codec: Codec):
         raise NotImplementedError("not implemented")
 
+    @staticmethod
+    def read(reader: Reader, codec: "Codec"):
+        return codec.read_prefix(reader)
+
     @staticmethod
     def deserialize(data: bytes, codec: "Codec"):
         return codec.unpack_prefix(data)
@@ -88,24 +564,134 @@ def unpack(
     return res, buffer
 
 
+class FixedUInt(Seder):
+    """
+    An immutable unsigned integer encoded in a fixed number of big-endian bytes.
+
+    The base of the `Int`, `Long`, `Short` and `Byte` primitives. Instances hold a single slot, so they are far
+    smaller and cheaper to create than a model, and can still be used as pydantic model fields.
+
+    Attributes:
+        value (int): The wrapped integer.
+    """
+
+    __slots__ = ("value",)
+
+    _len: ClassVar[int]
+
+    value: int
+
+    def __new__(cls, value: int):
+        if not isinstance(value, int):
+            raise ValueError(f"{cls.__name__} value must be an int, got {type(value).__name__}")
+        if value < 0 or value >> (8 * cls._len):
+            raise ValueError(f"{cls.__name__} value out of range: {value}")
+
+        return cls.of(value)
+
+    @classmethod
+    def of(cls: Type[U], value: int) -> U:
+        """
+        Wraps a value that is already known to be in range, e.g. one just read from `_len` bytes.
+        """
+        return _wrap(cls, value)
+
+    def serialize_into(self, writer: Writer, codec: Codec):
+        writer.write_uint(self.value, self._len)
+
+    def serialized_size(self, codec: Codec) -> int:
+        return self._len
+
+    def model_serialize(self):
+        return {"value": self.value}
+
+    def model_dump(self, **kwargs):
+        return self.model_serialize()
+
+    def model_dump_json(self, **kwargs) -> str:
+        return json.dumps(self.model_serialize())
+
+    @classmethod
+    def _validate(cls, value):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict) and value.keys() == {"value"}:
+            return cls(value["value"])
+
+        raise ValueError(f"Expected {cls.__name__}, got {type(value).__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler) -> core_schema.CoreSchema:
+        # instances are matched without calling into python, other input goes through `_validate`
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), core_schema.no_info_plain_validator_function(cls._validate)],
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.model_serialize()),
+        )
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.value))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(value={self.value})"
+
+
+U = TypeVar("U", bound=FixedUInt)
+
+# writes the slot of a new instance, bypassing the immutable __setattr__
+_set_value = FixedUInt.value.__set__
+
+
+def _wrap(cls: Type[U], value: int) -> U:
+    instance = object.__new__(cls)
+    _set_value(instance, value)
+    return instance
+
+
 INT_LEN = 4
 
+# ints below this are shared instances, which covers address indices, thresholds and type ids
+SMALL_INT_CACHE_SIZE = 256
+
+
+class Int(FixedUInt):
+    __slots__ = ()
 
-class Int(BaseModel, Seder):
     _type = TypeSymbols.Int
-    value: int = Field(ge=0, lt=2 ** (8 * INT_LEN))
+    _len = INT_LEN
+
+    @classmethod
+    def of(cls, value: int) -> "Int":
+        if value < SMALL_INT_CACHE_SIZE and cls is Int:
+            return _SMALL_INTS[value]
+
+        return _wrap(cls, value)
 
-    @model_serializer(return_type=int)
     def model_serialize(self) -> int:
         return self.value
 
     @staticmethod
-    def deserialize(data: bytes, codec: Codec) -> ["Int", bytes]:
-        if len(data) < INT_LEN:
-            raise DeserializationError.invalid_size(len(data), INT_LEN)
+    def read(reader: Reader, codec: Codec) -> "Int":
+        return Int.of(reader.read_uint(INT_LEN))
 
-        value = int.from_bytes(data[0:INT_LEN], byteorder="big")
-        return Int(value=value), data[INT_LEN:]
 
-    def serialize(self, codec: Codec) -> bytes:
-        return self.value.to_bytes(INT_LEN, byteorder="big")
+_SMALL_INTS: List[Int] = [_wrap(Int, value) for value in range(SMALL_INT_CACHE_SIZE)]
@@ -1,25 +1,31 @@
-from typing import Dict, List
+from typing import List, Union
 
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
-from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.avax.utxo_index import UtxoIndex
 from avalanchepy.types.primitives.address import ADDRESS_EMPTY, Address
-from avalanchepy.types.primitives.id import Id
 
 
 class Signable:
-    def get_signers(self, input_utxos: List[Utxo]) -> List[Address]:
+    def get_signers(self, input_utxos: Union[List[UtxoLike], UtxoIndex]) -> List[Address]:
         raise NotImplementedError("Signeable.get_signers() is not implemented")
 
     @staticmethod
-    def extract_signers(input_utxos: List[Utxo], transferable_inputs: List[TransferableInput]) -> List[List[Address]]:
+    def extract_signers(
+        input_utxos: Union[List[UtxoLike], UtxoIndex], transferable_inputs: List[TransferableInput]
+    ) -> List[List[Address]]:
+        """
+        Returns the addresses signing each input. The UTXOs can be given as an index kept across calls, e.g. for all
+        the transactions spending a wallet, rather than a list indexed again on every call.
+        """
         inputs_signers: List[List[Address]] = len(transferable_inputs) * [[]]
-        utxo_dict: Dict[Id, Utxo] = {utxo.utxo_id.input_id(): utxo for utxo in input_utxos}
+        utxo_index = input_utxos if isinstance(input_utxos, UtxoIndex) else UtxoIndex(input_utxos)
         for i, transferable_input in enumerate(transferable_inputs):
             input_id = transferable_input.utxo_id.input_id()
-            if input_id not in utxo_dict:
+            utxo = utxo_index.get(input_id)
+            if utxo is None:
                 raise KeyError(f"UTXO with input_id {input_id} not found")
 
-            utxo = utxo_dict[input_id]
             output_owners = utxo.get_output_owners()
 
             input = transferable_input.input
@@ -1,40 +1,87 @@
-from typing import Tuple, Type, TypeVar
+from typing import BinaryIO, Iterator, Tuple, Type, TypeVar
 
 from avalanchepy.types.codecs import DEFAULT_CODEC_VERSION
 from avalanchepy.types.errors import DeserializationError
 from avalanchepy.types.primitives.short import Short
-from avalanchepy.types.seder import Codec, Seder, Serializable
+from avalanchepy.types.seder import (
+    STREAM_CHUNK_SIZE,
+    Codec,
+    Reader,
+    Seder,
+    Serializable,
+    Writer,
+)
 
 S = TypeVar("S", bound=Serializable)
 
 
+def pack_codec_into(writer: Writer, codec: Codec, ser: S):
+    DEFAULT_CODEC_VERSION.serialize_into(writer, codec)
+    codec.pack_prefix_into(writer, ser)
+
+
+def pack_codec_direct_into(writer: Writer, codec: Codec, ser: S):
+    DEFAULT_CODEC_VERSION.serialize_into(writer, codec)
+    ser.serialize_into(writer, codec)
+
+
 def pack_codec(codec: Codec, ser: S) -> bytes:
-    return DEFAULT_CODEC_VERSION.serialize(codec) + codec.pack_prefix(ser)
+    writer = Writer()
+    pack_codec_into(writer, codec, ser)
+    return writer.getvalue()
 
 
 def pack_codec_direct(codec: Codec, ser: S) -> bytes:
-    return DEFAULT_CODEC_VERSION.serialize(codec) + ser.serialize(codec)
+    writer = Writer()
+    pack_codec_direct_into(writer, codec, ser)
+    return writer.getvalue()
 
 
 D = TypeVar("D", bound=Seder)
 
 
-def unpack_codec(der: Type[D], codec: Codec, data: bytes) -> Tuple[D, bytes]:
-    codec_version, data = Short.deserialize(data, codec)
+def read_codec_version(reader: Reader, codec: Codec):
+    codec_version = Short.read(reader, codec)
     if codec_version.value != DEFAULT_CODEC_VERSION.value:
-        raise DeserializationError("Unsupported codec version: {codec_version}")
+        raise DeserializationError(f"Unsupported codec version: {codec_version.value}")
+
 
-    deserialized, data = codec.unpack_prefix(data)
+def read_codec(der: Type[D], codec: Codec, reader: Reader) -> D:
+    read_codec_version(reader, codec)
+
+    deserialized = codec.read_prefix(reader)
     if not isinstance(deserialized, der):
         raise DeserializationError(f"Unexpected type: expected {der._type}, got {deserialized._type}")
 
-    return deserialized, data
+    return deserialized
+
+
+def read_codec_direct(der: Type[D], codec: Codec, reader: Reader) -> D:
+    read_codec_version(reader, codec)
+    return der.read(reader, codec)
+
+
+def unpack_codec(der: Type[D], codec: Codec, data: bytes) -> Tuple[D, bytes]:
+    reader = Reader(data)
+    deserialized = read_codec(der, codec, reader)
+    return deserialized, reader.rest()
 
 
 def unpack_codec_direct(der: Type[D], codec: Codec, data: bytes) -> Tuple[D, bytes]:
-    codec_version, data = Short.deserialize(data, codec)
-    if codec_version.value != DEFAULT_CODEC_VERSION.value:
-        raise DeserializationError("Unsupported codec version: {codec_version}")
+    reader = Reader(data)
+    deserialized = read_codec_direct(der, codec, reader)
+    return deserialized, reader.rest()
+
+
+def iter_codec(der: Type[D], codec: Codec, stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[D]:
+    """
+    Decodes a stream of records written with `pack_codec`, see `Codec.iter_read`.
+    """
+    return codec.iter_read(stream, lambda reader, codec: read_codec(der, codec, reader), chunk_size)
+
 
-    deserialized, data = der.deserialize(data, codec)
-    return deserialized, data
+def iter_codec_direct(der: Type[D], codec: Codec, stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[D]:
+    """
+    Decodes a stream of records written with `pack_codec_direct`, e.g. a UTXO dump, see `Codec.iter_read`.
+    """
+    return codec.iter_read(stream, lambda reader, codec: read_codec_direct(der, codec, reader), chunk_size)
@@ -0,0 +1,47 @@
+"""
+Runs the codec benchmarks, prints throughput, latency and allocations and optionally saves them as JSON.
+
+Usage:
+    python -m benchmarks.codec [--quick] [--only utxo,tx,string] [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+
+from benchmarks.codec.fixtures import INPUT_COUNTS, UTXO_COUNTS
+from benchmarks.codec.runner import compare_results, load_results, save_results
+from benchmarks.codec.suite import run
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.codec", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller fixtures and fewer runs, for a smoke test")
+    parser.add_argument("--only", help="comma separated groups to run: utxo, tx, string")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark, the best one is reported")
+    parser.add_argument("--output", help="path of the JSON file to save the results to")
+    parser.add_argument("--label", help="label stored with the results, e.g. a version or commit")
+    parser.add_argument("--compare", help="path of saved results to compare against")
+    args = parser.parse_args()
+
+    groups = set(args.only.split(",")) if args.only else None
+    results = []
+    for result in run(
+        utxo_counts=UTXO_COUNTS[:2] if args.quick else UTXO_COUNTS,
+        input_counts=INPUT_COUNTS[:2] if args.quick else INPUT_COUNTS,
+        repeat=1 if args.quick else args.repeat,
+        select=lambda group: groups is None or group in groups,
+    ):
+        print(result, flush=True)
+        results.append(result)
+
+    if args.output:
+        save_results(args.output, results, args.label)
+        print(f"saved {len(results)} results to {args.output}")
+
+    if args.compare:
+        print(f"compared to {args.compare}")
+        for line in compare_results(load_results(args.compare), results):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
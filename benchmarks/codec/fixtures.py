@@ -0,0 +1,135 @@
+"""
+Synthetic, deterministic fixtures at realistic sizes for the codec benchmarks.
+"""
+
+from typing import List
+
+from avalanchepy.types.avax.base_tx import BaseTx
+from avalanchepy.types.avax.credential import Credential
+from avalanchepy.types.avax.inputs.secp256k1_signature import (
+    SECP256K1_SIGNATURE_LEN,
+    Secp256k1Signature,
+)
+from avalanchepy.types.avax.inputs.secp256k1_transfer_input import (
+    Secp256k1TransferInput,
+)
+from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.signed_tx import SignedTx
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.codecs import DEFAULT_CODEC_VERSION, PVM_CODEC
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
+from avalanchepy.types.primitives.byte import Byte
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
+
+# a single UTXO, a getUTXOs page and a large wallet
+UTXO_COUNTS = (1, 100, 10_000)
+# from a plain transfer up to a consolidation of many small UTXOs
+INPUT_COUNTS = (1, 10, 100, 500)
+
+ASSET_ID = Id(value=bytes(range(ID_LEN)))
+BLOCKCHAIN_ID = Id(value=bytes(ID_LEN))
+OWNERS = Secp256k1OutputOwners(
+    locktime=Long(value=0),
+    threshold=Int(value=1),
+    addresses=ListStruct[Address](list=[Address(value=bytes([i]) * ADDRESS_LEN) for i in range(2)]),
+)
+
+
+def make_utxo(i: int) -> Utxo:
+    """
+    Returns the i-th UTXO of a wallet, every fourth one stakeable.
+    """
+    output = Secp256k1TransferOutput(amount=Long(value=10**9 + i), output_owners=OWNERS)
+    if i % 4 == 0:
+        output = StakeableLockOut(locktime=Long(value=i), transferable_output=output)
+
+    return Utxo(
+        utxo_id=UtxoId(id=Id(value=i.to_bytes(ID_LEN, byteorder="big")), output_idx=Int(value=i % 8)),
+        asset_id=ASSET_ID,
+        output=output,
+    )
+
+
+def make_utxos(count: int) -> List[Utxo]:
+    return [make_utxo(i) for i in range(count)]
+
+
+def make_page(count: int) -> List[bytes]:
+    """
+    Returns the encodings of `count` UTXOs, without the codec version.
+    """
+    return [utxo.serialize(PVM_CODEC) for utxo in make_utxos(count)]
+
+
+def make_hex_page(page: List[bytes]) -> List[str]:
+    """
+    Returns the UTXOs as `platform.getUTXOs` lists them: hex with a 0x prefix and the codec version.
+    """
+    version = DEFAULT_CODEC_VERSION.serialize(PVM_CODEC)
+    return ["0x" + (version + data).hex() for data in page]
+
+
+def make_base_tx(input_count: int) -> BaseTx:
+    """
+    Returns a transaction spending `input_count` UTXOs into a single output.
+    """
+    inputs = [
+        TransferableInput(
+            utxo_id=UtxoId(id=Id(value=i.to_bytes(ID_LEN, byteorder="big")), output_idx=Int(value=i % 8)),
+            asset_id=ASSET_ID,
+            input=Secp256k1TransferInput(
+                amount=Long(value=10**9 + i), address_indices=ListStruct[Int](list=[Int(value=0)])
+            ),
+        )
+        for i in range(input_count)
+    ]
+    output = TransferableOutput(
+        asset_id=ASSET_ID,
+        output=Secp256k1TransferOutput(amount=Long(value=input_count * 10**9), output_owners=OWNERS),
+    )
+
+    return BaseTx(
+        network_id=Int(value=1),
+        blockchain_id=BLOCKCHAIN_ID,
+        outputs=ListStruct[TransferableOutput](list=[output]),
+        inputs=ListStruct[TransferableInput](list=inputs),
+        memo=ListStruct[Byte].empty(),
+    )
+
+
+def make_credentials(input_count: int) -> ListStruct[Credential]:
+    """
+    Returns one credential with a single signature per input.
+    """
+    return ListStruct[Credential](
+        list=[
+            Credential(
+                signatures=ListStruct[Secp256k1Signature](
+                    list=[Secp256k1Signature(value=bytes([i % 256]) * SECP256K1_SIGNATURE_LEN)]
+                )
+            )
+            for i in range(input_count)
+        ]
+    )
+
+
+def make_signed_tx(input_count: int) -> SignedTx:
+    return SignedTx(make_base_tx(input_count), make_credentials(input_count))
+
+
+def make_ids(count: int) -> List[Id]:
+    return [Id(value=(i * 7919).to_bytes(ID_LEN, byteorder="big")) for i in range(count)]
+
+
+def make_addresses(count: int) -> List[Address]:
+    return [Address(value=(i * 7919).to_bytes(ADDRESS_LEN, byteorder="big")) for i in range(count)]
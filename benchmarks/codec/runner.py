@@ -0,0 +1,165 @@
+"""
+Measures a benchmark and stores the results as JSON.
+"""
+
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BenchmarkResult:
+    """
+    The measurements of one benchmark.
+
+    Attributes:
+        name (str): The name of the benchmark, e.g. "utxo.deserialize".
+        params (Dict[str, int]): The fixture size, e.g. {"utxos": 100}.
+        ops (int): The number of operations in one call of the benchmark.
+        seconds (float): The best time of one call.
+        peak_bytes (int): The peak of memory allocated during one call.
+        allocated_blocks (int): The memory blocks still allocated after one call, i.e. held by its result.
+    """
+
+    name: str
+    params: Dict[str, int]
+    ops: int
+    seconds: float
+    peak_bytes: int
+    allocated_blocks: int
+
+    def __init__(
+        self, name: str, params: Dict[str, int], ops: int, seconds: float, peak_bytes: int, allocated_blocks: int
+    ):
+        self.name = name
+        self.params = params
+        self.ops = ops
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+        self.allocated_blocks = allocated_blocks
+
+    @property
+    def key(self) -> str:
+        return self.name + "".join(f"[{key}={value}]" for (key, value) in self.params.items())
+
+    @property
+    def throughput(self) -> float:
+        """
+        Operations per second.
+        """
+        return self.ops / self.seconds
+
+    @property
+    def latency_us(self) -> float:
+        """
+        Microseconds per operation.
+        """
+        return self.seconds / self.ops * 1e6
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "ops": self.ops,
+            "seconds": self.seconds,
+            "throughput": self.throughput,
+            "latency_us": self.latency_us,
+            "peak_bytes": self.peak_bytes,
+            "allocated_blocks": self.allocated_blocks,
+        }
+
+    @staticmethod
+    def from_json(data: Dict[str, Any]) -> "BenchmarkResult":
+        return BenchmarkResult(
+            name=data["name"],
+            params=data["params"],
+            ops=data["ops"],
+            seconds=data["seconds"],
+            peak_bytes=data["peak_bytes"],
+            allocated_blocks=data["allocated_blocks"],
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key:<40} {self.throughput:>14,.0f} op/s {self.latency_us:>12.2f} us/op "
+            f"{self.peak_bytes / 1024:>12,.1f} KiB peak {self.allocated_blocks:>10,} blocks"
+        )
+
+
+def measure(name: str, fn: Callable[[], Any], ops: int, repeat: int = 5, **params: int) -> BenchmarkResult:
+    """
+    Measures a benchmark.
+
+    The time is the best of `repeat` runs, each calling `fn` as often as `timeit` needs for a stable reading.
+    Allocations are traced in a separate call, so tracing doesn't slow down the timed runs.
+
+    Args:
+        name (str): The name of the benchmark.
+        fn (Callable[[], Any]): Runs `ops` operations.
+        ops (int): The number of operations in one call of `fn`.
+        repeat (int): The number of timed runs.
+        **params (int): The fixture size.
+
+    Returns:
+        BenchmarkResult: The measurements.
+    """
+    timer = timeit.Timer(fn)
+    (number, _) = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = fn()
+        (_, peak_bytes) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    allocated_blocks = sys.getallocatedblocks() - blocks
+    del result
+
+    return BenchmarkResult(name, params, ops, seconds, peak_bytes, max(allocated_blocks, 0))
+
+
+def save_results(path: str, results: List[BenchmarkResult], label: Optional[str] = None):
+    """
+    Saves results with the environment they were measured in.
+    """
+    data = {
+        "label": label,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [result.to_json() for result in results],
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path) as file:
+        return [BenchmarkResult.from_json(result) for result in json.load(file)["results"]]
+
+
+def compare_results(baseline: List[BenchmarkResult], results: List[BenchmarkResult]) -> List[str]:
+    """
+    Returns one line per benchmark present in both runs with the change in latency and peak memory, e.g. to compare
+    the results of two versions.
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+
+    lines = []
+    for result in results:
+        before = baseline_by_key.get(result.key)
+        if before is None:
+            continue
+
+        latency = result.latency_us / before.latency_us - 1
+        peak = result.peak_bytes / before.peak_bytes - 1 if before.peak_bytes else 0.0
+        lines.append(f"{result.key:<40} latency {latency:>+8.1%}   peak memory {peak:>+8.1%}")
+
+    return lines
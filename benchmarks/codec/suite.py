@@ -0,0 +1,142 @@
+"""
+The codec benchmarks: UTXO decoding, transaction encoding, transaction ids and the string forms of ids and addresses.
+"""
+
+from typing import Callable, Iterator, Sequence
+
+from avalanchepy.types.avax.base_tx import BaseTx
+from avalanchepy.types.avax.signed_tx import SignedTx
+from avalanchepy.types.avax.utxo import Utxo, decode_utxos
+from avalanchepy.types.codecs import PVM_CODEC, address_id_pool
+from avalanchepy.types.primitives.address import Address, AddressCodec
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.utils import Base58Check
+from benchmarks.codec.fixtures import (
+    INPUT_COUNTS,
+    UTXO_COUNTS,
+    make_addresses,
+    make_base_tx,
+    make_credentials,
+    make_hex_page,
+    make_ids,
+    make_page,
+    make_utxos,
+)
+from benchmarks.codec.runner import BenchmarkResult, measure
+
+STRING_COUNT = 1000
+CHAIN_ID = "P"
+HRP = "fuji"
+
+
+def utxo_benchmarks(utxo_counts: Sequence[int], repeat: int) -> Iterator[BenchmarkResult]:
+    trusted_codec = PVM_CODEC.as_trusted()
+    for count in utxo_counts:
+        utxos = make_utxos(count)
+        page = make_page(count)
+        hex_page = make_hex_page(page)
+
+        yield measure(
+            "utxo.deserialize",
+            lambda: [Utxo.deserialize(data, PVM_CODEC) for data in page],
+            count,
+            repeat,
+            utxos=count,
+        )
+        yield measure(
+            "utxo.deserialize.trusted",
+            lambda: [Utxo.deserialize(data, trusted_codec) for data in page],
+            count,
+            repeat,
+            utxos=count,
+        )
+        yield measure("utxo.decode_utxos", lambda: decode_utxos(hex_page, PVM_CODEC), count, repeat, utxos=count)
+        # a fresh pool per run, as a wallet decoding its UTXOs once
+        yield measure(
+            "utxo.decode_utxos.interned",
+            lambda: decode_utxos(hex_page, PVM_CODEC.with_intern_pool(address_id_pool())),
+            count,
+            repeat,
+            utxos=count,
+        )
+        yield measure(
+            "utxo.serialize", lambda: [utxo.serialize(PVM_CODEC) for utxo in utxos], count, repeat, utxos=count
+        )
+
+
+def tx_benchmarks(input_counts: Sequence[int], repeat: int) -> Iterator[BenchmarkResult]:
+    for count in input_counts:
+        base_tx = make_base_tx(count)
+        credentials = make_credentials(count)
+        data = base_tx.serialize(PVM_CODEC)
+
+        yield measure("base_tx.serialize", lambda: base_tx.serialize(PVM_CODEC), 1, repeat, inputs=count)
+        yield measure("base_tx.deserialize", lambda: BaseTx.deserialize(data, PVM_CODEC), 1, repeat, inputs=count)
+        # signed transactions cache their encoding, a fresh one measures the first id()
+        yield measure("signed_tx.id", lambda: SignedTx(base_tx, credentials).id(), 1, repeat, inputs=count)
+
+
+def string_benchmarks(repeat: int) -> Iterator[BenchmarkResult]:
+    ids = make_ids(STRING_COUNT)
+    id_strings = [id.to_string() for id in ids]
+    addresses = make_addresses(STRING_COUNT)
+    address_strings = [address.to_string(CHAIN_ID, HRP) for address in addresses]
+
+    # ids are cached after their first encoding or decoding, the cold runs start from an empty cache
+    yield measure(
+        "id.to_string.cold",
+        lambda: (Base58Check.cache_clear(), [id.to_string() for id in ids]),
+        STRING_COUNT,
+        repeat,
+    )
+    yield measure("id.to_string", lambda: [id.to_string() for id in ids], STRING_COUNT, repeat)
+    yield measure("id.to_strings", lambda: Id.to_strings(ids), STRING_COUNT, repeat)
+    yield measure(
+        "id.from_string.cold",
+        lambda: (Base58Check.cache_clear(), [Id.from_string(s) for s in id_strings]),
+        STRING_COUNT,
+        repeat,
+    )
+    yield measure("id.from_string", lambda: [Id.from_string(s) for s in id_strings], STRING_COUNT, repeat)
+    yield measure("id.from_strings.verify", lambda: Id.from_strings(id_strings, verify=True), STRING_COUNT, repeat)
+    address_codec = AddressCodec.of(CHAIN_ID, HRP)
+    yield measure(
+        "address.to_string.cold",
+        lambda: (address_codec.cache_clear(), [address.to_string(CHAIN_ID, HRP) for address in addresses]),
+        STRING_COUNT,
+        repeat,
+    )
+    yield measure(
+        "address.to_string",
+        lambda: [address.to_string(CHAIN_ID, HRP) for address in addresses],
+        STRING_COUNT,
+        repeat,
+    )
+    yield measure("address.encode_many", lambda: address_codec.encode_many(addresses), STRING_COUNT, repeat)
+    yield measure(
+        "address.from_string.cold",
+        lambda: (address_codec.cache_clear(), [Address.from_string(s) for s in address_strings]),
+        STRING_COUNT,
+        repeat,
+    )
+    yield measure(
+        "address.from_string", lambda: [Address.from_string(s) for s in address_strings], STRING_COUNT, repeat
+    )
+    yield measure("address.decode_many", lambda: address_codec.decode_many(address_strings), STRING_COUNT, repeat)
+
+
+def run(
+    utxo_counts: Sequence[int] = UTXO_COUNTS,
+    input_counts: Sequence[int] = INPUT_COUNTS,
+    repeat: int = 5,
+    select: Callable[[str], bool] = lambda name: True,
+) -> Iterator[BenchmarkResult]:
+    """
+    Runs the benchmarks whose group ("utxo", "tx" or "string") passes `select`, yielding each result once measured.
+    """
+    if select("utxo"):
+        yield from utxo_benchmarks(utxo_counts, repeat)
+    if select("tx"):
+        yield from tx_benchmarks(input_counts, repeat)
+    if select("string"):
+        yield from string_benchmarks(repeat)
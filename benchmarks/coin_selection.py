@@ -0,0 +1,138 @@
+"""
+Compares the coin selection strategies of `TransactionBuilder.spend` on synthetic wallets: the inputs and signed size of
+the delegation txs they build, and the time the selection takes.
+
+Usage:
+    python -m benchmarks.coin_selection [wallet_size] [repeat]
+
+The wallets hold UTXOs of random amounts, most of them small, the way a wallet receiving rewards and payments does.
+"""
+
+import random
+import sys
+import timeit
+from typing import List, Optional, Tuple
+
+from avalanchepy.contants import PRIMARY_NETWORK_ID
+from avalanchepy.transaction_builder import Context, TransactionBuilder
+from avalanchepy.transaction_builder.coin_selection import (
+    BranchAndBound,
+    CoinSelection,
+    LargestFirst,
+    OldestFirst,
+    SmallestSufficient,
+)
+from avalanchepy.transaction_builder.types import SpendOptions
+from avalanchepy.transaction_builder.utils import signed_tx_size
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.types.avax.lazy_utxo import UtxoLike
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.subnet_validator import SubnetValidator
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.avax.validator import Validator
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.primitives.node_id import NODE_ID_LEN, NodeId
+from avalanchepy.types.seder import Int
+from benchmarks.codec.fixtures import ASSET_ID, BLOCKCHAIN_ID, OWNERS
+
+SEED = 1
+# 25 AVAX, the minimum delegation, up to 2000 AVAX
+STAKE_AMOUNTS = (25 * 10**9, 300 * 10**9, 2000 * 10**9)
+MIN_ISSUANCE_TIME = 1000
+
+CONTEXT = Context(avax_asset_id=ASSET_ID, network_id=Int(value=1), p_blockchain_id=BLOCKCHAIN_ID)
+FROM_ADDRESS = OWNERS.addresses.list[0]
+
+
+def make_wallet(size: int, seed: int = SEED) -> List[Utxo]:
+    """
+    Returns `size` UTXOs with amounts from 0.001 to 100 AVAX, spread evenly in magnitude, the i-th created i-th.
+    """
+    rng = random.Random(seed)
+    return [
+        Utxo(
+            utxo_id=UtxoId(id=Id(value=i.to_bytes(ID_LEN, byteorder="big")), output_idx=Int(value=0)),
+            asset_id=ASSET_ID,
+            output=Secp256k1TransferOutput(amount=Long(value=int(10 ** rng.uniform(6, 11))), output_owners=OWNERS),
+        )
+        for i in range(size)
+    ]
+
+
+def creation_order(utxo: UtxoLike) -> int:
+    return int.from_bytes(utxo.utxo_id.id.value, byteorder="big")
+
+
+def strategies() -> List[Tuple[str, Optional[CoinSelection]]]:
+    return [
+        ("set order", None),
+        ("largest first", LargestFirst()),
+        ("smallest sufficient", SmallestSufficient()),
+        ("branch and bound", BranchAndBound()),
+        ("oldest first", OldestFirst(creation_order)),
+    ]
+
+
+def spend_options(coin_selection: Optional[CoinSelection]) -> SpendOptions:
+    return SpendOptions(
+        min_issuance_time=MIN_ISSUANCE_TIME,
+        change_addresses=[FROM_ADDRESS],
+        threshold=1,
+        memo=ListStruct(list=[]),
+        locktime=0,
+        coin_selection=coin_selection,
+    )
+
+
+def delegate(pool: UtxoPool, amount: int, coin_selection: Optional[CoinSelection]) -> Tuple[int, int, int]:
+    """
+    Builds a delegation of `amount` and returns its input count, change output count and signed size.
+    """
+    subnet_validator = SubnetValidator(
+        validator=Validator(
+            node_id=NodeId(value=bytes(NODE_ID_LEN)),
+            start_time=Long(value=0),
+            end_time=Long(value=120),
+            weight=Long(value=amount),
+        ),
+        subnet_id=PRIMARY_NETWORK_ID,
+    )
+    options = spend_options(coin_selection)
+    tx = TransactionBuilder(CONTEXT).build_add_permissionless_delegator_tx(
+        FROM_ADDRESS, pool, subnet_validator, OWNERS, options
+    )
+    inputs = tx.base_tx.inputs.list
+    return len(inputs), len(tx.base_tx.outputs.list), signed_tx_size(tx, inputs)
+
+
+def main(wallet_size: int = 10_000, repeat: int = 5):
+    pool = UtxoPool(make_wallet(wallet_size), from_addresses=[FROM_ADDRESS])
+    fee = CONTEXT.add_primary_network_delegator_fee
+
+    print(f"wallet of {wallet_size} UTXOs, best of {repeat}")
+    for amount in STAKE_AMOUNTS:
+        print(f"delegating {amount / 10**9:g} AVAX")
+        print(f"  {'strategy':<20} {'inputs':>6} {'change':>6} {'bytes':>8} {'spend ms':>9}")
+        for name, coin_selection in strategies():
+            (inputs, change, size) = delegate(pool, amount, coin_selection)
+            options = spend_options(coin_selection)
+            # the amounts are fresh dicts on every run, spend consumes them
+            seconds = min(
+                timeit.repeat(
+                    lambda: TransactionBuilder.spend(
+                        pool, [FROM_ADDRESS], {ASSET_ID: fee}, {ASSET_ID: amount}, options
+                    ),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            print(f"  {name:<20} {inputs:>6} {change:>6} {size:>8} {seconds * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""
+Compares validated and trusted decoding of a synthetic `platform.getUTXOs` page, and times `decode_utxos` on its hex
+encoding.
+
+Usage:
+    python -m benchmarks.utxo_decode [page_size] [repeat]
+
+The fixtures are shared with the codec benchmark suite, see `python -m benchmarks.codec`.
+"""
+
+import sys
+import timeit
+from typing import List
+
+from avalanchepy.types.avax.utxo import Utxo, decode_utxos
+from avalanchepy.types.codecs import PVM_CODEC
+from avalanchepy.types.seder import Codec
+from benchmarks.codec.fixtures import make_hex_page, make_page
+
+
+def decode_page(page: List[bytes], codec: Codec) -> List[Utxo]:
+    return [Utxo.deserialize(data, codec)[0] for data in page]
+
+
+def main(page_size: int = 1024, repeat: int = 5):
+    page = make_page(page_size)
+    trusted_codec = PVM_CODEC.as_trusted()
+    assert decode_page(page, trusted_codec) == decode_page(page, PVM_CODEC)
+
+    validated = min(timeit.repeat(lambda: decode_page(page, PVM_CODEC), number=1, repeat=repeat))
+    trusted = min(timeit.repeat(lambda: decode_page(page, trusted_codec), number=1, repeat=repeat))
+
+    hex_page = make_hex_page(page)
+    assert decode_utxos(hex_page, PVM_CODEC) == decode_page(page, PVM_CODEC)
+    hex_decode = min(timeit.repeat(lambda: decode_utxos(hex_page, PVM_CODEC), number=1, repeat=repeat))
+
+    print(f"page of {page_size} UTXOs, best of {repeat}")
+    print(f"validated: {validated * 1000:8.2f} ms ({page_size / validated:10.0f} utxo/s)")
+    print(f"trusted:   {trusted * 1000:8.2f} ms ({page_size / trusted:10.0f} utxo/s)")
+    print(f"speedup:   {validated / trusted:8.2f}x")
+    print(f"hex page:  {hex_decode * 1000:8.2f} ms ({page_size / hex_decode:10.0f} utxo/s)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -11,11 +11,27 @@ from avalanchepy.models.p_models import (
     GetTimestampeResponse,
     GetUTXOsRequest,
     GetUTXOsResponse,
+    IssueTxResponse,
     PaginationIndex,
 )
+from avalanchepy.types.avax.base_tx import BaseTx
+from avalanchepy.types.avax.credential import Credential
+from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
+from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.signed_tx import SignedTx
 from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.codecs import address_id_pool
 from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address, AddressCodec
+from avalanchepy.types.primitives.byte import Byte
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
 from tests.conftest import UTXO_1_STR
+from tests.transaction_builder.conftest import (
+    TEST_CONTEXT,
+    get_transferable_input,
+    get_transferable_output,
+)
 
 
 @pytest.fixture
@@ -61,11 +77,28 @@ def test_get_utxos_success(p_client, mock_provider, mock_utxos_response):
     assert isinstance(result[1], Utxo)
 
 
+def test_get_utxos_intern_pool(p_client, mock_provider, mock_utxos_response):
+    mock_provider.call_method.return_value = mock_utxos_response
+
+    intern_pool = address_id_pool()
+    result = p_client.get_utxos(GetUTXOsRequest(addresses=["test_address"]), intern_pool=intern_pool)
+
+    assert result[0].asset_id is result[1].asset_id
+    assert len(intern_pool) == 3
+
+
+def test_get_utxos_request_of_addresses():
+    addresses = [Address(value=bytes([i]) * ADDRESS_LEN) for i in range(3)]
+    address_codec = AddressCodec.of("P", "avax")
+
+    request = GetUTXOsRequest.of(addresses, address_codec, limit=10)
+    assert request.addresses == [address.to_string("P", "avax") for address in addresses]
+    assert request.limit == 10
+
+
 def test_get_utxos_deserialization_error(p_client, mock_provider, mock_utxos_response):
     mock_provider.call_method.return_value = mock_utxos_response
-    with patch(
-        "avalanchepy.types.avax.utxo.Utxo.deserialize", side_effect=DeserializationError("Deserialization failed")
-    ):
+    with patch("avalanchepy.clients.p_client.decode_utxos", side_effect=DeserializationError("Deserialization failed")):
         request = GetUTXOsRequest(addresses=["test_address"])
         with pytest.raises(FormatError):
             p_client.get_utxos(request)
@@ -97,3 +130,22 @@ def test_get_timestamp_json_provider_error(p_client, mock_provider):
     mock_provider.call_method.side_effect = JsonProviderError("Provider error")
     with pytest.raises(ClientError):
         p_client.get_timestamp()
+
+
+def test_issue_tx(p_client, mock_provider):
+    base_tx = BaseTx(
+        network_id=TEST_CONTEXT.network_id,
+        blockchain_id=TEST_CONTEXT.p_blockchain_id,
+        outputs=ListStruct[TransferableOutput](list=[get_transferable_output(Long(value=1))]),
+        inputs=ListStruct[TransferableInput](list=[get_transferable_input()]),
+        memo=ListStruct[Byte].empty(),
+    )
+    signed_tx = SignedTx(base_tx, ListStruct[Credential](list=[Credential.empty()]))
+    encoded = signed_tx.encoded()
+    mock_provider.call_method.return_value = IssueTxResponse(txID=encoded.tx_id.to_string())
+
+    assert p_client.issue_tx(signed_tx) == signed_tx.id().to_string()
+
+    (_, method, request) = mock_provider.call_method.call_args.args
+    assert method == "platform.issueTx"
+    assert request.tx == "0x" + (encoded.signed_bytes + encoded.checksum).hex()
@@ -1,7 +1,8 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from avalanchepy.transaction_builder import Context
+from avalanchepy.transaction_builder import Context, TransactionBuilder
+from avalanchepy.transaction_builder.types import SpendOptions
 from avalanchepy.types.avax.inputs.secp256k1_transfer_input import (
     Secp256k1TransferInput,
 )
@@ -114,3 +115,63 @@ def get_transferable_input(amount: Optional[Long] = None) -> TransferableInput:
             address_indices=ListStruct[Int](list=[Int(value=0)]),
         ),
     )
+
+
+MIN_ISSUANCE_TIME = 1000
+OTHER_ASSET_ID = Id(value=bytes(range(32)))
+OTHER_ADDRESS = Address(value=bytes(20))
+
+
+def make_utxo(
+    i: int,
+    amount: int,
+    asset_id: Id = TEST_AVAX_ASSET_ID,
+    stake_locktime: int = -1,
+    owners_locktime: int = 0,
+    threshold: int = 1,
+    addresses: List[Address] = [TEST_OWNER_X_ADDRESS],
+) -> Utxo:
+    output = Secp256k1TransferOutput(
+        amount=Long(value=amount),
+        output_owners=Secp256k1OutputOwners(
+            locktime=Long(value=owners_locktime),
+            threshold=Int(value=threshold),
+            addresses=ListStruct[Address](list=addresses),
+        ),
+    )
+    if stake_locktime >= 0:
+        output = StakeableLockOut(locktime=Long(value=stake_locktime), transferable_output=output)
+
+    return Utxo(
+        utxo_id=UtxoId(id=Id(value=i.to_bytes(32, byteorder="big")), output_idx=Int(value=0)),
+        asset_id=asset_id,
+        output=output,
+    )
+
+
+def utxo_set() -> List[Utxo]:
+    return [
+        make_utxo(0, 300, threshold=2),
+        make_utxo(1, 400, owners_locktime=MIN_ISSUANCE_TIME + 1),
+        make_utxo(2, 500, stake_locktime=MIN_ISSUANCE_TIME + 1),
+        make_utxo(3, 600, asset_id=OTHER_ASSET_ID),
+        make_utxo(4, 700, addresses=[OTHER_ADDRESS]),
+        make_utxo(5, 800, stake_locktime=MIN_ISSUANCE_TIME),
+        make_utxo(6, 900, stake_locktime=MIN_ISSUANCE_TIME + 5),
+        make_utxo(7, 1000),
+        make_utxo(8, 1100, addresses=[OTHER_ADDRESS, TEST_OWNER_X_ADDRESS], threshold=1),
+        make_utxo(9, 1200),
+        make_utxo(10, 1300, stake_locktime=MIN_ISSUANCE_TIME + 1),
+    ]
+
+
+def spend(utxos, amount_to_burn: int, amount_to_stake: int):
+    options = SpendOptions.default([TEST_OWNER_X_ADDRESS])
+    options.min_issuance_time = MIN_ISSUANCE_TIME
+    return TransactionBuilder.spend(
+        utxos=utxos,
+        from_addresses=[TEST_OWNER_X_ADDRESS],
+        amounts_to_burn={TEST_AVAX_ASSET_ID: amount_to_burn},
+        amounts_to_stake={TEST_AVAX_ASSET_ID: amount_to_stake},
+        options=options,
+    )
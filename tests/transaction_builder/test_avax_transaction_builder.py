@@ -1,26 +1,45 @@
+import pytest
+
 from avalanchepy.contants import PRIMARY_NETWORK_ID
-from avalanchepy.transaction_builder import TransactionBuilder
-from avalanchepy.transaction_builder.types import SpendOptions
+from avalanchepy.transaction_builder import Context, TransactionBuilder
+from avalanchepy.transaction_builder.coin_selection import LargestFirst
+from avalanchepy.transaction_builder.errors import (
+    InsufficientFundsError,
+    TxTooLargeError,
+)
+from avalanchepy.transaction_builder.types import DelegatorTxRequest, SpendOptions
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
 from avalanchepy.types.avax.add_permissionless_delegator_tx import (
     AddPermissionlessDelegatorTx,
 )
 from avalanchepy.types.avax.base_tx import BaseTx
+from avalanchepy.types.avax.credential import Credential
+from avalanchepy.types.avax.inputs.secp256k1_signature import (
+    SECP256K1_SIGNATURE_LEN,
+    Secp256k1Signature,
+)
 from avalanchepy.types.avax.inputs.transferable_input import TransferableInput
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.signed_tx import SignedTx
 from avalanchepy.types.avax.subnet_validator import SubnetValidator
+from avalanchepy.types.avax.utxoid import UtxoId
 from avalanchepy.types.avax.validator import Validator
+from avalanchepy.types.codecs import PVM_CODEC
 from avalanchepy.types.primitives.address import Address
 from avalanchepy.types.primitives.list_struct import ListStruct
 from avalanchepy.types.primitives.long import Long
 from avalanchepy.types.primitives.node_id import NodeId
 from avalanchepy.types.seder import Int
+from avalanchepy.types.utils import pack_codec_direct
 from tests.transaction_builder.conftest import (
+    TEST_AVAX_ASSET_ID,
     TEST_CONTEXT,
     TEST_OWNER_X_ADDRESS,
     get_transferable_input,
     get_transferable_output,
     get_utxo,
+    make_utxo,
 )
 
 TEST_NODE_ID_STR = "NodeID-2m38qc95mhHXtrhjyGbe7r2NhniqHHJRB"
@@ -73,3 +92,158 @@ def test_build_add_permissionless_delegator_tx():
     )
 
     assert actual_tx == expected
+
+
+def delegator_tx_request(amount: Long) -> DelegatorTxRequest:
+    subnet_validator = SubnetValidator(
+        validator=Validator(
+            node_id=NodeId.from_string(TEST_NODE_ID_STR),
+            start_time=Long(value=0),
+            end_time=Long(value=120),
+            weight=amount,
+        ),
+        subnet_id=PRIMARY_NETWORK_ID,
+    )
+    rewards_owner = Secp256k1OutputOwners(
+        locktime=Long(value=0), threshold=Int(value=1), addresses=ListStruct[Address].empty()
+    )
+
+    return DelegatorTxRequest(subnet_validator, rewards_owner)
+
+
+def build_delegator_tx(context: Context, amount: Long, utxo_amount: Long) -> AddPermissionlessDelegatorTx:
+    request = delegator_tx_request(amount)
+
+    return TransactionBuilder(context).build_add_permissionless_delegator_tx(
+        delegator=TEST_OWNER_X_ADDRESS,
+        utxos=[get_utxo(utxo_amount)],
+        subnet_validator=request.subnet_validator,
+        rewards_owner=request.rewards_owner,
+        options=SpendOptions.default([TEST_OWNER_X_ADDRESS]),
+    )
+
+
+def sign(tx: AddPermissionlessDelegatorTx) -> SignedTx:
+    signature = Secp256k1Signature(value=bytes(SECP256K1_SIGNATURE_LEN))
+    credentials = [
+        Credential(signatures=ListStruct[Secp256k1Signature](list=[signature] * len(input.input.address_indices)))
+        for input in tx.base_tx.inputs
+    ]
+    return SignedTx(tx, ListStruct[Credential](list=credentials))
+
+
+def signed_size(tx: AddPermissionlessDelegatorTx) -> int:
+    return len(pack_codec_direct(PVM_CODEC, sign(tx)))
+
+
+def test_build_add_permissionless_delegator_tx_size_fee():
+    fee_per_byte = 10
+    context = Context(
+        TEST_CONTEXT.avax_asset_id,
+        TEST_CONTEXT.network_id,
+        TEST_CONTEXT.p_blockchain_id,
+        tx_fee_per_byte=fee_per_byte,
+    )
+    amount = Long(value=1800000)
+    utxo_amount = Long(value=2 * (10**9))
+
+    tx = build_delegator_tx(context, amount, utxo_amount)
+
+    burned = utxo_amount.value - amount.value - tx.base_tx.outputs[0].output.amount.value
+    assert burned == context.add_primary_network_delegator_fee + fee_per_byte * signed_size(tx)
+
+
+def test_build_add_permissionless_delegator_tx_too_large():
+    amount = Long(value=1800000)
+    utxo_amount = Long(value=2 * (10**9))
+    size = signed_size(build_delegator_tx(TEST_CONTEXT, amount, utxo_amount))
+    context = Context(
+        TEST_CONTEXT.avax_asset_id,
+        TEST_CONTEXT.network_id,
+        TEST_CONTEXT.p_blockchain_id,
+        max_tx_size=size - 1,
+    )
+
+    with pytest.raises(TxTooLargeError) as error:
+        build_delegator_tx(context, amount, utxo_amount)
+
+    assert error.value.size == size
+
+
+def test_build_many_add_permissionless_delegator_txs():
+    fee = TEST_CONTEXT.add_primary_network_delegator_fee
+    amount = 300_000_000
+    utxos = [make_utxo(0, 10**9), make_utxo(1, 10**9)]
+    pool = UtxoPool(utxos)
+
+    batch = TransactionBuilder(TEST_CONTEXT).build_many_add_permissionless_delegator_txs(
+        delegator=TEST_OWNER_X_ADDRESS,
+        requests=[delegator_tx_request(Long(value=amount))] * 3,
+        utxos=pool,
+        options=SpendOptions.default([TEST_OWNER_X_ADDRESS]),
+        sign=sign,
+    )
+
+    assert len(batch.signed_txs) == 3
+    assert batch.consumed[0] == [utxos[0]]
+    assert batch.consumed[1] == [utxos[1]]
+    # the third delegation spends the change of the first one
+    assert batch.consumed[2] == batch.produced[0]
+    assert batch.produced[0][0].utxo_id == UtxoId(id=batch.signed_txs[0].id(), output_idx=Int(value=0))
+
+    inputs = [
+        input.utxo_id for signed_tx in batch.signed_txs for input in signed_tx.unsigned_transaction.base_tx.inputs
+    ]
+    assert len(set((utxo_id.id.value, utxo_id.output_idx.value) for utxo_id in inputs)) == 3
+
+    unspent = batch.unspent()
+    assert unspent == batch.produced[1] + batch.produced[2]
+    assert [utxo.output.amount.value for utxo in unspent] == [10**9 - amount - fee, 10**9 - 2 * (amount + fee)]
+    assert list(pool) == unspent
+
+
+def test_build_many_add_permissionless_delegator_txs_insufficient_funds():
+    utxos = [make_utxo(0, 10**9), make_utxo(1, 10**9)]
+    pool = UtxoPool(utxos)
+
+    with pytest.raises(InsufficientFundsError):
+        TransactionBuilder(TEST_CONTEXT).build_many_add_permissionless_delegator_txs(
+            delegator=TEST_OWNER_X_ADDRESS,
+            requests=[delegator_tx_request(Long(value=600_000_000))] * 4,
+            utxos=pool,
+            options=SpendOptions.default([TEST_OWNER_X_ADDRESS]),
+            sign=sign,
+        )
+
+    # the txs built before the failure are dropped, so are their effects on the pool
+    assert list(pool) == utxos
+    assert pool.select_unlocked({TEST_AVAX_ASSET_ID: 2 * 10**9}, {}, [TEST_OWNER_X_ADDRESS], 0) == utxos
+
+
+def test_build_add_permissionless_delegator_tx_coin_selection_indexes_once(monkeypatch):
+    context = Context(
+        TEST_CONTEXT.avax_asset_id, TEST_CONTEXT.network_id, TEST_CONTEXT.p_blockchain_id, tx_fee_per_byte=10
+    )
+    request = delegator_tx_request(Long(value=1_800_000))
+    options = SpendOptions.default([TEST_OWNER_X_ADDRESS])
+    options.coin_selection = LargestFirst()
+
+    pools = []
+    init = UtxoPool.__init__
+
+    def counting_init(pool, *args, **kwargs):
+        pools.append(pool)
+        init(pool, *args, **kwargs)
+
+    monkeypatch.setattr(UtxoPool, "__init__", counting_init)
+    tx = TransactionBuilder(context).build_add_permissionless_delegator_tx(
+        TEST_OWNER_X_ADDRESS,
+        [make_utxo(i, 10**9) for i in range(3)],
+        request.subnet_validator,
+        request.rewards_owner,
+        options,
+    )
+
+    # the size fee makes the spend run again, on the same pool
+    assert len(tx.base_tx.inputs) == 1
+    assert len(pools) == 1
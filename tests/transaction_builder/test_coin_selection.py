@@ -0,0 +1,103 @@
+import pytest
+
+from avalanchepy.transaction_builder import TransactionBuilder
+from avalanchepy.transaction_builder.coin_selection import (
+    BranchAndBound,
+    LargestFirst,
+    OldestFirst,
+    SmallestSufficient,
+    take_until_covered,
+)
+from avalanchepy.transaction_builder.errors import InsufficientFundsError
+from avalanchepy.transaction_builder.types import SpendOptions
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from tests.transaction_builder.conftest import (
+    MIN_ISSUANCE_TIME,
+    TEST_AVAX_ASSET_ID,
+    TEST_OWNER_X_ADDRESS,
+    make_utxo,
+    utxo_set,
+)
+
+AMOUNTS = [300, 1200, 500, 700, 500, 2000]
+
+
+def spend_with(coin_selection, utxos, amount_to_burn: int, amount_to_stake: int):
+    options = SpendOptions.default([TEST_OWNER_X_ADDRESS])
+    options.min_issuance_time = MIN_ISSUANCE_TIME
+    options.coin_selection = coin_selection
+    return TransactionBuilder.spend(
+        utxos=utxos,
+        from_addresses=[TEST_OWNER_X_ADDRESS],
+        amounts_to_burn={TEST_AVAX_ASSET_ID: amount_to_burn},
+        amounts_to_stake={TEST_AVAX_ASSET_ID: amount_to_stake},
+        options=options,
+    )
+
+
+def test_take_until_covered():
+    assert take_until_covered([2, 0, 1], AMOUNTS, 700) == [2, 0]
+    assert take_until_covered([2, 0, 1], AMOUNTS, 10_000) == [2, 0, 1]
+
+
+def test_largest_first():
+    assert LargestFirst().select([], AMOUNTS, 3000) == [5, 1]
+    assert LargestFirst().select([], AMOUNTS, 100) == [5]
+
+
+def test_smallest_sufficient():
+    assert SmallestSufficient().select([], AMOUNTS, 600) == [3]
+    assert SmallestSufficient().select([], AMOUNTS, 500) == [2]
+    # no single UTXO covers the target
+    assert SmallestSufficient().select([], AMOUNTS, 2500) == [5, 1]
+
+
+def test_branch_and_bound_exact_match():
+    bnb = BranchAndBound()
+    for target in (1000, 2700, 5200):
+        assert sum(AMOUNTS[i] for i in bnb.select([], AMOUNTS, target)) == target
+    assert bnb.exact_match(AMOUNTS, 5201) is None
+    # falls back to largest first
+    assert bnb.select([], AMOUNTS, 5201) == LargestFirst().select([], AMOUNTS, 5201)
+
+
+def test_branch_and_bound_max_tries():
+    # equal amounts are skipped once excluded
+    amounts = [2] * 30 + [1]
+    assert BranchAndBound(max_tries=5).exact_match(amounts, 1) == [30]
+
+    assert BranchAndBound(max_tries=5).exact_match([5, 3, 1], 4) == [1, 2]
+    assert BranchAndBound(max_tries=4).exact_match([5, 3, 1], 4) is None
+
+
+def test_oldest_first():
+    utxos = [make_utxo(i, amount) for (i, amount) in enumerate(AMOUNTS)]
+    ages = {utxo.utxo_id.id: age for (utxo, age) in zip(utxos, [5, 4, 3, 2, 1, 0])}
+
+    assert OldestFirst(lambda utxo: ages[utxo.utxo_id.id]).select(utxos, AMOUNTS, 2500) == [5, 4]
+
+
+@pytest.mark.parametrize(
+    "coin_selection,amount_to_burn,amount_to_stake,input_amounts,change_amounts",
+    [
+        (None, 3000, 2200, [500, 800, 900, 1000, 1100, 1200, 1300], [500, 1100]),
+        (LargestFirst(), 3000, 2200, [900, 1000, 1100, 1200, 1300], [300]),
+        (SmallestSufficient(), 3000, 2200, [900, 1000, 1100, 1200, 1300], [300]),
+        (BranchAndBound(), 3000, 2200, [800, 900, 1000, 1200, 1300], []),
+        (None, 1050, 0, [800, 1000], [750]),
+        (LargestFirst(), 1050, 0, [1200], [150]),
+        (SmallestSufficient(), 1050, 0, [1100], [50]),
+        (BranchAndBound(), 1050, 0, [1200], [150]),
+    ],
+)
+def test_spend_with_coin_selection(coin_selection, amount_to_burn, amount_to_stake, input_amounts, change_amounts):
+    result = spend_with(coin_selection, UtxoPool(utxo_set()), amount_to_burn, amount_to_stake)
+
+    assert sorted(input.input.amount.value for input in result.inputs) == input_amounts
+    assert sorted(output.amount().value for output in result.change_outputs) == change_amounts
+    assert sum(output.amount().value for output in result.stake_outputs) == amount_to_stake
+
+
+def test_spend_with_coin_selection_insufficient_funds():
+    with pytest.raises(InsufficientFundsError):
+        spend_with(LargestFirst(), utxo_set(), 10_000, 10_000)
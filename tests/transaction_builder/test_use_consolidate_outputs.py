@@ -1,14 +1,22 @@
+import random
+
+import pytest
+
 from avalanchepy.transaction_builder.use_consolidate_output import (
     can_combine,
     combine,
     consolidate,
+    consolidate_outputs,
 )
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
 from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
 from tests.transaction_builder.conftest import (
+    OTHER_ASSET_ID,
     TEST_AVAX_ASSET_ID,
     get_stakeable_locked_output,
     get_transferable_output,
@@ -48,3 +56,34 @@ def test_consolidate_different_outputs():
     assert isinstance(output2.output, StakeableLockOut)
     assert output2.amount() == Long(value=300)
     assert output2.asset_id == TEST_AVAX_ASSET_ID
+
+
+def random_output(rng: random.Random) -> TransferableOutput:
+    amount = Long(value=rng.randint(1, 1000))
+    kind = rng.randrange(3)
+    if kind == 0:
+        output = get_stakeable_locked_output(amount, Long(value=rng.randrange(2)))
+    else:
+        output = get_transferable_output(amount, locktime=Long(value=rng.randrange(2)), threshold=Int(value=kind))
+
+    if rng.randrange(2):
+        output.asset_id = OTHER_ASSET_ID
+    return output
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_consolidate_outputs_matches_consolidate(seed: int):
+    rng = random.Random(seed)
+    outputs = [random_output(rng) for _ in range(rng.randrange(30))]
+
+    assert consolidate_outputs(outputs) == consolidate(outputs, can_combine, combine)
+
+
+def test_consolidate_outputs_keeps_single_outputs():
+    x = get_transferable_output(Long(value=50))
+    y1 = get_stakeable_locked_output(Long(value=100), Long(value=0))
+    y2 = get_stakeable_locked_output(Long(value=200), Long(value=0))
+
+    result = consolidate_outputs([x, y1, y2])
+    assert result[0] is x
+    assert result[1].amount() == Long(value=300)
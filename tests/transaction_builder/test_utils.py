@@ -0,0 +1,40 @@
+from functools import cmp_to_key
+
+from avalanchepy.transaction_builder import compare_transferable_outputs
+from avalanchepy.transaction_builder.utils import sort_canonically
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
+from tests.transaction_builder.conftest import (
+    TEST_UTXO_ID_1,
+    TEST_UTXO_ID_2,
+    get_stakeable_locked_output,
+    get_transferable_input,
+    get_transferable_output,
+)
+
+
+def test_sort_canonically():
+    outputs = [
+        get_stakeable_locked_output(Long(value=5), Long(value=10)),
+        get_transferable_output(Long(value=7)),
+        get_stakeable_locked_output(Long(value=5), Long(value=1)),
+        get_transferable_output(Long(value=3)),
+    ]
+    expected_outputs = sorted(outputs, key=cmp_to_key(compare_transferable_outputs))
+
+    inputs = []
+    for utxo_id in [
+        UtxoId(id=TEST_UTXO_ID_2, output_idx=Int(value=0)),
+        UtxoId(id=TEST_UTXO_ID_1, output_idx=Int(value=300)),
+        UtxoId(id=TEST_UTXO_ID_1, output_idx=Int(value=2)),
+    ]:
+        inputs.append(get_transferable_input().model_copy(update={"utxo_id": utxo_id}))
+    expected_inputs = sorted(inputs, key=lambda tx_input: tx_input.utxo_id)
+
+    sort_canonically(inputs, outputs)
+
+    assert outputs == expected_outputs
+    assert [output.amount().value for output in outputs] == [3, 7, 5, 5]
+    assert inputs == expected_inputs
+    assert [tx_input.utxo_id.output_idx.value for tx_input in inputs] == [2, 300, 0]
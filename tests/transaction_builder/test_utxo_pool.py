@@ -0,0 +1,181 @@
+import random
+from typing import List
+
+import pytest
+
+from avalanchepy.transaction_builder.errors import InsufficientFundsError
+from avalanchepy.transaction_builder.utxo_pool import UtxoPool
+from avalanchepy.transaction_builder.utxo_table import (
+    OUTPUT_TYPE_STAKEABLE,
+    OUTPUT_TYPE_TRANSFER,
+)
+from avalanchepy.types.avax.lazy_utxo import LazyUtxo
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.codecs import PVM_CODEC
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
+from tests.transaction_builder.conftest import (
+    MIN_ISSUANCE_TIME,
+    OTHER_ADDRESS,
+    OTHER_ASSET_ID,
+    TEST_AVAX_ASSET_ID,
+    TEST_OWNER_X_ADDRESS,
+    make_utxo,
+    spend,
+    utxo_set,
+)
+
+SEED = 1
+RANDOM_SET_COUNT = 300
+
+
+def test_utxo_pool_groups():
+    utxos = utxo_set()
+    pool = UtxoPool(utxos, from_addresses=[TEST_OWNER_X_ADDRESS])
+
+    assert len(pool) == len(utxos)
+    assert list(pool) == utxos
+    assert pool.utxos[2] is utxos[2]
+    assert pool.amounts == [300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200, 1300]
+    assert pool.locktimes[2] == MIN_ISSUANCE_TIME + 1
+    assert list(pool.groups) == [TEST_AVAX_ASSET_ID, OTHER_ASSET_ID]
+
+    owner_set = (1, 0, (TEST_OWNER_X_ADDRESS,))
+    groups = pool.groups[TEST_AVAX_ASSET_ID]
+    assert groups[(OUTPUT_TYPE_TRANSFER, owner_set)] == [7, 9]
+    assert groups[(OUTPUT_TYPE_STAKEABLE, owner_set)] == [2, 5, 6, 10]
+
+    signers = pool.signers([TEST_OWNER_X_ADDRESS])
+    assert signers[owner_set] == [0]
+    assert signers[(2, 0, (TEST_OWNER_X_ADDRESS,))] is None
+    assert signers[(1, 0, (OTHER_ADDRESS,))] is None
+    assert signers[(1, 0, (OTHER_ADDRESS, TEST_OWNER_X_ADDRESS))] == [1]
+    assert pool.signers({TEST_OWNER_X_ADDRESS}) is signers
+
+
+def random_utxos(rng: random.Random, count: int) -> List[Utxo]:
+    """
+    Returns UTXOs drawn from the kinds the spend calculators tell apart: the assets, locked or unlocked stakes and
+    owners, the thresholds, the owner sets and plain owners outputs, which can't be spent.
+    """
+    utxos = []
+    for i in range(count):
+        utxo = make_utxo(
+            i,
+            rng.randint(1, 1000),
+            asset_id=rng.choice([TEST_AVAX_ASSET_ID, TEST_AVAX_ASSET_ID, OTHER_ASSET_ID]),
+            stake_locktime=rng.choice([-1, -1, MIN_ISSUANCE_TIME, MIN_ISSUANCE_TIME + 1]),
+            owners_locktime=rng.choice([0, 0, 0, MIN_ISSUANCE_TIME + 1]),
+            threshold=rng.choice([1, 1, 1, 2]),
+            addresses=rng.choice(
+                [[TEST_OWNER_X_ADDRESS], [TEST_OWNER_X_ADDRESS], [OTHER_ADDRESS], [OTHER_ADDRESS, TEST_OWNER_X_ADDRESS]]
+            ),
+        )
+        if rng.random() < 0.05:
+            utxo.output = utxo.get_output_owners()
+        utxos.append(utxo)
+
+    return utxos
+
+
+def spend_or_error(utxos, amount_to_burn: int, amount_to_stake: int):
+    try:
+        return spend(utxos, amount_to_burn, amount_to_stake)
+    except InsufficientFundsError as e:
+        return str(e)
+
+
+def test_utxo_pool_spend_matches_list_on_random_sets():
+    rng = random.Random(SEED)
+    for _ in range(RANDOM_SET_COUNT):
+        utxos = random_utxos(rng, rng.randint(0, 40))
+        amount_to_burn = rng.choice([0, rng.randint(1, 5000)])
+        amount_to_stake = rng.choice([0, rng.randint(1, 5000)])
+
+        expected = spend_or_error(utxos, amount_to_burn, amount_to_stake)
+        actual = spend_or_error(UtxoPool(utxos), amount_to_burn, amount_to_stake)
+
+        if isinstance(expected, str):
+            assert actual == expected
+            continue
+
+        assert actual.inputs == expected.inputs
+        assert actual.stake_outputs == expected.stake_outputs
+        assert actual.change_outputs == expected.change_outputs
+
+
+def test_utxo_pool_insufficient_funds():
+    with pytest.raises(InsufficientFundsError):
+        spend(UtxoPool(utxo_set()), 10_000, 10_000)
+
+
+def test_utxo_pool_lazy_utxos_stay_undecoded():
+    utxos = [LazyUtxo(utxo.serialize(PVM_CODEC), PVM_CODEC) for utxo in utxo_set()]
+    pool = UtxoPool(utxos, from_addresses=[TEST_OWNER_X_ADDRESS])
+
+    assert pool.amounts == UtxoPool(utxo_set()).amounts
+    assert not any(utxo.is_decoded() for utxo in utxos)
+
+    (first, second) = pool.select_unlocked({TEST_AVAX_ASSET_ID: 1500}, {}, [TEST_OWNER_X_ADDRESS], MIN_ISSUANCE_TIME)
+    assert first is utxos[5] and second is utxos[7]
+    (first, second) = pool.select_spendable_locked(
+        {TEST_AVAX_ASSET_ID: 1000}, [TEST_OWNER_X_ADDRESS], MIN_ISSUANCE_TIME
+    )
+    assert first is utxos[2] and second is utxos[6]
+    assert not any(utxo.is_decoded() for utxo in utxos)
+
+    # the spend decodes only the UTXOs it consumes
+    spend(pool, 1000, 0)
+    assert [i for (i, utxo) in enumerate(utxos) if utxo.is_decoded()] == [5, 7]
+
+
+def test_utxo_pool_add():
+    pool = UtxoPool([make_utxo(0, 100)], from_addresses=[OTHER_ADDRESS])
+    assert pool.select_unlocked({TEST_AVAX_ASSET_ID: 100}, {}, [OTHER_ADDRESS], MIN_ISSUANCE_TIME) == []
+
+    utxo = make_utxo(1, 200, addresses=[OTHER_ADDRESS])
+    pool.add([utxo])
+    assert len(pool) == 2
+    assert pool.select_unlocked({TEST_AVAX_ASSET_ID: 100}, {}, [OTHER_ADDRESS], MIN_ISSUANCE_TIME) == [utxo]
+
+
+def test_utxo_pool_remove():
+    utxos = utxo_set()
+    pool = UtxoPool(utxos)
+
+    assert pool.remove([utxos[9].utxo_id, make_utxo(42, 100).utxo_id, utxos[7].utxo_id]) == [utxos[9], utxos[7]]
+    assert pool.remove([utxos[7].utxo_id]) == []
+    assert len(pool) == len(utxos) - 2
+    assert list(pool) == [utxo for (i, utxo) in enumerate(utxos) if i not in (7, 9)]
+    assert pool.select_unlocked({TEST_AVAX_ASSET_ID: 1500}, {}, [TEST_OWNER_X_ADDRESS], MIN_ISSUANCE_TIME) == [
+        utxos[5],
+        utxos[8],
+    ]
+
+    utxo = make_utxo(11, 200)
+    pool.add([utxo])
+    assert pool.remove([utxo.utxo_id]) == [utxo]
+    assert len(pool) == len(utxos) - 2
+
+
+def test_utxo_pool_remove_owners_utxo():
+    transfer_utxo = make_utxo(0, 100)
+    owners = Secp256k1OutputOwners(
+        locktime=Long(value=0),
+        threshold=Int(value=1),
+        addresses=ListStruct[Address](list=[TEST_OWNER_X_ADDRESS]),
+    )
+    owners_utxo = Utxo(
+        utxo_id=UtxoId(id=Id(value=bytes(32)), output_idx=Int(value=1)), asset_id=TEST_AVAX_ASSET_ID, output=owners
+    )
+    pool = UtxoPool([transfer_utxo, owners_utxo])
+
+    assert pool.remove([owners_utxo.utxo_id]) == [owners_utxo]
+    assert list(pool) == [transfer_utxo]
+    assert pool.remove([transfer_utxo.utxo_id]) == [transfer_utxo]
+    assert len(pool) == 0
@@ -0,0 +1,70 @@
+from avalanchepy.transaction_builder.utxo_stream import UtxoStream, until_satisfied
+from avalanchepy.types.avax.lazy_utxo import iter_lazy_utxos
+from avalanchepy.types.codecs import DEFAULT_CODEC_VERSION, PVM_CODEC
+from tests.transaction_builder.conftest import make_utxo, spend, utxo_set
+
+WALLET_SIZE = 2000
+
+
+def counted(utxos, pulled):
+    for utxo in utxos:
+        pulled.append(utxo)
+        yield utxo
+
+
+def hex_wallet(size: int):
+    version = DEFAULT_CODEC_VERSION.serialize(PVM_CODEC)
+    return ["0x" + (version + make_utxo(i, 1000).serialize(PVM_CODEC)).hex() for i in range(size)]
+
+
+def test_utxo_stream_pulls_lazily_and_replays():
+    utxos = utxo_set()
+    pulled = []
+    stream = UtxoStream(counted(utxos, pulled))
+
+    assert next(iter(stream)) is utxos[0]
+    assert len(pulled) == 1
+
+    first_walk = iter(stream)
+    assert [next(first_walk) for _ in range(3)] == utxos[:3]
+    assert len(pulled) == 3
+    assert list(stream) == utxos
+    assert list(first_walk) == utxos[3:]
+    assert stream.pulled == pulled == utxos
+
+
+def test_until_satisfied_checks_before_pulling():
+    pulled = []
+    taken = []
+    for utxo in until_satisfied(counted(utxo_set(), pulled), lambda: len(taken) == 2):
+        taken.append(utxo)
+
+    assert len(pulled) == 2
+
+
+def test_spend_from_iterator_matches_list():
+    for amount_to_burn, amount_to_stake in [(100, 0), (1000, 1200), (0, 2700), (3000, 2800)]:
+        expected = spend(utxo_set(), amount_to_burn, amount_to_stake)
+        actual = spend(iter(utxo_set()), amount_to_burn, amount_to_stake)
+
+        assert actual.inputs == expected.inputs
+        assert actual.stake_outputs == expected.stake_outputs
+        assert actual.change_outputs == expected.change_outputs
+
+
+def test_spend_stops_once_covered():
+    pulled = []
+    result = spend(counted(iter_lazy_utxos(hex_wallet(WALLET_SIZE), PVM_CODEC), pulled), 1500, 0)
+
+    assert len(result.inputs) == 2
+    assert len(pulled) == 2
+
+
+def test_delegation_decodes_only_spent_utxos():
+    pulled = []
+    result = spend(counted(iter_lazy_utxos(hex_wallet(WALLET_SIZE), PVM_CODEC), pulled), 1000, 2500)
+
+    assert len(result.inputs) == 4
+    # the stake-locked UTXOs are spent first, without any the whole wallet is walked for them, by type id only
+    assert len(pulled) == WALLET_SIZE
+    assert sum(utxo.is_decoded() for utxo in pulled) == 4
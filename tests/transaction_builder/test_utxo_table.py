@@ -0,0 +1,94 @@
+import pytest
+
+from avalanchepy.transaction_builder.errors import InsufficientFundsError
+from avalanchepy.transaction_builder.utxo_table import (
+    OUTPUT_TYPE_STAKEABLE,
+    OUTPUT_TYPE_TRANSFER,
+    UtxoTable,
+)
+from avalanchepy.types.avax.lazy_utxo import LazyUtxo
+from avalanchepy.types.codecs import PVM_CODEC
+from tests.transaction_builder.conftest import (
+    MIN_ISSUANCE_TIME,
+    OTHER_ADDRESS,
+    OTHER_ASSET_ID,
+    TEST_AVAX_ASSET_ID,
+    TEST_OWNER_X_ADDRESS,
+    make_utxo,
+    spend,
+    utxo_set,
+)
+
+pytest.importorskip("numpy")
+
+
+def test_utxo_table_columns():
+    utxos = utxo_set()
+    table = UtxoTable(utxos)
+
+    assert len(table) == len(utxos)
+    assert list(table) == utxos
+    assert table[2] is utxos[2]
+    assert table.assets == [TEST_AVAX_ASSET_ID, OTHER_ASSET_ID]
+    assert table.owner_sets == [(TEST_OWNER_X_ADDRESS,), (OTHER_ADDRESS,), (OTHER_ADDRESS, TEST_OWNER_X_ADDRESS)]
+    assert table.amount.tolist() == [300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200, 1300]
+    assert table.output_type[:3].tolist() == [OUTPUT_TYPE_TRANSFER, OUTPUT_TYPE_TRANSFER, OUTPUT_TYPE_STAKEABLE]
+    assert table.locktime[2] == MIN_ISSUANCE_TIME + 1
+    assert table.owners_locktime[1] == MIN_ISSUANCE_TIME + 1
+    assert table.asset[3] == 1
+    assert table.threshold[0] == 2
+    assert table.signable([TEST_OWNER_X_ADDRESS], MIN_ISSUANCE_TIME).tolist() == [
+        False,
+        False,
+        True,
+        True,
+        False,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+    ]
+
+
+@pytest.mark.parametrize(
+    "amount_to_burn,amount_to_stake",
+    [(0, 0), (100, 0), (100, 500), (1000, 1200), (0, 2700), (2000, 2000), (4100, 0), (3000, 2800)],
+)
+def test_utxo_table_spend_matches_list(amount_to_burn: int, amount_to_stake: int):
+    utxos = utxo_set()
+
+    expected = spend(utxos, amount_to_burn, amount_to_stake)
+    actual = spend(UtxoTable(utxos), amount_to_burn, amount_to_stake)
+
+    assert actual.inputs == expected.inputs
+    assert actual.stake_outputs == expected.stake_outputs
+    assert actual.change_outputs == expected.change_outputs
+
+
+def test_utxo_table_insufficient_funds():
+    with pytest.raises(InsufficientFundsError):
+        spend(UtxoTable(utxo_set()), 10_000, 10_000)
+
+
+def test_utxo_table_lazy_utxos_stay_undecoded():
+    utxos = [LazyUtxo(utxo.serialize(PVM_CODEC), PVM_CODEC) for utxo in utxo_set()]
+    table = UtxoTable(utxos)
+    expected = UtxoTable(utxo_set())
+
+    assert not any(utxo.is_decoded() for utxo in utxos)
+    assert table.amount.tolist() == expected.amount.tolist()
+    assert table.output_type.tolist() == expected.output_type.tolist()
+    assert table.owner_sets == expected.owner_sets
+
+    (first, second) = table.select_unlocked({TEST_AVAX_ASSET_ID: 1500}, {}, [TEST_OWNER_X_ADDRESS], MIN_ISSUANCE_TIME)
+    assert first is utxos[5] and second is utxos[7]
+    assert not any(utxo.is_decoded() for utxo in utxos)
+
+
+def test_utxo_table_amounts_overflowing_uint64():
+    amount = 2**63 + 1
+    utxos = [make_utxo(i, amount) for i in range(3)]
+
+    assert UtxoTable(utxos).select_unlocked({TEST_AVAX_ASSET_ID: 2**64}, {}, [TEST_OWNER_X_ADDRESS], 0) == utxos[:2]
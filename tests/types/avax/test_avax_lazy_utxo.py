@@ -0,0 +1,125 @@
+import pytest
+
+from avalanchepy.transaction_builder import TransactionBuilder
+from avalanchepy.transaction_builder.types import SpendOptions
+from avalanchepy.types.avax.lazy_utxo import LazyUtxo
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxo_index import UtxoIndex
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.codecs import PVM_CODEC
+from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
+from avalanchepy.types.signable import Signable
+from tests.conftest import UTXO_1_STR
+from tests.transaction_builder.conftest import (
+    MIN_ISSUANCE_TIME,
+    OTHER_ADDRESS,
+    TEST_AVAX_ASSET_ID,
+    TEST_OWNER_X_ADDRESS,
+    get_utxo,
+    make_utxo,
+)
+
+UTXO_1_BYTES = bytes.fromhex(UTXO_1_STR[2:])[2:]
+
+
+def test_lazy_utxo_decodes_output_on_access():
+    lazy_utxo = LazyUtxo(UTXO_1_BYTES, PVM_CODEC)
+    (utxo, _) = Utxo.deserialize(UTXO_1_BYTES, PVM_CODEC)
+
+    assert lazy_utxo.utxo_id == utxo.utxo_id
+    assert lazy_utxo.asset_id == utxo.asset_id
+    assert lazy_utxo.output_type() is Secp256k1TransferOutput
+    assert not lazy_utxo.is_decoded()
+
+    assert lazy_utxo.output == utxo.output
+    assert lazy_utxo.is_decoded()
+    assert lazy_utxo == utxo
+    assert lazy_utxo.to_utxo() == utxo
+    assert lazy_utxo.serialize(PVM_CODEC) == utxo.serialize(PVM_CODEC)
+
+
+def test_lazy_utxo_invalid_output_type():
+    data = bytearray(UTXO_1_BYTES)
+    # replaces the output type id with the one of a transferable input
+    data[68:72] = (5).to_bytes(4, byteorder="big")
+
+    with pytest.raises(DeserializationError):
+        LazyUtxo(bytes(data), PVM_CODEC)
+
+
+def test_lazy_utxo_output_fields_without_decoding():
+    stakeable_utxo = make_utxo(
+        1, 500, stake_locktime=MIN_ISSUANCE_TIME, addresses=[OTHER_ADDRESS, TEST_OWNER_X_ADDRESS]
+    )
+    owners_utxo = make_utxo(2, 0)
+    owners_utxo.output = owners_utxo.output.output_owners
+
+    for utxo in [make_utxo(0, 300, owners_locktime=MIN_ISSUANCE_TIME, threshold=2), stakeable_utxo, owners_utxo]:
+        lazy_utxo = LazyUtxo(utxo.serialize(PVM_CODEC), PVM_CODEC)
+
+        assert lazy_utxo.output_fields() == utxo.output_fields()
+        assert not lazy_utxo.is_decoded()
+
+    assert stakeable_utxo.output_fields() == (MIN_ISSUANCE_TIME, 500, 0, 1, (OTHER_ADDRESS, TEST_OWNER_X_ADDRESS))
+    assert owners_utxo.output_fields() == (None, None, 0, 1, (TEST_OWNER_X_ADDRESS,))
+
+
+def test_lazy_utxo_output_fields_invalid():
+    data = bytearray(make_utxo(0, 500, stake_locktime=MIN_ISSUANCE_TIME).serialize(PVM_CODEC))
+    # replaces the nested output type id with the one of a stakeable output
+    data[80:84] = (22).to_bytes(4, byteorder="big")
+
+    with pytest.raises(DeserializationError):
+        LazyUtxo(bytes(data), PVM_CODEC).output_fields()
+
+    with pytest.raises(DeserializationError):
+        LazyUtxo(UTXO_1_BYTES[:-10], PVM_CODEC).output_fields()
+
+
+def test_lazy_utxo_spend_skips_other_assets():
+    utxo = get_utxo(Long(value=1_000_000))
+    lazy_utxo = LazyUtxo(utxo.serialize(PVM_CODEC), PVM_CODEC)
+    other_asset_utxo = get_utxo(Long(value=1_000_000), asset_id=utxo.utxo_id.id)
+    other_lazy_utxo = LazyUtxo(other_asset_utxo.serialize(PVM_CODEC), PVM_CODEC)
+
+    result = TransactionBuilder.spend(
+        utxos=[other_lazy_utxo, lazy_utxo],
+        amounts_to_burn={TEST_AVAX_ASSET_ID: 1000},
+        amounts_to_stake={},
+        from_addresses=[TEST_OWNER_X_ADDRESS],
+        options=SpendOptions.default([TEST_OWNER_X_ADDRESS]),
+    )
+
+    assert len(result.inputs) == 1
+    assert not other_lazy_utxo.is_decoded()
+    assert Signable.extract_signers([lazy_utxo], result.inputs) == [[TEST_OWNER_X_ADDRESS]]
+
+
+def test_utxo_index_reused_across_extractions():
+    lazy_utxo = LazyUtxo(get_utxo(Long(value=1_000_000)).serialize(PVM_CODEC), PVM_CODEC)
+    other_utxo = get_utxo(Long(value=2_000_000))
+    other_utxo.utxo_id = UtxoId(id=other_utxo.utxo_id.id, output_idx=Int(value=1))
+    index = UtxoIndex([lazy_utxo, other_utxo])
+    assert len(index) == 2
+    assert index[lazy_utxo.utxo_id.input_id()] is lazy_utxo
+
+    result = TransactionBuilder.spend(
+        utxos=[lazy_utxo],
+        amounts_to_burn={TEST_AVAX_ASSET_ID: 1000},
+        amounts_to_stake={},
+        from_addresses=[TEST_OWNER_X_ADDRESS],
+        options=SpendOptions.default([TEST_OWNER_X_ADDRESS]),
+    )
+    for _ in range(2):
+        assert Signable.extract_signers(index, result.inputs) == [[TEST_OWNER_X_ADDRESS]]
+
+    index.discard([lazy_utxo])
+    assert lazy_utxo.utxo_id.input_id() not in index
+    assert list(index) == [other_utxo]
+    with pytest.raises(KeyError):
+        Signable.extract_signers(index, result.inputs)
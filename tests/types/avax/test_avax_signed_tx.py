@@ -1,3 +1,6 @@
+import hashlib
+
+from avalanchepy.types.avax.encoded_tx import EncodedUnsignedTx
 from avalanchepy.types.avax.signed_tx import SignedTx
 from avalanchepy.types.codecs import PVM_CODEC
 from avalanchepy.types.utils import pack_codec_direct, unpack_codec_direct
@@ -83,4 +86,31 @@ def test_base_tx():
     tx, leftover = unpack_codec_direct(SignedTx, PVM_CODEC, data)
 
     assert len(leftover) == 0
+    # computed from the fields before anything is encoded
+    assert tx.serialized_size(PVM_CODEC) == len(data) - len(codec_id_data)
+    assert tx.unsigned_transaction.serialized_size(PVM_CODEC) == len(add_permissionless_delegator_tx_data) - 4
+    assert tx.credentials.pack_list_size(PVM_CODEC) == len(credentials_data)
     assert pack_codec_direct(PVM_CODEC, tx) == data
+    assert tx.serialized_size(PVM_CODEC) == len(data) - len(codec_id_data)
+    # encoded once and shared by id() and later serialization
+    assert tx.serialize(PVM_CODEC) is tx.serialize(PVM_CODEC)
+    assert tx.id() == tx.id()
+
+    encoded = tx.encoded(PVM_CODEC)
+    digest = hashlib.sha256(data).digest()
+    assert encoded is tx.encoded(PVM_CODEC)
+    assert encoded.unsigned_bytes == codec_id_data + add_permissionless_delegator_tx_data
+    assert encoded.signing_hash == hashlib.sha256(codec_id_data + add_permissionless_delegator_tx_data).digest()
+    assert encoded.signed_bytes == data
+    assert encoded.tx_id == tx.id()
+    assert encoded.tx_id.value == digest
+    assert encoded.checksum == digest[-4:]
+    assert encoded.hex == "0x" + (data + digest[-4:]).hex()
+
+    # credentials signed over an encoded unsigned tx complete it without encoding the tx again
+    encoded_unsigned = EncodedUnsignedTx.encode(tx.unsigned_transaction, PVM_CODEC)
+    assert encoded_unsigned.signing_hash == encoded.signing_hash
+    signed_tx = SignedTx(tx.unsigned_transaction, tx.credentials, encoded_unsigned)
+    assert signed_tx.encoded(PVM_CODEC).unsigned_bytes is encoded_unsigned.unsigned_bytes
+    assert signed_tx.encoded(PVM_CODEC).signed_bytes == data
+    assert pack_codec_direct(PVM_CODEC, signed_tx) == data
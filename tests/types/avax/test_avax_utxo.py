@@ -1,6 +1,16 @@
-from avalanchepy.types.avax.utxo import Utxo
+import hashlib
+
+import pytest
+
+from avalanchepy.types.avax.lazy_utxo import decode_lazy_utxos
+from avalanchepy.types.avax.utxo import Utxo, decode_utxo, decode_utxos
+from avalanchepy.types.avax.utxoid import input_ids
 from avalanchepy.types.codecs import PVM_CODEC
+from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.seder import Int
 from avalanchepy.types.utils import pack_codec_direct, unpack_codec_direct
+from tests.conftest import UTXO_1_STR, UTXO_2_STR
 
 
 def test_utxo_1():
@@ -166,3 +176,75 @@ def test_utxo_2():
     (utxo, leftover) = Utxo.deserialize(data, PVM_CODEC)
     assert len(leftover) == 0
     assert utxo.serialize(PVM_CODEC) == data
+
+
+def test_utxo_trusted():
+    utxo_hex = "0x00004cc3cf2e380c03f0227193a6573d1940350a43f028123ca68c14f54e33a11dcf000000093d9bdac0ed1d761330cf680efdeb1a42159eb387d6d2950c96f7d28f61bbe2aa000000160000000063af7b800000000700000002540be40000000000000000000000000100000001e0cfe8cae22827d032805ded484e393ce51cbedb7f24bb9c"  # noqa: E501
+    utxo_bytes = bytes.fromhex(utxo_hex[2:])
+    trusted_codec = PVM_CODEC.as_trusted()
+
+    (expected, _) = unpack_codec_direct(Utxo, PVM_CODEC, utxo_bytes)
+    (actual, leftover) = unpack_codec_direct(Utxo, trusted_codec, utxo_bytes)
+
+    assert trusted_codec.trusted
+    assert len(leftover) == 4
+    assert actual == expected
+    assert pack_codec_direct(PVM_CODEC, actual) == utxo_bytes[:-4]
+
+
+def test_decode_utxos():
+    hex_strings = [UTXO_1_STR, UTXO_2_STR, UTXO_1_STR]
+    expected = [unpack_codec_direct(Utxo, PVM_CODEC, bytes.fromhex(el[2:]))[0] for el in hex_strings]
+
+    assert decode_utxos(hex_strings, PVM_CODEC) == expected
+    assert [utxo.serialized_size(PVM_CODEC) for utxo in decode_lazy_utxos(hex_strings, PVM_CODEC)] == [
+        len(utxo.serialize(PVM_CODEC)) for utxo in expected
+    ]
+    assert decode_lazy_utxos(hex_strings, PVM_CODEC) == expected
+    assert decode_utxo(UTXO_2_STR, PVM_CODEC) == expected[1]
+    assert decode_utxos([], PVM_CODEC) == []
+
+
+def test_decode_utxos_invalid():
+    with pytest.raises(DeserializationError):
+        decode_utxos([UTXO_1_STR, "0x0001" + UTXO_2_STR[6:]], PVM_CODEC)
+
+    with pytest.raises(DeserializationError):
+        decode_utxos([UTXO_1_STR, UTXO_2_STR[:-1]], PVM_CODEC)
+
+    # truncated record can't be completed from the following one
+    with pytest.raises(DeserializationError):
+        decode_utxos([UTXO_1_STR[:100], UTXO_2_STR], PVM_CODEC)
+
+    # the prefix isn't dropped blindly, the first byte would be lost
+    with pytest.raises(DeserializationError):
+        decode_utxos([UTXO_1_STR[2:]], PVM_CODEC)
+
+
+def test_utxo_input_id_cached():
+    utxo = decode_utxo(UTXO_1_STR, PVM_CODEC)
+    utxo_id = utxo.utxo_id
+    expected = hashlib.sha256(utxo_id.output_idx.value.to_bytes(4, byteorder="big") + utxo_id.id.value).digest()
+
+    input_id = utxo_id.input_id()
+    assert input_id == Id(value=expected)
+    assert utxo_id.input_id() is input_id
+    assert set(utxo_id.model_dump()) == {"id", "output_idx"}
+
+    # a reassigned field invalidates the cached id
+    utxo_id.output_idx = Int(value=utxo_id.output_idx.value + 1)
+    assert utxo_id.input_id() != input_id
+
+
+def test_input_ids():
+    utxos = decode_utxos([UTXO_1_STR, UTXO_2_STR], PVM_CODEC)
+    utxo_ids = [utxo.utxo_id for utxo in utxos]
+    expected = [
+        Id(value=hashlib.sha256(utxo_id.output_idx.value.to_bytes(4, byteorder="big") + utxo_id.id.value).digest())
+        for utxo_id in utxo_ids
+    ]
+
+    result = input_ids(utxo_ids)
+    assert result == expected
+    assert [utxo_id.input_id() for utxo_id in utxo_ids] == result
+    assert all(a is b for (a, b) in zip(input_ids(utxo_ids), result))
@@ -0,0 +1,90 @@
+import pytest
+
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.utxo import Utxo
+from avalanchepy.types.avax.utxo_snapshot import UtxoSnapshot, write_utxo_snapshot
+from avalanchepy.types.avax.utxoid import UtxoId
+from avalanchepy.types.errors import DeserializationError
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
+
+ASSET_1 = Id(value=bytes([1]) * ID_LEN)
+ASSET_2 = Id(value=bytes([2]) * ID_LEN)
+ADDRESS_1 = Address(value=bytes([1]) * ADDRESS_LEN)
+ADDRESS_2 = Address(value=bytes([2]) * ADDRESS_LEN)
+
+
+def make_utxo(i: int, asset_id: Id, addresses: list, locktime: int = 0) -> Utxo:
+    output = Secp256k1TransferOutput(
+        amount=Long(value=1000 + i),
+        output_owners=Secp256k1OutputOwners(
+            locktime=Long(value=0), threshold=Int(value=1), addresses=ListStruct[Address](list=addresses)
+        ),
+    )
+    if locktime > 0:
+        output = StakeableLockOut(locktime=Long(value=locktime), transferable_output=output)
+
+    return Utxo(
+        utxo_id=UtxoId(id=Id(value=i.to_bytes(ID_LEN, byteorder="big")), output_idx=Int(value=0)),
+        asset_id=asset_id,
+        output=output,
+    )
+
+
+UTXOS = [
+    make_utxo(0, ASSET_1, [ADDRESS_1]),
+    make_utxo(1, ASSET_2, [ADDRESS_1, ADDRESS_2], locktime=300),
+    make_utxo(2, ASSET_1, [ADDRESS_2], locktime=100),
+    make_utxo(3, ASSET_1, [ADDRESS_2, ADDRESS_2]),
+]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / "utxos.snapshot"
+    with open(path, "wb") as file:
+        write_utxo_snapshot(file, UTXOS)
+
+    return path
+
+
+def test_utxo_snapshot_records(snapshot_path):
+    with UtxoSnapshot(snapshot_path) as snapshot:
+        assert len(snapshot) == len(UTXOS)
+        assert list(snapshot) == UTXOS
+        assert snapshot[2] == UTXOS[2]
+
+        lazy_utxo = snapshot.get_lazy(1)
+        assert lazy_utxo == UTXOS[1]
+        del lazy_utxo
+
+        with pytest.raises(IndexError):
+            snapshot.get(len(UTXOS))
+
+
+def test_utxo_snapshot_indexes(snapshot_path):
+    with UtxoSnapshot(snapshot_path) as snapshot:
+        assert snapshot.by_asset(ASSET_1) == [0, 2, 3]
+        assert snapshot.by_asset(Id(value=bytes(ID_LEN))) == []
+        assert snapshot.by_owner(ADDRESS_1) == [0, 1]
+        assert snapshot.by_owner(ADDRESS_2) == [1, 2, 3]
+
+        assert sorted(snapshot.by_locktime(max_locktime=0)) == [0, 3]
+        assert snapshot.by_locktime(min_locktime=1) == [2, 1]
+        assert snapshot.by_locktime(100, 299) == [2]
+        assert snapshot.select(snapshot.by_owner(ADDRESS_1)) == UTXOS[:2]
+
+
+def test_utxo_snapshot_invalid(tmp_path):
+    path = tmp_path / "invalid.snapshot"
+    path.write_bytes(bytes(64))
+
+    with pytest.raises(DeserializationError):
+        UtxoSnapshot(path)
@@ -1,10 +1,20 @@
+import pytest
+
 from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
 from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
     Secp256k1TransferOutput,
 )
 from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
-from avalanchepy.types.avax.outputs.transferable_output import TransferableOutput
+from avalanchepy.types.avax.outputs.transferable_output import (
+    FrozenTransferableOutput,
+    TransferableOutput,
+)
 from avalanchepy.types.codecs import AVM_CODEC, PVM_CODEC
+from avalanchepy.types.primitives.address import ADDRESS_LEN, Address
+from avalanchepy.types.primitives.id import ID_LEN, Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import Int
 
 
 def test_secp256k1_output_owners():
@@ -430,3 +440,30 @@ def test_transferable_output_2():
 
     assert len(leftover) == 0
     assert transferable_output.serialize(PVM_CODEC) == data
+
+
+def test_frozen_transferable_output(mocker):
+    output = Secp256k1TransferOutput(
+        amount=Long(value=100),
+        output_owners=Secp256k1OutputOwners(
+            locktime=Long(value=0),
+            threshold=Int(value=1),
+            addresses=ListStruct[Address](list=[Address(value=bytes(ADDRESS_LEN))]),
+        ),
+    )
+    mutable = TransferableOutput(asset_id=Id(value=bytes(ID_LEN)), output=output)
+    frozen = FrozenTransferableOutput(asset_id=Id(value=bytes(ID_LEN)), output=output)
+
+    assert frozen == mutable
+    assert mutable == frozen
+    assert hash(frozen) == hash(FrozenTransferableOutput(asset_id=mutable.asset_id, output=output))
+
+    encode = mocker.spy(TransferableOutput, "serialize_into")
+    assert frozen.serialize(PVM_CODEC) == mutable.serialize(PVM_CODEC)
+    assert frozen.serialize(PVM_CODEC) == mutable.serialize(PVM_CODEC)
+    assert frozen.serialize(AVM_CODEC) == mutable.serialize(AVM_CODEC)
+    # once per codec for the frozen output, every time for the mutable one
+    assert encode.call_count == 2 + 3
+
+    with pytest.raises(AttributeError):
+        frozen.asset_id = Id(value=bytes(ID_LEN))
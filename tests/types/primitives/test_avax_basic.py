@@ -1,10 +1,19 @@
 import pytest
-
-from avalanchepy.types.errors import DeserializationError
-from avalanchepy.types.primitives.address import Address
+from pydantic import BaseModel
+
+from avalanchepy.types.errors import DeserializationError, SerializationError
+from avalanchepy.types.primitives import address as address_module
+from avalanchepy.types.primitives.address import (
+    ADDRESS_CODEC_COUNT,
+    Address,
+    AddressCodec,
+)
+from avalanchepy.types.primitives.byte import Byte
 from avalanchepy.types.primitives.id import ID_LEN, Id
 from avalanchepy.types.primitives.long import Long
-from avalanchepy.types.seder import Codec, Int
+from avalanchepy.types.primitives.node_id import NodeId
+from avalanchepy.types.primitives.short import Short
+from avalanchepy.types.seder import Codec, Int, Reader, Writer
 
 codec = Codec([None, None])
 
@@ -35,6 +44,52 @@ def test_int_insufficient():
         (actual, leftover) = Int.deserialize(int_bytes, codec)
 
 
+def test_int_small_cache():
+    assert Int(value=1) is Int(value=1)
+    assert Int.deserialize(bytes([0, 0, 0, 1]), codec)[0] is Int(value=1)
+    assert Int(value=1000) == Int(value=1000)
+
+
+def test_primitives_immutable():
+    value = Int(value=1)
+    with pytest.raises(AttributeError):
+        value.value = 2
+
+    assert value.value == 1
+    assert hash(Long(value=1)) == hash(Long(value=1))
+
+
+def test_primitives_out_of_range():
+    with pytest.raises(ValueError):
+        Int(value=2**32)
+
+    with pytest.raises(ValueError):
+        Byte(value=-1)
+
+    with pytest.raises(ValueError):
+        Long(value=1) - Long(value=2)
+
+
+def test_primitives_json():
+    class Model(BaseModel):
+        int_value: Int
+        long_value: Long
+        short_value: Short
+        byte_value: Byte
+
+    model = Model(
+        int_value=Int(value=1), long_value=Long(value=2), short_value=Short(value=3), byte_value=Byte(value=4)
+    )
+    assert model.model_dump() == {"int_value": 1, "long_value": "2", "short_value": {"value": 3}, "byte_value": "0x04"}
+    assert (
+        Model(int_value={"value": 1}, long_value=Long(value=2), short_value={"value": 3}, byte_value=Byte(value=4))
+        == model
+    )
+
+    with pytest.raises(ValueError):
+        Model(int_value=1, long_value=Long(value=2), short_value=Short(value=3), byte_value=Byte(value=4))
+
+
 def test_long():
     long_value = Long(value=257)
     long_bytes = bytes([0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x01])
@@ -66,6 +121,66 @@ def test_address():
     assert address_bytes == address_value.serialize(codec)
 
 
+def test_address_string():
+    address = Address(value=bytes(range(20)))
+    address_str = "P-fuji1qqqsyqcyq5rqwzqfpg9scrgwpugpzysn6xcvym"
+
+    assert address.to_string("P", "fuji") == address_str
+    assert address.to_json() == address_str
+    assert Address.from_string(address_str) == address
+    assert Address.from_string("P-" + address_str[2:].upper()) == address
+    assert address.model_dump() == address_str
+    assert address.model_dump(context={"address_codec": AddressCodec("X", "avax")}) == address.to_string("X", "avax")
+
+
+def test_address_codec_many():
+    address_codec = AddressCodec("X", "avax", cache_size=2)
+    addresses = [Address(value=bytes([i]) * 20) for i in range(4)]
+
+    strings = address_codec.encode_many(addresses)
+    assert strings == [address.to_string("X", "avax") for address in addresses]
+    assert address_codec.decode_many(strings) == addresses
+    assert address_codec.decode_many(strings) == addresses
+
+
+@pytest.mark.parametrize(
+    "address_str, message",
+    [
+        ("X-avax1qqqsyqcyq5rqwzqfpg9scrgwpugpzysnk5ungy-1", "Invalid address format"),
+        ("P-avax1qqqsyqcyq5rqwzqfpg9scrgwpugpzysnk5ungy", "Invalid chain id"),
+        ("X-fuji1qqqsyqcyq5rqwzqfpg9scrgwpugpzysn6xcvym", "Invalid hrp"),
+        ("X-avax1qqqsyqcyq5rqwzqfpg9scrgwpugpzysnk5ungq", "Failed to decode with bech32"),
+        ("X-avax1Qqqsyqcyq5rqwzqfpg9scrgwpugpzysnk5ungy", "Failed to decode with bech32"),
+        ("X-avax1qqqsyqcyq5rqwzqfpg9scrg", "Failed to decode with bech32"),
+    ],
+)
+def test_address_codec_invalid(address_str, message):
+    with pytest.raises(DeserializationError, match=message):
+        AddressCodec("X", "avax").decode(address_str)
+
+
+def test_address_codec_registry_is_bounded():
+    address = Address(value=bytes(range(20)))
+    codec_count = len(address_module._ADDRESS_CODECS)
+
+    for i in range(200):
+        with pytest.raises(DeserializationError):
+            Address.from_string(f"C{i}-hrp{i}1qqqq")
+    assert len(address_module._ADDRESS_CODECS) == codec_count
+
+    for i in range(2 * ADDRESS_CODEC_COUNT):
+        assert Address.from_string(address.to_string(f"C{i}", "avax")) == address
+    assert len(address_module._ADDRESS_CODECS) == ADDRESS_CODEC_COUNT
+    assert AddressCodec.of(f"C{2 * ADDRESS_CODEC_COUNT - 1}", "avax") is AddressCodec.of(
+        f"C{2 * ADDRESS_CODEC_COUNT - 1}", "avax"
+    )
+
+
+def test_address_codec_invalid_length():
+    with pytest.raises(SerializationError):
+        AddressCodec("X", "avax").encode(Address.model_construct(value=bytes(19)))
+
+
 def test_address_insufficient():
     address_bytes = bytes(range(18))
     with pytest.raises(DeserializationError, match="DeserializationError: Invalid data size. expected 20, actual: 18"):
@@ -83,7 +198,57 @@ def test_id():
     assert id_bytes == actual.serialize(codec)
 
 
+def test_id_strings():
+    ids = [Id(value=bytes([i]) * ID_LEN) for i in range(3)]
+    strings = Id.to_strings(ids)
+
+    assert strings == [id.to_string() for id in ids]
+    assert Id.from_strings(strings, verify=True) == ids
+    assert [Id.from_string(string, verify=True) for string in strings] == ids
+
+
+def test_node_id_strings():
+    node_ids = [NodeId(value=bytes([i]) * 20) for i in range(3)]
+    strings = NodeId.to_strings(node_ids)
+
+    assert strings == [node_id.to_json() for node_id in node_ids]
+    assert NodeId.from_strings(strings, verify=True) == node_ids
+    with pytest.raises(ValueError, match="Invalid checksum"):
+        NodeId.from_string(strings[0][:-1] + "1", verify=True)
+
+
 def test_id_insufficient():
     id_bytes = bytes(range(ID_LEN - 2))
     with pytest.raises(DeserializationError, match="DeserializationError: Invalid data size. expected 32, actual: 30"):
         (_, _) = Id.deserialize(id_bytes, codec)
+
+
+def test_reader_sequential():
+    id_bytes = bytes(range(ID_LEN))
+    data = bytes([0x00, 0x00, 0x00, 0x0D]) + id_bytes + bytes([0x02, 0xFF])
+
+    reader = Reader(data)
+    assert Int.read(reader, codec) == Int(value=13)
+    assert Id.read(reader, codec) == Id(value=id_bytes)
+    assert reader.offset == 4 + ID_LEN
+    assert reader.remaining() == 2
+    assert reader.rest() == bytes([0x02, 0xFF])
+
+
+def test_reader_insufficient():
+    reader = Reader(bytes([0x00, 0x00, 0x00, 0x0D, 0x01]))
+    Int.read(reader, codec)
+    with pytest.raises(DeserializationError, match="DeserializationError: Invalid data size. expected 8, actual: 1"):
+        Long.read(reader, codec)
+
+
+def test_writer_shared():
+    id_value = Id(value=bytes(range(ID_LEN)))
+    int_value = Int(value=13)
+
+    writer = Writer()
+    int_value.serialize_into(writer, codec)
+    id_value.serialize_into(writer, codec)
+
+    assert len(writer) == 4 + ID_LEN
+    assert writer.getvalue() == int_value.serialize(codec) + id_value.serialize(codec)
@@ -1,4 +1,7 @@
+import pytest
+
 from avalanchepy.types.primitives.utils import (
+    Base58Check,
     decode_bech32_to_bytes,
     encode_bech32_to_str,
 )
@@ -10,6 +13,9 @@ TEST_BECH32_DECODED_DATA = bytes(
 
 TEST_BECH32_ENCODED_STR = "fuji10cnrkp784sxpdye4kcqefm98465lgswx74khcr"
 
+TEST_BASE58_DECODED_DATA = bytes(range(32))
+TEST_BASE58_ENCODED_STR = "16qJFWMMHFy3xDdLmvUeyc2S6FrWRhJP51HsvDYdz9cWcm5W"
+
 
 def test_decode_bech32():
     hrp, res = decode_bech32_to_bytes(TEST_BECH32_ENCODED_STR)
@@ -21,3 +27,28 @@ def test_decode_bech32():
 def test_encode_bech32():
     encoded = encode_bech32_to_str(TEST_HRP, TEST_BECH32_DECODED_DATA)
     assert encoded == TEST_BECH32_ENCODED_STR
+
+
+def test_base58check():
+    assert Base58Check.encode(TEST_BASE58_DECODED_DATA) == TEST_BASE58_ENCODED_STR
+    assert Base58Check.decode(TEST_BASE58_ENCODED_STR, verify=True) == TEST_BASE58_DECODED_DATA
+
+
+def test_base58check_invalid_checksum():
+    invalid = TEST_BASE58_ENCODED_STR[:-1] + "1"
+
+    assert Base58Check.decode(invalid)
+    with pytest.raises(ValueError, match="Invalid checksum"):
+        Base58Check.decode(invalid, verify=True)
+
+
+def test_base58check_many():
+    values = [bytes([i]) * 32 for i in range(4)]
+    strings = Base58Check.encode_many(values)
+
+    assert strings == [Base58Check.encode(value) for value in values]
+    assert Base58Check.decode_many(strings, verify=True) == values
+
+    invalid = [strings[0], strings[1][:-1] + "1", strings[2], strings[3][:-1] + "1"]
+    with pytest.raises(ValueError, match=f"2 of 4 strings: {invalid[1]}, {invalid[3]}"):
+        Base58Check.decode_many(invalid, verify=True)
@@ -0,0 +1,156 @@
+import io
+
+import pytest
+
+from avalanchepy.types import seder
+from avalanchepy.types.avax.outputs.secp256k1_output_owners import Secp256k1OutputOwners
+from avalanchepy.types.avax.outputs.secp256k1_transfer_output import (
+    Secp256k1TransferOutput,
+)
+from avalanchepy.types.avax.outputs.stakeable_lock_out import StakeableLockOut
+from avalanchepy.types.avax.utxo import decode_utxos
+from avalanchepy.types.codecs import AVM_CODEC, PVM_CODEC, address_id_pool
+from avalanchepy.types.errors import DeserializationError, SerializationError
+from avalanchepy.types.primitives.address import Address
+from avalanchepy.types.primitives.id import Id
+from avalanchepy.types.primitives.list_struct import ListStruct
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.seder import (
+    FROZEN_SLOTS,
+    PYDANTIC_MODEL_SLOTS,
+    PYDANTIC_SLOTS_MATCH,
+    Codec,
+    Frozen,
+    Int,
+    InternPool,
+    Seder,
+    construct_trusted,
+)
+from avalanchepy.types.utils import (
+    iter_codec,
+    iter_codec_direct,
+    pack_codec,
+    pack_codec_direct,
+)
+from tests.conftest import UTXO_1_STR, UTXO_2_STR
+
+OUTPUT = Secp256k1TransferOutput(
+    amount=Long(value=5),
+    output_owners=Secp256k1OutputOwners(
+        locktime=Long(value=0), threshold=Int(value=1), addresses=ListStruct[Address](list=[])
+    ),
+)
+
+
+class FrozenSecp256k1TransferOutput(Frozen, Secp256k1TransferOutput):
+    __slots__ = FROZEN_SLOTS
+
+
+def test_codec_prefixes():
+    assert PVM_CODEC.type_id_of(OUTPUT) == 7
+    assert PVM_CODEC.prefix_of(OUTPUT) == bytes([0, 0, 0, 7])
+    assert PVM_CODEC.class_to_prefix[StakeableLockOut] == bytes([0, 0, 0, 22])
+
+    (decoded, leftover) = AVM_CODEC.unpack_prefix(AVM_CODEC.pack_prefix(OUTPUT))
+    assert len(leftover) == 0
+    assert decoded == OUTPUT
+
+
+def test_codec_prefix_of_subclass():
+    frozen = FrozenSecp256k1TransferOutput(amount=OUTPUT.amount, output_owners=OUTPUT.output_owners)
+
+    assert PVM_CODEC.pack_prefix(frozen) == PVM_CODEC.pack_prefix(OUTPUT)
+    assert PVM_CODEC.class_to_type_id[FrozenSecp256k1TransferOutput] == 7
+
+
+def test_codec_prefix_of_unknown_type():
+    with pytest.raises(SerializationError):
+        AVM_CODEC.prefix_of(StakeableLockOut(locktime=Long(value=1), transferable_output=OUTPUT))
+
+
+def test_iter_read_utxos():
+    utxos = decode_utxos(100 * [UTXO_1_STR, UTXO_2_STR], PVM_CODEC)
+    stream = io.BytesIO(b"".join(pack_codec_direct(PVM_CODEC, utxo) for utxo in utxos))
+
+    # chunks much smaller than a record
+    assert list(iter_codec_direct(type(utxos[0]), PVM_CODEC, stream, chunk_size=7)) == utxos
+
+
+def test_iter_read_prefixed():
+    outputs = [OUTPUT, StakeableLockOut(locktime=Long(value=1), transferable_output=OUTPUT)]
+    stream = io.BytesIO(b"".join(pack_codec(PVM_CODEC, output) for output in outputs))
+
+    assert list(iter_codec(Seder, PVM_CODEC, stream)) == outputs
+    assert list(iter_codec_direct(Secp256k1TransferOutput, PVM_CODEC, io.BytesIO(b""))) == []
+
+
+def test_iter_read_truncated():
+    data = pack_codec_direct(PVM_CODEC, OUTPUT)
+    records = iter_codec_direct(Secp256k1TransferOutput, PVM_CODEC, io.BytesIO(data + data[:-1]), chunk_size=8)
+
+    assert next(records) == OUTPUT
+    with pytest.raises(DeserializationError, match="Stream ends within a record"):
+        next(records)
+
+
+def test_iter_read_max_record_size():
+    data = PVM_CODEC.pack_prefix(OUTPUT)
+    records = PVM_CODEC.iter_read(io.BytesIO(data), Codec.read, chunk_size=4, max_record_size=16)
+
+    with pytest.raises(DeserializationError, match="Record exceeds 16 bytes"):
+        next(records)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_intern_pool_shares_values(trusted):
+    intern_pool = address_id_pool()
+    codec = PVM_CODEC.with_intern_pool(intern_pool)
+    codec = codec.as_trusted() if trusted else codec
+
+    (first, second) = decode_utxos([UTXO_1_STR, UTXO_1_STR], codec)
+    assert first == second
+    assert first is not second
+    assert first.asset_id is second.asset_id
+    assert first.utxo_id.id is second.utxo_id.id
+    assert first.output.output_owners.addresses[0] is second.output.output_owners.addresses[0]
+    # the tx id, the asset id and the owner
+    assert len(intern_pool) == 3
+    assert first == decode_utxos([UTXO_1_STR], PVM_CODEC)[0]
+
+    intern_pool.clear()
+    assert len(intern_pool) == 0
+
+
+def test_intern_pool_max_size():
+    intern_pool = InternPool([Id], max_size=1)
+    codec = PVM_CODEC.with_intern_pool(intern_pool)
+
+    (first, second) = decode_utxos([UTXO_1_STR, UTXO_1_STR], codec)
+    assert len(intern_pool) == 1
+    assert first.utxo_id.id is second.utxo_id.id
+    assert first.asset_id == second.asset_id
+    assert first.asset_id is not second.asset_id
+
+
+def test_intern_pool_invalid_type():
+    with pytest.raises(ValueError, match="single value field"):
+        InternPool([Secp256k1TransferOutput])
+
+
+@pytest.mark.skipif(not PYDANTIC_SLOTS_MATCH, reason="construct_trusted falls back to model_construct")
+def test_construct_trusted_matches_model_construct():
+    fields = {"amount": Long(value=5), "output_owners": OUTPUT.output_owners}
+    trusted = construct_trusted(Secp256k1TransferOutput, fields)
+    constructed = Secp256k1TransferOutput.model_construct(**fields)
+
+    for slot in PYDANTIC_MODEL_SLOTS:
+        assert getattr(trusted, slot) == getattr(constructed, slot)
+    assert trusted == constructed == OUTPUT
+    assert trusted.model_dump() == OUTPUT.model_dump()
+    assert trusted.model_copy(update={"amount": Long(value=6)}).amount == Long(value=6)
+
+
+def test_construct_trusted_falls_back_to_model_construct(monkeypatch):
+    monkeypatch.setattr(seder, "PYDANTIC_SLOTS_MATCH", False)
+
+    assert construct_trusted(Id, {"value": bytes(32)}) == Id(value=bytes(32))
@@ -0,0 +1,62 @@
+import pytest
+
+from avalanchepy.types.avax.validator import Validator
+from avalanchepy.types.errors import DeserializationError, SerializationError
+from avalanchepy.types.layout import U32, U64, Layout, fixed_bytes, pack_array, unpack_array
+from avalanchepy.types.primitives.long import Long
+from avalanchepy.types.primitives.node_id import NodeId
+from avalanchepy.types.seder import Codec, Reader, Writer
+
+codec = Codec([None, None])
+
+
+def test_layout_round_trip():
+    layout = Layout(("id", fixed_bytes(4)), ("index", U32), ("amount", U64))
+    assert layout.size == 16
+
+    writer = Writer()
+    layout.pack_into(writer, bytes([1, 2, 3, 4]), 13, 257)
+    data = writer.getvalue()
+    assert data == bytes([1, 2, 3, 4, 0, 0, 0, 13, 0, 0, 0, 0, 0, 0, 1, 1])
+
+    reader = Reader(data + bytes([0xFF]))
+    assert layout.unpack(reader) == (bytes([1, 2, 3, 4]), 13, 257)
+    assert reader.rest() == bytes([0xFF])
+
+
+@pytest.mark.parametrize("value", [bytes(3), bytes(5)])
+def test_layout_fixed_bytes_length(value: bytes):
+    layout = Layout(("index", U32), ("id", fixed_bytes(4)))
+
+    with pytest.raises(SerializationError, match="Invalid id size. expected 4"):
+        layout.pack_into(Writer(), 1, value)
+
+
+def test_layout_insufficient():
+    layout = Layout(("index", U32), ("amount", U64))
+    with pytest.raises(DeserializationError, match="DeserializationError: Invalid data size. expected 12, actual: 10"):
+        layout.unpack(Reader(bytes(10)))
+
+
+def test_array_round_trip():
+    writer = Writer()
+    pack_array(writer, U32, [3, 2, 1])
+
+    reader = Reader(writer.getvalue())
+    assert unpack_array(reader, U32, 3) == (3, 2, 1)
+    assert reader.remaining() == 0
+
+
+def test_validator_layout():
+    validator = Validator(
+        node_id=NodeId(value=bytes(range(20))),
+        start_time=Long(value=1),
+        end_time=Long(value=2),
+        weight=Long(value=3),
+    )
+    data = validator.serialize(codec)
+    assert len(data) == Validator._layout.size
+
+    (actual, leftover) = Validator.deserialize(data, codec)
+    assert len(leftover) == 0
+    assert actual == validator